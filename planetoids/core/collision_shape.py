@@ -0,0 +1,150 @@
+"""Precomputed polygon data for exact collision tests"""
+
+import math
+from typing import Sequence, Tuple
+
+Point = Tuple[float, float]
+
+class CollisionShape:
+    """Collision data for a polygon given as offsets from its centre.
+
+    Everything that only depends on the outline (edges, outward normals and
+    the bounding/inner radii) is computed once, so a shape can be shared by
+    every asteroid using the same outline. Queries take coordinates relative
+    to the shape's centre.
+    """
+
+    __slots__ = ("vertices", "edges", "normals", "bounding_radius", "inner_radius")
+
+    def __init__(self, offsets: Sequence[Point]) -> None:
+        self.vertices = tuple((float(x), float(y)) for x, y in offsets)
+        count = len(self.vertices)
+
+        # Signed area tells us the winding so the normals can point outwards
+        area = sum(
+            self.vertices[i][0] * self.vertices[(i + 1) % count][1]
+            - self.vertices[(i + 1) % count][0] * self.vertices[i][1]
+            for i in range(count)
+        )
+        winding = 1 if area >= 0 else -1
+
+        edges = []
+        normals = []
+        for i in range(count):
+            ax, ay = self.vertices[i]
+            bx, by = self.vertices[(i + 1) % count]
+            ex, ey = bx - ax, by - ay
+            length_sq = ex * ex + ey * ey or 1e-9
+            length = math.sqrt(length_sq)
+            edges.append((ax, ay, ex, ey, 1 / length_sq))
+            normals.append((winding * ey / length, -winding * ex / length))
+        self.edges = tuple(edges)
+        self.normals = tuple(normals)
+
+        self.bounding_radius = max(math.hypot(x, y) for x, y in self.vertices)
+        # Largest circle around the centre that stays inside the outline
+        self.inner_radius = math.sqrt(min(_segment_distance_sq(0, 0, edge) for edge in self.edges))
+
+    def contains_point(self, px: float, py: float) -> bool:
+        """Returns True if the point lies inside the polygon (even-odd rule)."""
+        inside = False
+        for ax, ay, ex, ey, _ in self.edges:
+            by = ay + ey
+            if (ay > py) != (by > py):
+                if px < ax + (py - ay) * ex / ey:
+                    inside = not inside
+        return inside
+
+    def intersects_circle(self, cx: float, cy: float, radius: float) -> bool:
+        """Returns True if a circle centred at (cx, cy) overlaps the polygon."""
+        distance_sq = cx * cx + cy * cy
+        reach = self.bounding_radius + radius
+        if distance_sq > reach * reach:
+            return False
+        inner = self.inner_radius + radius
+        if distance_sq <= inner * inner:
+            return True
+        if self.contains_point(cx, cy):
+            return True
+        radius_sq = radius * radius
+        return any(_segment_distance_sq(cx, cy, edge) <= radius_sq for edge in self.edges)
+
+    #pylint: disable=too-many-arguments
+    def intersects_capsule(
+            self, x0: float, y0: float, x1: float, y1: float, radius: float
+        ) -> bool:
+        """Returns True if a circle swept from (x0, y0) to (x1, y1) touches the polygon."""
+        sweep = (x0, y0, x1 - x0, y1 - y0, 1 / ((x1 - x0) ** 2 + (y1 - y0) ** 2 or 1e-9))
+        closest_sq = _segment_distance_sq(0, 0, sweep)
+        reach = self.bounding_radius + radius
+        if closest_sq > reach * reach:
+            return False
+        inner = self.inner_radius + radius
+        if closest_sq <= inner * inner:
+            return True
+        if self.contains_point(x0, y0):
+            return True
+        radius_sq = radius * radius
+        return any(_edge_distance_sq(sweep, edge) <= radius_sq for edge in self.edges)
+
+    def intersects_polygon(self, points: Sequence[Point]) -> bool:
+        """Returns True if another polygon, in this shape's local space, overlaps this one."""
+        if any(self.contains_point(x, y) for x, y in points):
+            return True
+        if any(_polygon_contains(points, x, y) for x, y in self.vertices):
+            return True
+
+        count = len(points)
+        for i in range(count):
+            px, py = points[i]
+            qx, qy = points[(i + 1) % count]
+            for ax, ay, ex, ey, _ in self.edges:
+                if _segments_intersect(px, py, qx, qy, ax, ay, ax + ex, ay + ey):
+                    return True
+        return False
+
+def _segment_distance_sq(px: float, py: float, edge: tuple) -> float:
+    """Squared distance from a point to a precomputed edge."""
+    ax, ay, ex, ey, inv_length_sq = edge
+    t = ((px - ax) * ex + (py - ay) * ey) * inv_length_sq
+    t = 0.0 if t < 0 else 1.0 if t > 1 else t
+    dx = ax + ex * t - px
+    dy = ay + ey * t - py
+    return dx * dx + dy * dy
+
+def _edge_distance_sq(first: tuple, second: tuple) -> float:
+    """Squared distance between two precomputed edges (zero if they cross)."""
+    ax, ay, ex, ey, _ = first
+    cx, cy, fx, fy, _ = second
+    if _segments_intersect(ax, ay, ax + ex, ay + ey, cx, cy, cx + fx, cy + fy):
+        return 0.0
+    return min(
+        _segment_distance_sq(ax, ay, second),
+        _segment_distance_sq(ax + ex, ay + ey, second),
+        _segment_distance_sq(cx, cy, first),
+        _segment_distance_sq(cx + fx, cy + fy, first),
+    )
+
+def _polygon_contains(points: Sequence[Point], px: float, py: float) -> bool:
+    """Even-odd point in polygon test for an arbitrary point list."""
+    inside = False
+    count = len(points)
+    for i in range(count):
+        ax, ay = points[i]
+        bx, by = points[(i + 1) % count]
+        if (ay > py) != (by > py):
+            if px < ax + (py - ay) * (bx - ax) / (by - ay):
+                inside = not inside
+    return inside
+
+#pylint: disable=too-many-arguments
+def _segments_intersect(ax, ay, bx, by, cx, cy, dx, dy) -> bool:
+    """Returns True if segment AB crosses segment CD."""
+    def _orientation(px, py, qx, qy, rx, ry):
+        return (qx - px) * (ry - py) - (qy - py) * (rx - px)
+
+    d1 = _orientation(cx, cy, dx, dy, ax, ay)
+    d2 = _orientation(cx, cy, dx, dy, bx, by)
+    d3 = _orientation(ax, ay, bx, by, cx, cy)
+    d4 = _orientation(ax, ay, bx, by, dx, dy)
+    return (d1 > 0) != (d2 > 0) and (d3 > 0) != (d4 > 0)
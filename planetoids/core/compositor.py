@@ -0,0 +1,150 @@
+"""Layered frame composition with cached surfaces for slow-changing layers"""
+
+from typing import Callable, Dict, Hashable, List, Optional
+
+import pygame
+
+from planetoids.core.config import config
+from planetoids.core.logger import logger
+
+# Draw callbacks return the rects they touched, or None if they can't say
+DrawFn = Callable[[pygame.Surface], Optional[List[pygame.Rect]]]
+
+class Layer:
+    """One named layer of the frame.
+
+    Retained layers draw into their own surface and only redraw when the
+    value returned by key() changes or they are invalidated; every other
+    frame they cost a single blit. Immediate layers change every frame
+    anyway, so they draw straight into the frame instead of paying for a
+    clear and a full-screen blit of a surface of their own.
+
+    Draw callbacks return the rects they drew into so the compositor can
+    report which parts of the frame changed.
+    """
+
+    def __init__(
+            self, name: str, draw: DrawFn, key: Callable[[], Hashable] = None,
+            retained: bool = False, opaque: bool = False,
+            visible: Callable[[], bool] = None
+        ) -> None:
+        self.name = name
+        self.draw = draw
+        self.key = key
+        self.retained = retained
+        self.opaque = opaque
+        self.visible = visible
+        self.surface: Optional[pygame.Surface] = None
+        self.dirty = True
+        self.redraws = 0
+        self.rects: Optional[List[pygame.Rect]] = []
+        self.previous_rects: Optional[List[pygame.Rect]] = []
+        self.shown = False
+        self._last_key = None
+
+    def invalidate(self) -> None:
+        """Forces the layer to redraw before it is next composed."""
+        self.dirty = True
+
+    def refresh(self, size) -> bool:
+        """Redraws the cached surface if the layer's inputs have changed.
+
+        Returns True if it was redrawn.
+        """
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = self._make_surface(size)
+            self.dirty = True
+
+        if self.key is not None:
+            key = self.key()
+            if key != self._last_key:
+                self._last_key = key
+                self.dirty = True
+
+        if not self.dirty:
+            return False
+        self.surface.fill(config.BLACK)
+        self.previous_rects = self.rects
+        self.rects = self.draw(self.surface)
+        self.dirty = False
+        self.redraws += 1
+        return True
+
+    def blit_to(self, screen: pygame.Surface) -> None:
+        """Blits the cached surface, copying only the areas the layer drew when it knows them."""
+        if self.rects is None:
+            screen.blit(self.surface, (0, 0))
+            return
+        for rect in self.rects:
+            screen.blit(self.surface, rect, rect)
+
+    def _make_surface(self, size) -> pygame.Surface:
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        if not self.opaque:
+            # Black is see-through, which suits a game drawn on black
+            surface.set_colorkey(config.BLACK)
+        return surface
+
+class Compositor:
+    """Builds each frame from the background, world, effects, HUD and overlay layers."""
+
+    LAYER_ORDER = ("background", "world", "effects", "hud", "overlay")
+
+    def __init__(self) -> None:
+        self.layers: Dict[str, Layer] = {}
+
+    def set_layer(self, name: str, draw: DrawFn, **options) -> Layer:
+        """Installs the drawing callback for one of the named layers."""
+        if name not in self.LAYER_ORDER:
+            raise ValueError(f"Unknown layer {name!r}, expected one of {self.LAYER_ORDER}")
+        layer = self.layers[name] = Layer(name, draw, **options)
+        logger.info(f"Compositor layer {name} set (retained={layer.retained})")
+        return layer
+
+    def invalidate(self, name: str = None) -> None:
+        """Forces one layer, or every layer, to redraw."""
+        for layer in ([self.layers[name]] if name else self.layers.values()):
+            layer.invalidate()
+
+    def compose(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Draws every visible layer onto the screen in order.
+
+        Returns the rects that may differ from the previous frame, or None
+        if a layer couldn't say what it touched. Immediate layers only
+        report where they drew this frame; the caller has to remember
+        those to erase them next frame.
+        """
+        size = screen.get_size()
+        changed = []
+        for name in self.LAYER_ORDER:
+            layer = self.layers.get(name)
+            if layer is None:
+                continue
+            if layer.visible is not None and not layer.visible():
+                if layer.shown:
+                    changed = _extend(changed, layer.rects)
+                    layer.shown = False
+                continue
+
+            if layer.retained:
+                redrawn = layer.refresh(size)
+                layer.blit_to(screen)
+                if redrawn:
+                    changed = _extend(changed, layer.previous_rects)
+                    changed = _extend(changed, layer.rects)
+                elif not layer.shown:
+                    changed = _extend(changed, layer.rects)
+            else:
+                layer.rects = layer.draw(screen)
+                changed = _extend(changed, layer.rects)
+            layer.shown = True
+        return changed
+
+def _extend(changed: Optional[List[pygame.Rect]], rects: Optional[List[pygame.Rect]]):
+    """Adds rects to the changed list; None on either side means the whole frame."""
+    if changed is None or rects is None:
+        return None
+    changed.extend(rects)
+    return changed
@@ -28,18 +28,25 @@ class Config:
     DIM_GRAY = (105, 105, 105)  # Dark gray, slightly faded
     GREEN = (34, 139, 34)  # Darker, "hacker" style green
 
-    VERSION = get_local_version()
+    # The game renders at its base resolution; probe_display() records the desktop size
+    WIDTH = BASE_WIDTH
+    HEIGHT = BASE_HEIGHT
+    SCREEN_WIDTH = BASE_WIDTH
+    SCREEN_HEIGHT = BASE_HEIGHT
 
     def __init__(self) -> None:
-        """Initialize screen dimensions and scaled properties."""
-        self._initialize_screen_size()
-
-    def _initialize_screen_size(self) -> None:
-        """Ensure Pygame is initialized before fetching display info."""
-        if not pygame.get_init():
-            pygame.init()
-            pygame.display.set_mode((1, 1))  # Minimal window to enable display info
-
+        """Initialize without touching the display; nothing is probed until a window is made."""
+        self._version = None
+
+    @property
+    def VERSION(self) -> str:
+        """Version number, read from version.txt the first time it is needed."""
+        if self._version is None:
+            self._version = get_local_version()
+        return self._version
+
+    def probe_display(self) -> None:
+        """Reads the desktop size. Needs pygame.init() to have been called."""
         info = pygame.display.Info()
         self.SCREEN_WIDTH = info.current_w
         self.SCREEN_HEIGHT = info.current_h
@@ -49,7 +56,7 @@ class Config:
 
     def update_screen_size(self) -> None:
         """Allows dynamic screen resizing and updates dependent properties."""
-        self._initialize_screen_size()
+        self.probe_display()
 
 # Global instance
 config = Config()
@@ -0,0 +1,32 @@
+"""Game fonts, loaded once per size and shared by everything that draws text"""
+
+from typing import Dict
+
+import pygame
+
+from planetoids.core.logger import logger
+from planetoids.core.settings import get_font_path
+
+# Every character the game renders, used to warm a font's glyph cache
+GLYPHS = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    " .,:;!?%+-x>_!@#$%^&*()=<>/\\|{}[]"
+)
+
+_fonts: Dict[int, pygame.font.Font] = {}
+
+def get_font(size: int) -> pygame.font.Font:
+    """Returns the game font at a size, loading it the first time it is asked for."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(get_font_path(), size)
+    return font
+
+def warm_font(size: int) -> None:
+    """Loads a font and renders every glyph once so the first real render is cheap."""
+    get_font(size).render(GLYPHS, True, (255, 255, 255))
+
+def clear_fonts() -> None:
+    """Drops every loaded font, e.g. before pygame.font is shut down."""
+    logger.info(f"Clearing {len(_fonts)} fonts")
+    _fonts.clear()
@@ -0,0 +1,92 @@
+"""Frame-rate policy for gameplay, idle menus and background windows"""
+
+import pygame
+
+from planetoids.core.config import config
+from planetoids.core.logger import logger
+
+# Events that mean a player is at the controls
+_INPUT_EVENTS = {
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION,
+}
+_FOCUS_LOST_EVENTS = {pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED}
+_FOCUS_GAINED_EVENTS = {pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED}
+
+class FramePacer:
+    """Picks the tick rate for each frame and ticks the clock with it.
+
+    Screens run at the full rate while something is moving or the player
+    has pressed a key recently. Once nobody has touched the controls for a
+    while, screens that don't need every frame drop to the idle rate, and
+    a window that has lost focus or been minimised barely ticks at all.
+    Any input brings the full rate straight back.
+    """
+
+    IDLE_FPS = 15
+    BACKGROUND_FPS = 2
+    IDLE_AFTER_MS = 3000
+
+    def __init__(
+            self, clock: pygame.time.Clock, active_fps: int = config.FPS,
+            idle_fps: int = IDLE_FPS, background_fps: int = BACKGROUND_FPS,
+            idle_after_ms: int = IDLE_AFTER_MS
+        ) -> None:
+        self.clock = clock
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.background_fps = background_fps
+        self.idle_after_ms = idle_after_ms
+        self.focused = True
+        self._since_input_ms = 0
+
+    @property
+    def idle(self) -> bool:
+        """True once no input has arrived for idle_after_ms."""
+        return self._since_input_ms >= self.idle_after_ms
+
+    def fps(self, busy: bool = False) -> int:
+        """Returns the tick rate for the next frame."""
+        if not self.focused:
+            return self.background_fps
+        if busy or not self.idle:
+            return self.active_fps
+        return self.idle_fps
+
+    def wake(self) -> None:
+        """Goes back to the full rate, e.g. when a screen opens."""
+        self._since_input_ms = 0
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Tracks input and window focus.
+
+        Returns True if the event changed whether the window has focus.
+        """
+        if event.type in _INPUT_EVENTS:
+            self.wake()
+            return False
+
+        if event.type in _FOCUS_LOST_EVENTS:
+            focused = False
+        elif event.type in _FOCUS_GAINED_EVENTS:
+            focused = True
+        elif event.type == pygame.ACTIVEEVENT and event.state & (pygame.APPINPUTFOCUS | pygame.APPACTIVE):
+            focused = bool(event.gain)
+        else:
+            return False
+
+        if focused == self.focused:
+            return False
+        self.focused = focused
+        self.wake()
+        logger.info(f"Window {'focused' if focused else 'lost focus'}")
+        return True
+
+    def tick(self, busy: bool = False) -> int:
+        """Waits out the frame at the current rate and returns the elapsed milliseconds."""
+        elapsed = self.clock.tick(self.fps(busy))
+        self._since_input_ms += elapsed
+        return elapsed
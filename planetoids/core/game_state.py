@@ -1,7 +1,8 @@
 """Contains the central game state manager"""
 
+import math
 import random
-from typing import List
+from typing import List, Optional, Set, Tuple
 
 import pygame
 
@@ -12,19 +13,47 @@ from planetoids.entities.powerups import (
     PowerUp, TemporalSlowdownPowerUp, RicochetShotPowerUp,
     InvincibilityPowerUp, TrishotPowerUp, QuadShotPowerUp
 )
+from planetoids.entities.asteroid_pool import AsteroidPool
+from planetoids.entities.asteroid_sprites import AsteroidSpriteCache
 from planetoids.entities.bullet import Bullet
 from planetoids.entities.player import Player
 from planetoids.ui.pause_menu import PauseMenu
 from planetoids.core.score import Score
 from planetoids.core.level import Level
 from planetoids.core.life import Life
+from planetoids.core.compositor import Compositor
 from planetoids.core.config import config
+from planetoids.core.fonts import get_font
+from planetoids.core.frame_pacer import FramePacer
+from planetoids.core.leaderboard import Leaderboard, Run
 from planetoids.core.logger import logger
+from planetoids.core.presenter import DirtyRectPresenter
 from planetoids.core.settings import Settings
+from planetoids.core.spatial_index import SpatialIndex, wrapped_delta
+from planetoids.core.sweep_and_prune import SweepAndPrune
+from planetoids.core.timers import TimerScheduler
+from planetoids.core.wave_generator import WaveGenerator
 from planetoids.entities.score_popup import ScorePopup
+from planetoids.entities.warp_in import WarpIn
+from planetoids.entities.shape_templates import shape_templates, STANDARD_SIZES
+from planetoids.effects.effect_cache import effect_cache
+from planetoids.effects.explosion_sheets import explosion_bank
+
+# (distance², bullet slot, asteroid slot) recorded during collision detection
+Contact = Tuple[float, int, int]
 
 class GameState:
     """GameState manages all game objects, including the player and asteroids."""
+
+    # Most asteroids a new wave may bring in per frame
+    WAVE_SPAWNS_PER_FRAME = 4
+    # Seconds the controls hint stays up at the start of a run
+    CONTROLS_DURATION = 5
+    # Seconds Temporal Slowdown lasts
+    SLOWDOWN_DURATION = 5
+    # Seconds between losing a life and respawning, the length of the explosion
+    RESPAWN_DELAY = 0.5
+
     def __init__(
             self, screen: pygame.Surface, settings: Settings,
             clock: pygame.time.Clock
@@ -32,32 +61,97 @@ class GameState:
         self.screen = screen
         self.settings = settings
         self.clock = clock
+        self.pacer = FramePacer(clock)
+        self.timers = TimerScheduler()
+        self.asteroids = []
+        self.asteroid_pool = AsteroidPool()
+        self.asteroid_sprites = AsteroidSpriteCache()
+        self.asteroid_index = SpatialIndex()
+        self.asteroid_broadphase = SweepAndPrune()
+        self.pause_menu = PauseMenu(screen, self)
+        shape_templates.prepare(STANDARD_SIZES)
+        explosion_bank.prepare()
+        self.wave_generator = WaveGenerator(Asteroid.get_asteroid_type)
+        self.compositor = self._build_compositor()
+        self.presenter = DirtyRectPresenter()
+        self.leaderboard = Leaderboard()
+        self.reset()
+        logger.info("GameState instantiated")
+
+    def reset(self) -> None:
+        """Starts a new game in place.
+
+        Only the per-game state is rebuilt; the pause menu, caches, pools
+        and compositor carry over, so restarting after a game over is
+        almost free.
+        """
+        self.timers.clear()
+        self.asteroid_pool.release_all(self.asteroids)
+        self.asteroids = []
         self.player = Player(self.settings, self)
         self.bullets = []
-        self.asteroids = []
         self.powerups = []
         self.life = Life(self.settings)
-        self.respawn_timer = 0
+        self._respawn = None
         self.level = Level(self.settings)
         self.paused = False
-        self.pause_menu = PauseMenu(screen, self)
-        self.score = Score(self.settings)
-        self.asteroid_slowdown_active = False
-        self.slowdown_timer = 0
+        self.score = Score(self.settings, self.leaderboard.best_score())
+        self._slowdown = None
         self.dt = 1.0
-        logger.info("GameState instantiated")
         self.score_popups = []
         self.debris = []
         self.shots_fired = 0
         self.asteroids_destroyed = 0
         self.shots_hit = 0
         self.start_time = pygame.time.get_ticks()
+        self.wave_generator.begin(self.level.get_level() + 1)
+        self.incoming_wave = []
+        self.warp_ins = []
+        self._controls = self.timers.schedule(self.CONTROLS_DURATION)
+        self.compositor.invalidate()
+        self.presenter.invalidate()
+        self._frame_rects = None
+
+    @property
+    def respawn_timer(self) -> float:
+        """Frames left until the player respawns, 0 while alive."""
+        return self._respawn.remaining * 60 if self._respawn else 0
+
+    @property
+    def asteroid_slowdown_active(self) -> bool:
+        """True while Temporal Slowdown is running."""
+        return self._slowdown is not None and self._slowdown.pending
+
+    @property
+    def controls_timer(self) -> float:
+        """Seconds the controls hint stays on screen."""
+        return self._controls.remaining
+
+    def start_slowdown(self) -> None:
+        """Slows the asteroids down, restarting the countdown if already slowed."""
+        if self._slowdown is not None:
+            self._slowdown.cancel()
+        self._slowdown = self.timers.schedule(self.SLOWDOWN_DURATION)
+
+    def time_survived(self) -> float:
+        """Seconds since the game started."""
+        return (pygame.time.get_ticks() - self.start_time) / 1000
+
+    def record_run(self) -> Run:
+        """Adds the finished game to the leaderboard without waiting for the write."""
+        return self.leaderboard.record(Run(
+            self.score.score,
+            self.level.get_level(),
+            self.shots_fired,
+            self.shots_hit,
+            self.asteroids_destroyed,
+            self.time_survived()
+        ))
 
     @property
     def font(self) -> pygame.font.Font:
         """Returns font adjusted due to pixelation intensity"""
-        return pygame.font.Font(
-            self.settings.FONT_PATH,
+        return get_font(
             {"minimum":36, "medium": 48, "maximum": 64}.get(self.settings.get("pixelation"), 36)
         )
 
@@ -66,41 +160,57 @@ class GameState:
         self.dt = dt
 
     def toggle_pause(self) -> None:
-        """Toggles pause and shows the pause screen."""
+        """Toggles pause and shows the pause screen over the last frame."""
         if not self.paused:
             self.paused = True
             self.pause_menu.show()
             self.paused = False
             self.dt = 0
+            self.presenter.invalidate()  # The menu drew over the whole screen
 
     def spawn_powerup(self, x: int, y: int) -> None:
         """Spawns a power-up with a probability, allowing multiple to exist at once."""
         if len(self.powerups) < 3 and random.random() < .1:
-            powerup_class = PowerUp.get_powerup_type()
+            powerup_class = PowerUp.get_powerup_type(self.level.get_level())
             self.powerups.append(powerup_class(self, x, y))
 
     def check_for_clear_map(self) -> None:
-        """Checks if all asteroids are destroyed and resets the map if so."""
-        if not self.asteroids:
+        """Checks if all asteroids are destroyed and starts the next wave if so.
+
+        The wave was prepared during the previous level, so this only swaps
+        it in; the asteroids themselves warp in over the next few frames.
+        """
+        if not self.asteroids and not self.incoming_wave:
             self.level.increment_level()
-            self.spawn_asteroids(5 + self.level.get_level() * 2)
+            level = self.level.get_level()
+            self.incoming_wave = self.wave_generator.take(level)
+            self.wave_generator.begin(level + 1)
             self.player.set_invincibility()
 
+    def _spawn_incoming_wave(self) -> None:
+        """Warps in the next few asteroids of the current wave."""
+        for _ in range(min(self.WAVE_SPAWNS_PER_FRAME, len(self.incoming_wave))):
+            spec = self.incoming_wave.pop()
+            asteroid = self.asteroid_pool.acquire(spec.asteroid_class, self, spec.x, spec.y)
+            self.asteroids.append(asteroid)
+            self.warp_ins.append(WarpIn(spec.x, spec.y, asteroid.size))
+
     def spawn_asteroids(self, count: int=5) -> None:
         """Spawn initial asteroids using weighted selection from asteroid types."""
         for _ in range(count):
-            asteroid_type = Asteroid.get_asteroid_type()
-            print(asteroid_type)
-            self.asteroids.append(asteroid_type(self))
+            asteroid_type = Asteroid.get_asteroid_type(self.level.get_level())
+            self.asteroids.append(self.asteroid_pool.acquire(asteroid_type, self))
         logger.info("{count} asteroids spawned")
 
     def update_all(self, keys, dt: float) -> None:
         """Update all game objects, including power-ups, bullets, asteroids,
         and explosions, using delta time (dt)."""
-
+        self.timers.advance(dt)
         self.player.slowed_by_ice = False  # Reset ice slowdown before checking
 
         self._update_respawn(keys)
+        self._spawn_incoming_wave()
+        self.wave_generator.step()
         self._update_bullets()
         self._update_asteroids()
         self._update_powerups()
@@ -111,22 +221,17 @@ class GameState:
 
         for debris in self.debris:
             debris.update(dt)
+        for warp_in in self.warp_ins:
+            warp_in.update(dt)
+        self.warp_ins = [w for w in self.warp_ins if w.lifetime > 0]
 
         self.score_popups = [popup for popup in self.score_popups if popup.update()]
         self.debris = [d for d in self.debris if d.lifetime > 0]
         self.score.update_multiplier(dt)
 
     def _update_respawn(self, keys) -> None:
-        """Handles player respawn countdown and resets the player when ready, using delta time."""
-
-        if self.respawn_timer > 0:
-            self.respawn_timer -= self.dt * 60
-            print(f"Respawning in {max(0, int(self.respawn_timer))} frames")
-
-            if self.respawn_timer <= 0:
-                print("Respawning player now!")
-                self.respawn_player()
-        else:
+        """Moves the player unless it is waiting to respawn."""
+        if self.respawn_timer <= 0:
             self.player.update(keys)
 
     def _update_bullets(self) -> None:
@@ -138,18 +243,20 @@ class GameState:
     def _update_asteroids(self) -> None:
         """Updates asteroids, handles explosion animations, and removes
         destroyed asteroids using delta time."""
-        asteroids_to_remove = []
+        asteroids_to_remove = set()
 
         for asteroid in self.asteroids:
-            if isinstance(asteroid, ExplodingAsteroid) and asteroid.exploding:
+            if isinstance(asteroid, ExplodingAsteroid) and asteroid.explosion_timer <= 0:
+                asteroids_to_remove.add(asteroid)  # Its explosion timer has fired
+            elif isinstance(asteroid, ExplodingAsteroid) and asteroid.exploding:
                 asteroid.update_explosion()
-                if asteroid.explosion_timer <= 0:
-                    asteroids_to_remove.append(asteroid)
             else:
                 asteroid.update()
 
         # Remove exploding asteroids after animation finishes
-        self.asteroids = [a for a in self.asteroids if a not in asteroids_to_remove]
+        if asteroids_to_remove:
+            self.asteroids = [a for a in self.asteroids if a not in asteroids_to_remove]
+            self.asteroid_pool.release_all(asteroids_to_remove)
 
     def _update_powerups(self) -> None:
         """Updates power-ups and removes expired ones using delta time."""
@@ -157,20 +264,13 @@ class GameState:
             powerup.update()
         self.powerups = [p for p in self.powerups if not p.is_expired()]
 
-    def handle_powerup_expiration(self, event: pygame.event.Event) -> None:
-        """Handles expiration events for power-ups."""
-        if event.type == pygame.USEREVENT + 5:
-            self.asteroid_slowdown_active = False
-
     def _draw_bullets(self, screen: pygame.Surface) -> None:
         for bullet in self.bullets:
             bullet.draw(screen)
 
     def _draw_asteroids(self, screen: pygame.Surface) -> None:
         for asteroid in self.asteroids:
-            asteroid.draw(screen)
-            if isinstance(asteroid, ExplodingAsteroid) and asteroid.exploding:
-                asteroid.draw_explosion(screen)
+            asteroid.draw(screen)  # Exploding asteroids draw their explosion instead
 
     def _draw_powerups(self, screen: pygame.Surface) -> None:
         for powerup in self.powerups:
@@ -184,22 +284,146 @@ class GameState:
 
     def draw_all(self, screen: pygame.Surface) -> None:
         """Draw all game objects, including power-ups."""
+        self._frame_rects = self.compositor.compose(screen)
+
+    def present(self) -> None:
+        """Shows the drawn frame.
+
+        With the dirty_rects setting on, only the areas that changed are
+        sent to the display. Full-screen effects (CRT, the slowdown tint)
+        touch every pixel, so those frames always flip the whole screen.
+        """
+        if not self.settings.get("dirty_rects"):
+            pygame.display.flip()
+            return
+        full_screen_effect = self.settings.get("crt_enabled") or self.asteroid_slowdown_active
+        self.presenter.present(self._frame_rects, full=full_screen_effect)
+
+    def _build_compositor(self) -> Compositor:
+        """Sets up the layers the frame is built from.
+
+        The background, HUD and controls overlay are retained and only
+        redrawn when what they show changes; the world and effects layers
+        are drawn fresh every frame.
+        """
+        compositor = Compositor()
+        compositor.set_layer(
+            "background", self._draw_background, retained=True, opaque=True
+        )
+        compositor.set_layer("world", self._draw_world)
+        compositor.set_layer("effects", self._draw_effects)
+        compositor.set_layer("hud", self._draw_hud, key=self._hud_key, retained=True)
+        compositor.set_layer(
+            "overlay", self._draw_controls,
+            key=lambda: self.settings.get("pixelation"), retained=True,
+            visible=lambda: self.controls_timer > 0
+        )
+        return compositor
+
+    def _draw_background(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        surface.fill(config.BLACK)
+        return [surface.get_rect()]
+
+    def _draw_world(self, screen: pygame.Surface) -> List[pygame.Rect]:
         self._draw_player(screen)
         self._draw_asteroids(screen)
         self._draw_powerups(screen)
         self._draw_bullets(screen)
-        self.life.draw(screen)
-        self._draw_powerup_timer(screen)
-        self.level.draw(screen)
-        self.score.draw(screen)
         self._draw_debris(screen)
-        self._draw_score_popups(screen)
+        return self._world_rects()
 
+    def _draw_effects(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        self._draw_score_popups(screen)
         self._asteroid_slowdown_active(screen)
+        if self.asteroid_slowdown_active:
+            return None  # The tint covers the whole screen
+        # Popup text is small; a fixed box around its anchor covers it
+        return [pygame.Rect(int(popup.x), int(popup.y), 160, 80) for popup in self.score_popups]
+
+    def _draw_hud(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        rects = self.life.draw(surface)
+        rects += self.player.draw_shield_bar(surface)
+        rects += self._draw_powerup_timer(surface)
+        rects += self.level.draw(surface)
+        rects += self.score.draw(surface)
+        return rects
+
+    def _world_rects(self) -> List[pygame.Rect]:
+        """Returns generous bounding boxes around everything the world layer drew."""
+        rects = []
+        player = self.player
+        if player.explosion_timer > 0:
+            rects += [_circle_rect(*fragment["pos"], 4) for fragment in player.fragments]
+            rects += [_circle_rect(p.x, p.y, p.size * 2) for p in player.explosion_particles]
+            if player.explosion_sheet is not None:
+                rect = player.explosion_sheet.frame_rect(
+                    player.explosion_x, player.explosion_y, player.explosion_frame
+                )
+                if rect is not None:
+                    rects.append(rect)
+        else:
+            # Room for the aura, thruster and shield around the hull
+            rects.append(_circle_rect(player.x, player.y, max(player.size * 2, 52)))
+            rects += [_circle_rect(p.x, p.y, p.size * 2) for p in player.particles]
+
+        for asteroid in self.asteroids:
+            if isinstance(asteroid, ExplodingAsteroid) and asteroid.exploding:
+                radius = asteroid.explosion_radius
+            else:
+                # Outline width plus the shield ring of shielded asteroids
+                radius = asteroid.collision_shape.bounding_radius + 16
+            rects.append(_circle_rect(asteroid.x, asteroid.y, radius))
+
+        for powerup in self.powerups:
+            rects.append(_circle_rect(powerup.x, powerup.y, powerup.radius * 2.5))
+            rects += [_circle_rect(p["x"], p["y"], 3) for p in powerup.particles]
+
+        for bullet in self.bullets:
+            rect = _circle_rect(bullet.x, bullet.y, bullet.radius)
+            rects.append(rect.unionall([_circle_rect(tx, ty, 4) for tx, ty in bullet.trail]))
+
+        rects += [_circle_rect(d.x, d.y, d.size + 1) for d in self.debris]
+        rects += [_circle_rect(w.x, w.y, w.size * 2 + 2) for w in self.warp_ins]
+        return rects
+
+    def _hud_key(self) -> Tuple:
+        """Everything the HUD shows, with bars measured in whole pixels
+        so they only trigger a redraw when they visibly move."""
+        return (
+            self.settings.get("pixelation"),
+            self.life.lives,
+            self.level.level,
+            self.score.score,
+            self.score.high_score,
+            self.score.multiplier,
+            int(self.score.multiplier_fill_ratio() * Score.MULTIPLIER_BAR_WIDTH),
+            self.player.shield_active,
+            int(self.player.shield_progress() * Player.SHIELD_BAR_WIDTH),
+            self._active_powerup_bar(),
+        )
+
+    def _draw_controls(self, surface: pygame.Surface) -> None:
+        """Draws the controls hint shown for the first few seconds of a run."""
+        controls = (
+            ("CONTROLS:", -80, 180, config.YELLOW),
+            ("Arrow keys - Movement", -50, 220, config.GREEN),
+            ("SPACE - Shoot", -50, 260, config.GREEN),
+            ("P - Pause", -50, 300, config.GREEN)
+        )
+        font = self.font
+        half_width = config.WIDTH // 2
+        third_height = config.HEIGHT // 3
+        rects = []
+        for text, x_offset, y_offset, color in controls:
+            rendered_text = font.render(text, True, color)
+            rects.append(surface.blit(rendered_text, (half_width - x_offset, third_height + y_offset)))
+        return rects
 
     def _draw_debris(self, screen: pygame.Surface) -> None:
         for debris in self.debris:
             debris.draw(screen)
+        for warp_in in self.warp_ins:
+            warp_in.draw(screen)
 
     def _draw_score_popups(self, screen: pygame.Surface) -> None:
         for popup in self.score_popups:
@@ -208,16 +432,11 @@ class GameState:
     def _asteroid_slowdown_active(self, screen: pygame.Surface) -> None:
         # Draw slowdown visual effect
         if self.asteroid_slowdown_active:
-            # Calculate elapsed time since slowdown started
-            total_duration = 5000  # 5 seconds in milliseconds
-            time_elapsed = total_duration - max(0, self.slowdown_timer - pygame.time.get_ticks())
-
             # Calculate opacity: Starts at 70 and smoothly decreases to 0
-            fade_intensity = max(0, int(70 * (1 - (time_elapsed / total_duration))))
+            fade_intensity = max(0, int(70 * self._slowdown.remaining / self.SLOWDOWN_DURATION))
 
-            # Create semi-transparent blue overlay
-            overlay = pygame.Surface((config.WIDTH, config.HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 150, 255, fade_intensity))  # Softer cyan overlay
+            # Reuse one semi-transparent blue overlay, only changing its alpha
+            overlay = effect_cache.tint(screen.get_size(), (0, 150, 255), fade_intensity)  # Softer cyan overlay
             screen.blit(overlay, (0, 0))
 
     def check_powerup_collisions(self) -> None:
@@ -232,57 +451,126 @@ class GameState:
     def apply_powerup(self, powerup: PowerUp) -> None:
         """Applies the collected power-up effect."""
         if isinstance(powerup, TemporalSlowdownPowerUp):
-            self.slowdown_timer = pygame.time.get_ticks() + 5000  # 5 seconds
-            self.asteroid_slowdown_active = True
-            pygame.time.set_timer(pygame.USEREVENT + 5, 5000)
+            powerup.apply(self)  # Slowdown acts on the whole game
         else:
             powerup.apply(self.player)  # Call the power-up's apply() method
 
     def _handle_bullet_asteroid_collision(self) -> None:
-        """Handles collisions between bullets and asteroids."""
+        """Handles collisions between bullets and asteroids.
+
+        Detection fills a buffer of contact pairs, which is then sorted,
+        deduplicated and resolved in one batch so the outcome doesn't depend
+        on the order of the bullet and asteroid lists.
+        """
+        contacts = self._detect_bullet_asteroid_contacts()
+        if not contacts:
+            return
 
-        bullets_to_remove = []
-        asteroids_to_remove = []
+        bullets_to_remove = set()
+        asteroids_to_remove = set()
         new_asteroids = []
 
-        for bullet in self.bullets[:]:  # Iterate over a copy
-            for asteroid in self.asteroids[:]:  # Iterate over a copy
-                if self._is_bullet_asteroid_collision(bullet, asteroid):
-                    self._process_bullet_hit(
-                        bullet, asteroid, bullets_to_remove,
-                        asteroids_to_remove, new_asteroids
-                    )
+        hits, blast_victims = self._resolve_bullet_asteroid_contacts(
+            contacts, bullets_to_remove, asteroids_to_remove, new_asteroids
+        )
+        self._apply_hit_effects(hits, blast_victims)
 
         self._remove_destroyed_asteroids(asteroids_to_remove)
         self.asteroids.extend(new_asteroids)  # Add newly split asteroids
         self.bullets = [b for b in self.bullets if b not in bullets_to_remove]
 
+    def _detect_bullet_asteroid_contacts(self) -> List[Contact]:
+        """Returns a (distance², bullet slot, asteroid slot) tuple for every overlapping pair.
+
+        Bullets are swept along the segment they covered this step, so a
+        long frame can't carry them straight through a small asteroid.
+        The distance is measured from the start of the sweep.
+        """
+        if not self.asteroids:
+            return []
+
+        asteroid_slots = {asteroid: slot for slot, asteroid in enumerate(self.asteroids)}
+        reach = max(asteroid.collision_shape.bounding_radius for asteroid in self.asteroids)
+        reach += max((bullet.radius for bullet in self.bullets), default=0)
+        contacts = []
+
+        for bullet_slot, bullet in enumerate(self.bullets):
+            x0, y0, x1, y1 = bullet.get_sweep()
+            half_length = math.hypot(x1 - x0, y1 - y0) / 2
+            nearby = self.asteroid_index.query_radius(
+                (x0 + x1) / 2, (y0 + y1) / 2, reach + half_length
+            )
+            for asteroid in nearby:
+                if getattr(asteroid, "exploding", False):
+                    continue  # Only the explosion animation is left
+                if self._is_bullet_asteroid_collision(bullet, asteroid):
+                    dx = wrapped_delta(x0 - asteroid.x, config.WIDTH)
+                    dy = wrapped_delta(y0 - asteroid.y, config.HEIGHT)
+                    contacts.append((dx * dx + dy * dy, bullet_slot, asteroid_slots[asteroid]))
+        return contacts
+
     def _is_bullet_asteroid_collision(
             self, bullet: Bullet, asteroid: Asteroid
         ) -> bool:
-        """Returns True if a bullet collides with an asteroid."""
-        return self.calculate_collision_distance(bullet, asteroid) < asteroid.size
+        """Returns True if a bullet's swept circle touches an asteroid's outline."""
+        x0, y0, x1, y1 = bullet.get_sweep()
+        start_x = wrapped_delta(x0 - asteroid.x, config.WIDTH)
+        start_y = wrapped_delta(y0 - asteroid.y, config.HEIGHT)
+        end_x, end_y = asteroid.to_local(start_x + x1 - x0, start_y + y1 - y0)
+        start_x, start_y = asteroid.to_local(start_x, start_y)
+        return asteroid.collision_shape.intersects_capsule(
+            start_x, start_y, end_x, end_y, bullet.radius
+        )
 
     #pylint: disable=too-many-arguments
-    def _process_bullet_hit(
-            self, bullet: Bullet, asteroid: Asteroid,
-            bullets_to_remove: List[Bullet],
-            asteroids_to_remove: List[Asteroid], new_asteroids: List[Asteroid]
+    def _resolve_bullet_asteroid_contacts(
+            self, contacts: List[Contact],
+            bullets_to_remove: Set[Bullet], asteroids_to_remove: Set[Asteroid],
+            new_asteroids: List[Asteroid]
+        ) -> Tuple[List[Tuple[Bullet, Asteroid, bool]], List[Asteroid]]:
+        """Resolves contacts closest-first and returns the hits that landed.
+
+        Each bullet stops at its first hit unless it pierces, and each
+        asteroid is only destroyed once. Returns (bullet, asteroid, shielded)
+        hits plus any asteroids destroyed by chained explosions.
+        """
+        contacts.sort()
+        hits = []
+        blast_victims = []
+
+        for _, bullet_slot, asteroid_slot in contacts:
+            bullet = self.bullets[bullet_slot]
+            asteroid = self.asteroids[asteroid_slot]
+            if bullet in bullets_to_remove or asteroid in asteroids_to_remove:
+                continue
+
+            if isinstance(asteroid, ShieldAsteroid) and asteroid.current_shield > 0:
+                asteroid.on_hit(bullet)  # Reduce shield health
+                bullets_to_remove.add(bullet)  # Destroy bullet
+                hits.append((bullet, asteroid, True))
+                continue  # Don't damage the asteroid
+
+            blast_victims.extend(
+                self._handle_asteroid_destruction(asteroid, asteroids_to_remove, new_asteroids)
+            )
+            if not bullet.piercing:
+                bullets_to_remove.add(bullet)
+            hits.append((bullet, asteroid, False))
+
+        return hits, blast_victims
+
+    def _apply_hit_effects(
+            self, hits: List[Tuple[Bullet, Asteroid, bool]], blast_victims: List[Asteroid]
         ) -> None:
-        """Handles the effects of a bullet hitting an asteroid."""
-
-        self._apply_bullet_effects(bullet, asteroid)
-        if isinstance(asteroid, ShieldAsteroid) and asteroid.current_shield > 0:
-            asteroid.on_hit(bullet)  # Reduce shield health
-            bullets_to_remove.append(bullet)  # Destroy bullet
-            return  # Skip further processing (don't damage the asteroid)
-        self._handle_asteroid_destruction(asteroid, asteroids_to_remove, new_asteroids)
+        """Applies scoring, popups, power-up drops and ricochets for resolved hits."""
+        for bullet, asteroid, shielded in hits:
+            self._apply_bullet_effects(bullet, asteroid)
+            if not shielded:
+                self._handle_powerup_spawn(asteroid)
+                self._handle_ricochet_bullet(bullet, asteroid)
 
-        if not bullet.piercing:
-            bullets_to_remove.append(bullet)
-
-        self._handle_powerup_spawn(asteroid)
-        self._handle_ricochet_bullet(bullet, asteroid)
+        for asteroid in blast_victims:
+            self.score.update_score(asteroid)
 
     def _apply_bullet_effects(self, bullet: Bullet, asteroid: Asteroid):
         """Applies effects when a bullet hits an asteroid."""
@@ -298,14 +586,19 @@ class GameState:
 
     def _handle_asteroid_destruction(
             self, asteroid: Asteroid,
-            asteroids_to_remove: List[Asteroid], new_asteroids: List[Asteroid]
-        ):
-        """Determines how an asteroid is destroyed or split."""
+            asteroids_to_remove: Set[Asteroid], new_asteroids: List[Asteroid]
+        ) -> List[Asteroid]:
+        """Determines how an asteroid is destroyed or split.
+
+        Returns any other asteroids destroyed as a side effect.
+        """
+        if asteroid in asteroids_to_remove:
+            return []  # Already destroyed this frame
         if isinstance(asteroid, ExplodingAsteroid):
-            self._handle_exploding_asteroid(asteroid, asteroids_to_remove, new_asteroids)
-        else:
-            asteroids_to_remove.append(asteroid)  # Remove normal asteroids
-            new_asteroids.extend(asteroid.split())  # Add split asteroids
+            return self._handle_exploding_asteroid(asteroid, asteroids_to_remove, new_asteroids)
+        asteroids_to_remove.add(asteroid)  # Remove normal asteroids
+        new_asteroids.extend(asteroid.split())  # Add split asteroids
+        return []
 
     def _handle_powerup_spawn(self, asteroid: Asteroid) -> None:
         """Spawns a power-up at the asteroid’s location if conditions are met."""
@@ -319,19 +612,34 @@ class GameState:
             self._spawn_ricochet_bullet(asteroid.x, asteroid.y)
 
     def _handle_exploding_asteroid(
-            self, asteroid: Asteroid,
-            asteroids_to_remove: List[Asteroid], new_asteroids: List[Asteroid]
-        ) -> None:
-        """Triggers an asteroid explosion and manages affected asteroids."""
-
-        if not asteroid.exploding:  # Start explosion if not already started
-            asteroid.explode(self.asteroids)
-
-        exploded_asteroids = asteroid.explode(self.asteroids)
-        for exploded_asteroid in exploded_asteroids:
-            self.score.update_score(exploded_asteroid)
-            asteroids_to_remove.append(exploded_asteroid)
-            new_asteroids.extend(exploded_asteroid.split())
+            self, asteroid: ExplodingAsteroid,
+            asteroids_to_remove: Set[Asteroid], new_asteroids: List[Asteroid]
+        ) -> List[Asteroid]:
+        """Triggers an asteroid explosion and resolves any chained blasts.
+
+        Exploding asteroids caught in a blast are queued and detonated in the
+        same pass, so every asteroid is split at most once. Returns the other
+        asteroids destroyed by the blast so the caller can score them.
+        """
+        if asteroid.exploding:
+            return []  # Already detonated, only the animation is left
+
+        asteroids_to_remove.add(asteroid)
+        new_asteroids.extend(asteroid.split())
+
+        blast_victims = []
+        pending = [asteroid]
+        while pending:
+            source = pending.pop()
+            for target in source.explode(self.asteroid_index):
+                if target in asteroids_to_remove or getattr(target, "exploding", False):
+                    continue
+                asteroids_to_remove.add(target)
+                blast_victims.append(target)
+                new_asteroids.extend(target.split())
+                if isinstance(target, ExplodingAsteroid):
+                    pending.append(target)  # Chain reaction
+        return blast_victims
 
     def _spawn_ricochet_bullet(self, x: int, y: int) -> None:
         """Creates and adds a ricochet bullet."""
@@ -342,12 +650,16 @@ class GameState:
         )
         self.bullets.append(ricochet_bullet)
 
-    def _remove_destroyed_asteroids(self, asteroids_to_remove: List[Asteroid]) -> None:
+    def _remove_destroyed_asteroids(self, asteroids_to_remove: Set[Asteroid]) -> None:
         """Removes non-exploding asteroids that were destroyed."""
         self.asteroids = [
             a for a in self.asteroids
             if a not in asteroids_to_remove or (isinstance(a, ExplodingAsteroid) and a.exploding)
         ]
+        # Exploding asteroids are released once their animation finishes
+        self.asteroid_pool.release_all(
+            a for a in asteroids_to_remove if not getattr(a, "exploding", False)
+        )
 
     def _handle_player_asteroid_collision(self) -> None:
         """Handles collisions between the player and asteroids, triggering the
@@ -355,10 +667,33 @@ class GameState:
         if self.respawn_timer > 0:
             return  # Player is currently respawning, ignore collisions
         for asteroid in self.asteroids:
-            if self._is_collision(self.player, asteroid):
+            if getattr(asteroid, "exploding", False):
+                continue  # Only the explosion animation is left
+            if self._is_player_asteroid_collision(asteroid):
                 self._trigger_player_explosion()
                 break  # Stop checking after first collision
 
+    def _is_player_asteroid_collision(self, asteroid: Asteroid) -> bool:
+        """Returns True if the ship's hull overlaps an asteroid's outline.
+
+        The cheap bounding-circle test rejects almost every asteroid before
+        the exact triangle-versus-polygon test runs.
+        """
+        dx = wrapped_delta(self.player.x - asteroid.x, config.WIDTH)
+        dy = wrapped_delta(self.player.y - asteroid.y, config.HEIGHT)
+        reach = asteroid.collision_shape.bounding_radius + self.player.size
+        if dx * dx + dy * dy > reach * reach:
+            return False
+
+        # Move the hull into the asteroid's local space
+        offset_x = dx - self.player.x
+        offset_y = dy - self.player.y
+        hull = [
+            asteroid.to_local(x + offset_x, y + offset_y)
+            for x, y in self.player.get_triangle()
+        ]
+        return asteroid.collision_shape.intersects_polygon(hull)
+
     def _is_collision(self, entity1, entity2):
         """Returns True if two entities are colliding based on their distance."""
         return self.calculate_collision_distance(entity1, entity2) < entity2.size
@@ -371,13 +706,74 @@ class GameState:
             self.player.take_damage()
             return  # Shield absorbs the hit
         self.player.generate_explosion()  # Trigger explosion animation
-        self.respawn_timer = 30  # Delay respawn for explosion duration
+        self._respawn = self.timers.schedule(self.RESPAWN_DELAY, self.respawn_player)  # Wait for the explosion
         self.life.decrement()
 
     def check_for_collisions(self) -> None:
-        """Check for bullet-asteroid and player-asteroid collisions."""
+        """Check for bullet-asteroid, player-asteroid and, if enabled,
+        asteroid-asteroid collisions."""
+        self.asteroid_index.rebuild(self.asteroids)
         self._handle_bullet_asteroid_collision()
         self._handle_player_asteroid_collision()
+        if self.settings.get("asteroid_collisions"):
+            self._handle_asteroid_asteroid_collision()
+
+    def _handle_asteroid_asteroid_collision(self) -> None:
+        """Bounces overlapping asteroids off each other.
+
+        A sort-and-sweep broadphase keeps this near-linear in the number of
+        asteroids. Pairs straddling a screen edge are not considered.
+        """
+        live = [a for a in self.asteroids if not getattr(a, "exploding", False)]
+        self.asteroid_broadphase.update(live)
+        for first, second in self.asteroid_broadphase.pairs():
+            self._bounce_asteroids(first, second)
+
+    @staticmethod
+    def _bounce_asteroids(first: Asteroid, second: Asteroid) -> None:
+        """Applies an elastic collision between two asteroids, with mass proportional to size."""
+        nx = second.x - first.x
+        ny = second.y - first.y
+        min_distance = first.size + second.size
+        distance_sq = nx * nx + ny * ny
+        if distance_sq >= min_distance * min_distance or distance_sq == 0:
+            return
+
+        distance = math.sqrt(distance_sq)
+        nx /= distance
+        ny /= distance
+        inv_mass_first = 1 / first.size
+        inv_mass_second = 1 / second.size
+        inv_mass_total = inv_mass_first + inv_mass_second
+
+        # Push apart so they don't stay stuck together
+        overlap = (min_distance - distance) / inv_mass_total
+        first.x -= nx * overlap * inv_mass_first
+        first.y -= ny * overlap * inv_mass_first
+        second.x += nx * overlap * inv_mass_second
+        second.y += ny * overlap * inv_mass_second
+
+        first_rad = math.radians(first.angle)
+        second_rad = math.radians(second.angle)
+        v1x = math.cos(first_rad) * first.base_speed
+        v1y = math.sin(first_rad) * first.base_speed
+        v2x = math.cos(second_rad) * second.base_speed
+        v2y = math.sin(second_rad) * second.base_speed
+
+        approach = (v2x - v1x) * nx + (v2y - v1y) * ny
+        if approach >= 0:
+            return  # Already separating
+
+        impulse = -2 * approach / inv_mass_total
+        v1x -= impulse * inv_mass_first * nx
+        v1y -= impulse * inv_mass_first * ny
+        v2x += impulse * inv_mass_second * nx
+        v2y += impulse * inv_mass_second * ny
+
+        first.angle = math.degrees(math.atan2(v1y, v1x))
+        first.base_speed = math.hypot(v1x, v1y)
+        second.angle = math.degrees(math.atan2(v2y, v2x))
+        second.base_speed = math.hypot(v2x, v2y)
 
     def handle_player_collision(self, screen: pygame.Surface) -> None:
         """Handles player collision logic, including shield effects,
@@ -411,19 +807,36 @@ class GameState:
         if self.respawn_timer > 0:
             return
         logger.info("Respawning player!")
-        self.player.reset_position()
-        self.player.invincible = True
-        pygame.time.set_timer(pygame.USEREVENT + 2, 2000)  # 2 sec invincibility
+        self.player.reset_position()  # Also makes the player briefly invincible
 
-    def _draw_powerup_timer(self, screen: pygame.Surface) -> None:
+    def _draw_powerup_timer(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """Draws a shrinking timer bar for active powerups with their
         corresponding colors and labels."""
         y_offset = {"minimum": 75, "medium": 85, "maximum": 100}.get(
             self.settings.get("pixelation"), 85
         )
 
+        active = self._active_powerup_bar()
+        if active is None:
+            return []
+        label, color, bar_width = active
+
+        # Draw timer bar
+        bar_rect = pygame.draw.rect(
+            screen, color, (config.WIDTH // 2 - 100, config.HEIGHT - 30, bar_width, 10)
+        )
+
+        # Draw power-up name
+        text_surface = self.font.render(label, True, (255, 255, 255))
+        text_rect = text_surface.get_rect(
+            center=(config.WIDTH // 2, config.HEIGHT - y_offset)
+        )
+        return [bar_rect, screen.blit(text_surface, text_rect)]
+
+    def _active_powerup_bar(self) -> Tuple:
+        """Returns the label, colour and bar width of the active power-up, or None."""
         if self.player.powerup_timer <= 0:
-            return
+            return None
 
         # Map each flag to its corresponding class and label
         powerup_mappings = [
@@ -437,19 +850,8 @@ class GameState:
             if is_active:
                 color = getattr(powerup_class, "color", (0, 255, 255))  # Fallback: cyan
                 bar_width = int((self.player.powerup_timer / 300) * 200)
-
-                # Draw timer bar
-                pygame.draw.rect(
-                    screen, color, (config.WIDTH // 2 - 100, config.HEIGHT - 30, bar_width, 10)
-                )
-
-                # Draw power-up name
-                text_surface = self.font.render(label, True, (255, 255, 255))
-                text_rect = text_surface.get_rect(
-                    center=(config.WIDTH // 2, config.HEIGHT - y_offset)
-                )
-                screen.blit(text_surface, text_rect)
-                break
+                return label, color, bar_width
+        return None
 
 
     def calculate_collision_distance(self, obj1, obj2) -> None:
@@ -457,3 +859,7 @@ class GameState:
         dx = obj1.x - obj2.x
         dy = obj1.y - obj2.y
         return (dx ** 2 + dy ** 2) ** 0.5
+
+def _circle_rect(x: float, y: float, radius: float) -> pygame.Rect:
+    """Returns the box around a circle, padded a pixel for rounding."""
+    return pygame.Rect(int(x - radius) - 1, int(y - radius) - 1, int(radius * 2) + 3, int(radius * 2) + 3)
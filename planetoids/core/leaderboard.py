@@ -0,0 +1,175 @@
+"""Local leaderboard and run history in an embedded SQLite database"""
+
+import atexit
+import datetime
+import json
+import os
+import queue
+import sqlite3
+import threading
+from typing import List, NamedTuple, Optional
+
+from planetoids.core.logger import logger
+from planetoids.core.settings import Settings
+
+class Run(NamedTuple):
+    """The result and stats of one finished game."""
+    score: int
+    level: int = 1
+    shots_fired: int = 0
+    shots_hit: int = 0
+    asteroids_destroyed: int = 0
+    time_survived: float = 0.0  # Seconds
+    played_at: str = ""  # ISO timestamp, filled in when recorded
+
+    @property
+    def accuracy(self) -> float:
+        """Percentage of shots that hit something."""
+        return (self.shots_hit / self.shots_fired) * 100 if self.shots_fired else 0.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    shots_fired INTEGER NOT NULL,
+    shots_hit INTEGER NOT NULL,
+    asteroids_destroyed INTEGER NOT NULL,
+    time_survived REAL NOT NULL,
+    played_at TEXT NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_day ON runs (day, score DESC);
+"""
+
+_COLUMNS = "score, level, shots_fired, shots_hit, asteroids_destroyed, time_survived, played_at"
+
+# Bumped when the database is changed in a way later runs need to know about
+_SCHEMA_VERSION = 1
+
+class Leaderboard:
+    """Stores every finished run and answers top-score and history queries.
+
+    Queries run on the caller's connection. Recording a run only queues
+    it; a background thread with its own connection does the insert, so
+    the game over screen never waits on the disk. The best score is kept
+    in memory so it is right even before the writer catches up.
+    """
+
+    DB_NAME = "leaderboard.db"
+    LEGACY_HIGH_SCORE = "high_score.json"
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.path.join(Settings.CONFIG_DIR, self.DB_NAME)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._connection = self._connect()
+        self._migrate()
+        self._best = self._connection.execute("SELECT COALESCE(MAX(score), 0) FROM runs").fetchone()[0]
+        self._writes = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    def best_score(self) -> int:
+        """Highest score recorded so far."""
+        return self._best
+
+    def record(self, run: Run) -> Run:
+        """Queues a finished run to be stored and returns it with its timestamp."""
+        if not run.played_at:
+            run = run._replace(played_at=datetime.datetime.now().isoformat(timespec="seconds"))
+        self._best = max(self._best, run.score)
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_runs, name="leaderboard-writer", daemon=True)
+            self._writer.start()
+        self._writes.put(run)
+        return run
+
+    def flush(self) -> None:
+        """Waits until every queued run has been stored."""
+        if self._writer is not None:
+            self._writes.join()
+
+    def close(self) -> None:
+        """Stores queued runs, stops the writer and closes the database."""
+        if self._writer is not None:
+            self._writes.put(None)
+            self._writer.join()
+            self._writer = None
+        self._connection.close()
+
+    def top(self, count: int = 10) -> List[Run]:
+        """Best runs of all time."""
+        return self._query(f"SELECT {_COLUMNS} FROM runs ORDER BY score DESC LIMIT ?", (count,))
+
+    def top_for_day(self, day: datetime.date, count: int = 10) -> List[Run]:
+        """Best runs played on one day."""
+        return self._query(
+            f"SELECT {_COLUMNS} FROM runs WHERE day = ? ORDER BY score DESC LIMIT ?",
+            (day.isoformat(), count)
+        )
+
+    def history(self, count: int = 20) -> List[Run]:
+        """Most recent runs, newest first."""
+        return self._query(f"SELECT {_COLUMNS} FROM runs ORDER BY id DESC LIMIT ?", (count,))
+
+    def rank(self, score: int) -> int:
+        """Position a score would take on the all-time board."""
+        return self._connection.execute("SELECT COUNT(*) + 1 FROM runs WHERE score > ?", (score,)).fetchone()[0]
+
+    def _query(self, sql, params) -> List[Run]:
+        return [Run(*row) for row in self._connection.execute(sql, params)]
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        # WAL lets the game read while the writer thread is inserting
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def _write_runs(self) -> None:
+        connection = self._connect()
+        while True:
+            run = self._writes.get()
+            try:
+                if run is None:
+                    break
+                with connection:
+                    _insert(connection, run)
+                logger.info(f"Recorded run with score {run.score}")
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to record run: {e}")
+            finally:
+                self._writes.task_done()
+        connection.close()
+
+    def _migrate(self) -> None:
+        """Creates the tables and brings over the old single high score on first run."""
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            legacy_path = os.path.join(os.path.dirname(self.path), self.LEGACY_HIGH_SCORE)
+            high_score = _read_legacy_high_score(legacy_path)
+            if high_score:
+                played_at = datetime.datetime.fromtimestamp(os.path.getmtime(legacy_path))
+                _insert(self._connection, Run(high_score, played_at=played_at.isoformat(timespec="seconds")))
+                logger.info(f"Migrated high score {high_score} from {legacy_path}")
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+def _insert(connection: sqlite3.Connection, run: Run) -> None:
+    connection.execute(
+        f"INSERT INTO runs ({_COLUMNS}, day) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (*run, run.played_at[:10])
+    )
+
+def _read_legacy_high_score(path: str) -> int:
+    try:
+        with open(path, "r") as f:
+            return int(json.load(f).get("high_score", 0))
+    except FileNotFoundError:
+        return 0
+    except (ValueError, OSError, AttributeError) as e:
+        logger.warning(f"Failed to read old high score: {e}")
+        return 0
@@ -1,6 +1,7 @@
 import pygame
 
 from planetoids.core.config import config
+from planetoids.core.fonts import get_font
 from planetoids.core.logger import logger
 
 class Level:
@@ -11,8 +12,7 @@ class Level:
 
     @property
     def font(self):
-        return pygame.font.Font(
-            self.settings.FONT_PATH,
+        return get_font(
             {"minimum":36, "medium": 48, "maximum": 64}.get(self.settings.get("pixelation"), 36)
         )
 
@@ -37,5 +37,5 @@ class Level:
         # Position the bottom-right corner of the text
         text_rect.bottomright = (config.WIDTH - x_offset, config.HEIGHT - y_offset)
 
-        screen.blit(text, text_rect)
+        return [screen.blit(text, text_rect)]
 
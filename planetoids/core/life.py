@@ -1,6 +1,7 @@
 import pygame
 
 from planetoids.core.config import config
+from planetoids.core.fonts import get_font
 from planetoids.core.logger import logger
 
 class Life:
@@ -11,8 +12,7 @@ class Life:
 
     @property
     def font(self):
-        return pygame.font.Font(
-            self.settings.FONT_PATH,
+        return get_font(
             {"minimum":36, "medium": 48, "maximum": 64}.get(self.settings.get("pixelation"), 36)
         )
 
@@ -30,6 +30,7 @@ class Life:
         start_x = {"minimum": 10, "medium": 20, "maximum": 30}.get(self.settings.get("pixelation"), 10)
         start_y = {"minimum": 18, "medium": 36, "maximum": 54}.get(self.settings.get("pixelation"), 18)
 
+        rects = []
         for i in range(self.lives - 1):
             x_offset = start_x + i * (ship_size + spacing)
 
@@ -39,4 +40,5 @@ class Life:
             right = (x_offset + ship_size * 0.6, start_y + ship_size * 0.6)
 
             # Draw the mini ship
-            pygame.draw.polygon(screen, config.WHITE, [front, left, right], 1)
\ No newline at end of file
+            rects.append(pygame.draw.polygon(screen, config.WHITE, [front, left, right], 1))
+        return rects
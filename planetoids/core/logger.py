@@ -7,10 +7,8 @@ dotenv.load_dotenv()
 
 DEBUG_MODE = os.getenv("DEBUG", "False").lower() in ("true", "1")
 
-# Define log directory
+# Log directory, only needed if the file handler below is switched on
 LOG_DIR = "logs"
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
 
 # Configure logging
 LOG_FILE = os.path.join(LOG_DIR, "game.log")
@@ -0,0 +1,93 @@
+"""Crash-safe JSON files written behind the game's back"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+from planetoids.core.logger import logger
+
+def write_json_atomic(path: str, data) -> None:
+    """Writes JSON to a temporary file beside path, then swaps it into place.
+
+    A crash part-way through leaves the previous file untouched.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class WriteBehindStore:
+    """Keeps the latest version of a JSON document and writes it in the background.
+
+    schedule() only records the data, so callers never wait on the disk.
+    A worker thread writes it once no new changes have arrived for
+    `debounce` seconds, so a burst of changes costs a single write.
+    flush() writes anything outstanding straight away and runs at exit.
+    """
+
+    def __init__(self, path: str, debounce: float = 0.5) -> None:
+        self.path = path
+        self.debounce = debounce
+        self.flush_times: List[float] = []  # Seconds each write took
+        self._changed = threading.Condition()
+        self._writing = threading.Lock()
+        self._pending: Optional[dict] = None
+        self._due = 0.0
+        self._worker: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    @property
+    def pending(self) -> bool:
+        """True while there are changes that haven't been written yet."""
+        return self._pending is not None
+
+    def schedule(self, data: dict) -> None:
+        """Records the data to be written after the debounce interval."""
+        with self._changed:
+            self._pending = dict(data)
+            self._due = time.monotonic() + self.debounce
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="write-behind", daemon=True)
+                self._worker.start()
+            self._changed.notify()
+
+    def flush(self) -> bool:
+        """Writes outstanding changes on the calling thread; returns True if there were any."""
+        with self._writing:
+            with self._changed:
+                data, self._pending = self._pending, None
+            if data is None:
+                return False
+
+            start = time.perf_counter()
+            try:
+                write_json_atomic(self.path, data)
+            except OSError as e:
+                logger.warning(f"Failed to write {self.path}: {e}")
+                return False
+            elapsed = time.perf_counter() - start
+            self.flush_times.append(elapsed)
+            logger.debug(f"Wrote {self.path} in {elapsed * 1000:.2f} ms")
+            return True
+
+    def _run(self) -> None:
+        while True:
+            with self._changed:
+                # Keep pushing the write back while changes keep coming
+                while self._pending is not None and time.monotonic() < self._due:
+                    self._changed.wait(self._due - time.monotonic())
+                if self._pending is None:
+                    self._worker = None
+                    return
+            self.flush()
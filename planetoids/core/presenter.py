@@ -0,0 +1,58 @@
+"""Presents finished frames, pushing only the changed areas when it can"""
+
+from typing import List, Optional
+
+import pygame
+
+from planetoids.core.logger import logger
+
+class DirtyRectPresenter:
+    """Sends the display only the rects that changed since the last frame.
+
+    Anything drawn last frame has to be erased this frame, so the rects of
+    the previous frame are always updated alongside the current ones. When
+    the changed area gets too large, or nobody can say what changed, a
+    full flip is cheaper than many small updates and is used instead.
+    """
+
+    def __init__(self, max_coverage: float = 0.35) -> None:
+        self.max_coverage = max_coverage
+        self.full_flips = 0
+        self.partial_updates = 0
+        self._previous: List[pygame.Rect] = []
+        self._force_full = True
+
+    def invalidate(self) -> None:
+        """Makes the next frame a full flip, e.g. after a menu drew over the screen."""
+        self._force_full = True
+
+    def present(self, rects: Optional[List[pygame.Rect]], full: bool = False) -> None:
+        """Shows the frame, updating only rects unless a full flip is needed."""
+        screen_rect = pygame.display.get_surface().get_rect()
+        if rects is None:
+            current = None
+        else:
+            current = [rect.clip(screen_rect) for rect in rects]
+            current = [rect for rect in current if rect.width and rect.height]
+
+        if full or self._force_full or current is None:
+            self._flip(current)
+            return
+
+        dirty = self._previous + current
+        covered = sum(rect.width * rect.height for rect in dirty)
+        if covered > self.max_coverage * screen_rect.width * screen_rect.height:
+            self._flip(current)
+            return
+
+        pygame.display.update(dirty)
+        self.partial_updates += 1
+        self._previous = current
+
+    def _flip(self, current: Optional[List[pygame.Rect]]) -> None:
+        pygame.display.flip()
+        if self._force_full:
+            logger.debug("Presenting a full frame")
+        self.full_flips += 1
+        self._force_full = current is None
+        self._previous = current or []
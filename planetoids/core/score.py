@@ -1,18 +1,16 @@
-import json
-import os
 import time
 import pygame
 
 from planetoids.core.config import config
-from planetoids.core.settings import Settings  # For access to CONFIG_DIR
+from planetoids.core.fonts import get_font
 
 class Score:
-    HIGHSCORE_PATH = os.path.join(Settings.CONFIG_DIR, "high_score.json")
+    MULTIPLIER_BAR_WIDTH = 250
 
-    def __init__(self, settings):
+    def __init__(self, settings, high_score=0):
         self.score = 0
         self.settings = settings
-        self.high_score = self._load_high_score()
+        self.high_score = high_score  # Best score on the leaderboard
         self.new_high_score = False
 
         self.multiplier = 1
@@ -25,8 +23,7 @@ class Score:
 
     @property
     def font(self):
-        return pygame.font.Font(
-            self.settings.FONT_PATH,
+        return get_font(
             {"minimum": 36, "medium": 48, "maximum": 64}.get(self.settings.get("pixelation"), 36)
         )
 
@@ -67,9 +64,14 @@ class Score:
         elif self.multiplier == 1:
             self.multiplier_progress = max(0, self.multiplier_progress - self.multiplier_decay_rates[1] * dt)
 
+    def multiplier_fill_ratio(self):
+        """Returns how full the multiplier bar is, from 0 to 1."""
+        fill_ratio = self.multiplier_progress / self.multiplier_thresholds[self.multiplier]
+        return max(0, min(fill_ratio, 1.0))
+
     def draw_multiplier(self, screen):
         """Draws multiplier bar and label beneath the score in the top-right."""
-        max_bar_width = 250
+        max_bar_width = self.MULTIPLIER_BAR_WIDTH
         bar_height = 20
 
         # Align with top-right corner under score
@@ -78,19 +80,18 @@ class Score:
         x = config.WIDTH - max_bar_width - padding
         y = {"minimum": 80, "medium": 98, "maximum": 116}.get(self.settings.get("pixelation"), 80)
 
-        fill_ratio = self.multiplier_progress / self.multiplier_thresholds[self.multiplier]
-        fill_ratio = max(0, min(fill_ratio, 1.0))
-        fill_width = int(max_bar_width * fill_ratio)
+        fill_width = int(max_bar_width * self.multiplier_fill_ratio())
 
         color = {1: config.CYAN, 2: config.YELLOW, 3: config.ORANGE, 4: config.RED}.get(self.multiplier, config.CYAN)
 
         # Background and filled bar
-        pygame.draw.rect(screen, (50, 50, 50), (x, y, max_bar_width, bar_height))
+        bar_rect = pygame.draw.rect(screen, (50, 50, 50), (x, y, max_bar_width, bar_height))
         pygame.draw.rect(screen, color, (x, y, fill_width, bar_height))
 
         # Label aligned to top-right above the bar
         label = self.font.render(f"{self.multiplier}x", True, color)
-        screen.blit(label, (x + max_bar_width - label.get_width(), y - label.get_height() - 2))
+        label_rect = screen.blit(label, (x + max_bar_width - label.get_width(), y - label.get_height() - 2))
+        return [bar_rect, label_rect]
 
     def draw(self, screen, show_multiplier=True):
         offset = {"minimum": 200, "medium": 300, "maximum": 400}.get(
@@ -103,26 +104,7 @@ class Score:
         high_score_rect = high_score_text.get_rect(center=(config.WIDTH // 2, 30))
         score_rect = score_text.get_rect(topright=(config.WIDTH - 20, high_score_rect.top))
 
-        screen.blit(score_text, score_rect)
-        screen.blit(high_score_text, high_score_rect)
+        rects = [screen.blit(score_text, score_rect), screen.blit(high_score_text, high_score_rect)]
         if show_multiplier:
-            self.draw_multiplier(screen)
-
-    def maybe_save_high_score(self):
-        if self.new_high_score:
-            try:
-                with open(self.HIGHSCORE_PATH, "w") as f:
-                    json.dump({"high_score": self.high_score}, f)
-                print("✅ High score saved")
-            except Exception as e:
-                print(f"⚠️ Failed to save high score: {e}")
-
-    def _load_high_score(self):
-        try:
-            if os.path.exists(self.HIGHSCORE_PATH):
-                with open(self.HIGHSCORE_PATH, "r") as f:
-                    data = json.load(f)
-                    return data.get("high_score", 0)
-        except Exception as e:
-            print(f"⚠️ Failed to load high score: {e}")
-        return 0
+            rects.extend(self.draw_multiplier(screen))
+        return rects
@@ -0,0 +1,70 @@
+"""Resources that live for the whole run of the program, across games"""
+
+import time
+from typing import List, Optional
+
+import pygame
+
+from planetoids.core.config import config
+from planetoids.core.game_state import GameState
+from planetoids.core.logger import logger
+from planetoids.core.settings import Settings
+from planetoids.core.warmup import game_warmup
+from planetoids.ui import StartMenu
+
+class Session:
+    """Owns the window and everything that outlives a single game.
+
+    The display surface, clock, start menu and asset warm-up are created
+    once. The GameState is built for the first game and reset in place for
+    every game after it, so its pause menu, pools and caches are kept too.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self.clock = pygame.time.Clock()
+        self.screen: Optional[pygame.Surface] = None
+        self.warmup = game_warmup((config.WIDTH, config.HEIGHT))
+        self.restart_times: List[float] = []  # Seconds from new_game() to the first frame
+        self._start_menu: Optional[StartMenu] = None
+        self._game_state: Optional[GameState] = None
+        self._game_started_at: Optional[float] = None
+
+    def open_display(self, flags: int = pygame.FULLSCREEN) -> pygame.Surface:
+        """Creates the window the first time it is called and returns it."""
+        if self.screen is None:
+            pygame.mouse.set_visible(False)
+            self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT), flags)
+            pygame.display.set_caption("Planetoids")
+        return self.screen
+
+    @property
+    def start_menu(self) -> StartMenu:
+        """The start menu, built on first use and shown again after every game."""
+        if self._start_menu is None:
+            self._start_menu = StartMenu(self.open_display(), self.clock, self.settings, self.warmup)
+        return self._start_menu
+
+    def finish_warmup(self) -> None:
+        """Prepares whatever the intro and start menu didn't get to."""
+        if not self.warmup.done:
+            self.warmup.finish()
+
+    def new_game(self) -> GameState:
+        """Returns a game ready to play, reusing the last one's resources if there was one."""
+        self._game_started_at = time.perf_counter()
+        if self._game_state is None:
+            self._game_state = GameState(self.open_display(), self.settings, self.clock)
+        else:
+            self._game_state.reset()
+        self._game_state.spawn_asteroids(10)
+        return self._game_state
+
+    def frame_presented(self) -> None:
+        """Records the time to the first frame of a new game."""
+        if self._game_started_at is None:
+            return
+        elapsed = time.perf_counter() - self._game_started_at
+        self._game_started_at = None
+        self.restart_times.append(elapsed)
+        logger.info(f"Game {len(self.restart_times)} ready to first frame in {elapsed * 1000:.1f} ms")
@@ -3,8 +3,13 @@ import os
 from appdirs import user_config_dir
 import sys
 import importlib.resources as pkg_resources
+from functools import lru_cache
 from pathlib import Path
 
+from planetoids.core.logger import logger
+from planetoids.core.persistence import WriteBehindStore
+
+@lru_cache(maxsize=None)
 def get_font_path():
     """Fetch font path inside the installed package safely."""
     if sys.version_info >= (3, 9):
@@ -25,15 +30,21 @@ class Settings:
         "fullscreen_enabled": True,
         "crt_enabled": False,
         "glitch_intensity": "medium",
-        "pixelation": "minimum"
+        "pixelation": "minimum",
+        "asteroid_collisions": False,
+        "dirty_rects": False
     }
 
-    FONT_PATH = get_font_path()
-
     def __init__(self):
         """Initialize settings by loading from file or using defaults."""
+        self._store = WriteBehindStore(self.CONFIG_PATH)
         self._load_settings()
 
+    @property
+    def FONT_PATH(self):
+        """Path to the bundled font, resolved on first use."""
+        return get_font_path()
+
     def _load_settings(self):
         """Loads settings from a JSON file, or creates defaults if missing."""
         if not os.path.exists(self.CONFIG_DIR):
@@ -54,33 +65,37 @@ class Settings:
                 self.data = loaded_data  # Use merged settings
 
             except (json.JSONDecodeError, IOError):
-                print("⚠️ Failed to load settings, using defaults.")
+                logger.warning("Failed to load settings, using defaults.")
                 self.save()  # Save defaults if load fails
 
     def save(self):
-        """Saves settings to a JSON file."""
-        with open(self.CONFIG_PATH, "w") as f:
-            json.dump(self.data, f, indent=4)
+        """Saves settings to a JSON file now, rather than after the write-behind delay."""
+        self._store.schedule(self.data)
+        self._store.flush()
+
+    def flush(self):
+        """Writes any changes that are still waiting to be saved."""
+        self._store.flush()
 
     def get(self, key):
         """Retrieves a setting value safely."""
         return self.data.get(key, self.DEFAULT_SETTINGS.get(key))
 
     def set(self, key, value):
-        """Updates a setting value and marks settings as needing saving."""
+        """Updates a setting value; it is saved in the background shortly after."""
         if key in self.DEFAULT_SETTINGS:
             self.data[key] = value
-            # self.save()
+            self._store.schedule(self.data)
 
     def toggle(self, key):
-        """Toggles a boolean setting, saves it, and returns the new state."""
+        """Toggles a boolean setting, saves it in the background, and returns the new state."""
         if key in self.DEFAULT_SETTINGS and isinstance(self.data[key], bool):
             self.data[key] = not self.data[key]
-            # self.save()
+            self._store.schedule(self.data)
             return self.data[key]  # ✅ Return new state
 
 
     def reset(self):
         """Resets settings to defaults."""
         self.data = self.DEFAULT_SETTINGS.copy()
-        # self.save()
+        self._store.schedule(self.data)
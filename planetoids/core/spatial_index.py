@@ -0,0 +1,74 @@
+"""Uniform grid spatial index for radius queries on the wrapping playfield"""
+
+import math
+from typing import Dict, Iterable, List, Tuple
+
+from planetoids.core.config import config
+
+def wrapped_delta(delta: float, span: float) -> float:
+    """Returns the shortest signed offset along an axis that wraps every span pixels."""
+    half_span = span / 2
+    return (delta + half_span) % span - half_span
+
+class SpatialIndex:
+    """Buckets entities by grid cell so radius queries only visit nearby cells.
+
+    The grid tiles the screen exactly, so a query near one edge also finds
+    entities just across the opposite edge.
+    """
+
+    def __init__(self, cell_size: int = 128, width: int = None, height: int = None) -> None:
+        self.width = width if width is not None else config.WIDTH
+        self.height = height if height is not None else config.HEIGHT
+        self.cols = max(1, self.width // cell_size)
+        self.rows = max(1, self.height // cell_size)
+        # Stretch cells slightly so they divide the screen exactly
+        self.cell_width = self.width / self.cols
+        self.cell_height = self.height / self.rows
+        self._cells: Dict[Tuple[int, int], list] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._cells.values())
+
+    def clear(self) -> None:
+        """Removes every entity from the index."""
+        self._cells.clear()
+
+    def rebuild(self, entities: Iterable) -> None:
+        """Clears the index and inserts every entity at its current position."""
+        self._cells.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity) -> None:
+        """Adds an entity to the cell containing its centre."""
+        col = min(int((entity.x % self.width) / self.cell_width), self.cols - 1)
+        row = min(int((entity.y % self.height) / self.cell_height), self.rows - 1)
+        bucket = self._cells.get((col, row))
+        if bucket is None:
+            self._cells[(col, row)] = [entity]
+        else:
+            bucket.append(entity)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List:
+        """Returns entities whose centres are within radius of (x, y), wrapping at screen edges."""
+        radius_sq = radius * radius
+        width, height = self.width, self.height
+        found = []
+        for col in self._span(x, radius, self.cell_width, self.cols):
+            for row in self._span(y, radius, self.cell_height, self.rows):
+                for entity in self._cells.get((col, row), ()):
+                    dx = wrapped_delta(entity.x - x, width)
+                    dy = wrapped_delta(entity.y - y, height)
+                    if dx * dx + dy * dy <= radius_sq:
+                        found.append(entity)
+        return found
+
+    @staticmethod
+    def _span(center: float, radius: float, cell: float, count: int) -> Iterable[int]:
+        """Returns the wrapped cell indices covered by [center - radius, center + radius]."""
+        first = math.floor((center - radius) / cell)
+        last = math.floor((center + radius) / cell)
+        if last - first + 1 >= count:
+            return range(count)
+        return [index % count for index in range(first, last + 1)]
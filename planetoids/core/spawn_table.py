@@ -0,0 +1,110 @@
+"""Weighted spawn tables compiled into alias tables"""
+
+import importlib.resources
+import json
+import random
+from typing import Dict, List, Sequence, Tuple
+
+from planetoids.core.logger import logger
+
+Curve = List[Tuple[int, float]]
+
+class AliasTable:
+    """Vose alias table: weighted sampling in O(1) after an O(n) build."""
+
+    def __init__(self, items: Sequence, weights: Sequence[float]) -> None:
+        count = len(items)
+        total = sum(weights)
+        if count == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        self.items = list(items)
+        self.probability = [0.0] * count
+        self.alias = [0] * count
+
+        scaled = [weight * count / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever is left is 1 up to rounding error
+        for i in small + large:
+            self.probability[i] = 1.0
+
+    def sample(self):
+        """Returns one item, picked with probability proportional to its weight."""
+        column = int(random.random() * len(self.items))
+        if random.random() < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+class SpawnTable:
+    """Samples spawnable classes with weights that can change with the level.
+
+    Each class's weight is its spawn_chance, unless the spawn weights data
+    file has a curve for it: a list of [level, weight] points, interpolated
+    linearly and held flat past either end. Alias tables are compiled per
+    level and thrown away when the class registry grows.
+    """
+
+    def __init__(self, section: str, curves: Dict[str, Curve] = None) -> None:
+        self.section = section
+        self._curves = curves
+        self._tables: Dict[int, AliasTable] = {}
+        self._registry = None
+        self._registry_size = 0
+        self.compile_count = 0
+
+    @property
+    def curves(self) -> Dict[str, Curve]:
+        """Weight curves by class name, loaded from the data file on first use."""
+        if self._curves is None:
+            self._curves = load_spawn_curves(self.section)
+        return self._curves
+
+    def weight_for(self, spawn_class, level: int) -> float:
+        """Returns a class's spawn weight at the given level."""
+        curve = self.curves.get(spawn_class.__name__)
+        if not curve:
+            return spawn_class.spawn_chance
+        if level <= curve[0][0]:
+            return curve[0][1]
+        for (start_level, start_weight), (end_level, end_weight) in zip(curve, curve[1:]):
+            if level <= end_level:
+                progress = (level - start_level) / (end_level - start_level)
+                return start_weight + (end_weight - start_weight) * progress
+        return curve[-1][1]
+
+    def sample(self, registry: Sequence, level: int = 1):
+        """Returns a class from the registry, weighted for the given level."""
+        if registry is not self._registry or len(registry) != self._registry_size:
+            self._tables.clear()
+            self._registry = registry
+            self._registry_size = len(registry)
+
+        table = self._tables.get(level)
+        if table is None:
+            table = self._compile(registry, level)
+        return table.sample()
+
+    def _compile(self, registry: Sequence, level: int) -> AliasTable:
+        weights = [self.weight_for(spawn_class, level) for spawn_class in registry]
+        table = AliasTable(registry, weights)
+        self._tables[level] = table
+        self.compile_count += 1
+        logger.debug(f"Compiled {self.section} spawn table for level {level}")
+        return table
+
+def load_spawn_curves(section: str) -> Dict[str, Curve]:
+    """Loads the weight curves for one section of spawn_weights.json."""
+    with importlib.resources.open_text("planetoids.core", "spawn_weights.json") as f:
+        data = json.load(f)
+    return {
+        name: sorted((int(level), float(weight)) for level, weight in points)
+        for name, points in data.get(section, {}).items()
+    }
@@ -0,0 +1,45 @@
+"""Sort-and-sweep broadphase for entity-versus-entity collisions"""
+
+from typing import List, Sequence, Tuple
+
+class SweepAndPrune:
+    """Finds entities whose bounding boxes overlap by sweeping along the x axis.
+
+    The sorted order is kept between frames. Entities only move a few pixels
+    per frame, so the list is almost sorted already and Python's adaptive
+    sort restores it in close to linear time. Entities need x, y and size
+    attributes, with size used as the half-width of the box.
+    """
+
+    def __init__(self) -> None:
+        self._order: List = []
+        self._members = set()
+
+    def update(self, entities: Sequence) -> None:
+        """Syncs the tracked entities and re-sorts them by their left edge."""
+        current = set(entities)
+        if current != self._members:
+            # Keep survivors in their old order so the sort stays cheap
+            self._order = [entity for entity in self._order if entity in current]
+            self._order.extend(entity for entity in entities if entity not in self._members)
+            self._members = current
+        self._order.sort(key=_left_edge)
+
+    def pairs(self) -> List[Tuple]:
+        """Returns every pair of entities whose bounding boxes overlap."""
+        found = []
+        active = []
+        for entity in self._order:
+            left = entity.x - entity.size
+            # Drop entities that end before this one starts
+            active = [other for other in active if other.x + other.size >= left]
+            top = entity.y - entity.size
+            bottom = entity.y + entity.size
+            for other in active:
+                if other.y - other.size <= bottom and other.y + other.size >= top:
+                    found.append((other, entity))
+            active.append(entity)
+        return found
+
+def _left_edge(entity) -> float:
+    return entity.x - entity.size
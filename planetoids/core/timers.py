@@ -0,0 +1,86 @@
+"""Gameplay timers that run on simulation time"""
+
+import heapq
+import itertools
+from typing import Callable, List, Optional, Tuple
+
+class Timer:
+    """A callback or expiry due at a point in simulation time."""
+
+    __slots__ = ("scheduler", "due", "callback", "cancelled", "fired")
+
+    def __init__(self, scheduler: "TimerScheduler", due: float, callback: Optional[Callable[[], None]]) -> None:
+        self.scheduler = scheduler
+        self.due = due
+        self.callback = callback
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def pending(self) -> bool:
+        """True until the timer fires or is cancelled."""
+        return not (self.fired or self.cancelled)
+
+    @property
+    def remaining(self) -> float:
+        """Simulation seconds left before the timer fires, 0 once it is done."""
+        if not self.pending:
+            return 0.0
+        return max(0.0, self.due - self.scheduler.now)
+
+    def cancel(self) -> None:
+        """Stops the timer from firing."""
+        self.cancelled = True
+
+class TimerScheduler:
+    """Fires timers as simulation time advances.
+
+    Time only moves when the game calls advance() with its frame delta,
+    so timers stop while the game is paused and a headless run can jump
+    ahead by any amount. Timers wait in a heap ordered by due time;
+    scheduling costs O(log n) and advancing only looks at timers that
+    are due. Cancelled timers are dropped when they reach the top.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._order = itertools.count()  # Keeps timers due together in scheduling order
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, timer in self._heap if timer.pending)
+
+    def schedule(self, delay: float, callback: Optional[Callable[[], None]] = None) -> Timer:
+        """Returns a timer that fires `delay` seconds from now.
+
+        Without a callback the timer only marks an expiry, to be checked
+        through pending or remaining.
+        """
+        timer = Timer(self, self.now + max(0.0, delay), callback)
+        heapq.heappush(self._heap, (timer.due, next(self._order), timer))
+        return timer
+
+    def advance(self, dt: float) -> None:
+        """Moves time forward by dt seconds and fires every timer that comes due.
+
+        Each callback sees `now` set to its own due time, so timers that
+        are scheduled from a callback fire correctly within the same step.
+        """
+        target = self.now + dt
+        heap = self._heap
+        while heap and heap[0][0] <= target:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                continue
+            self.now = max(self.now, timer.due)
+            timer.fired = True
+            if timer.callback is not None:
+                timer.callback()
+        self.now = target
+
+    def clear(self) -> None:
+        """Cancels every timer and winds the clock back to zero."""
+        for _, _, timer in self._heap:
+            timer.cancel()
+        self._heap = []
+        self.now = 0.0
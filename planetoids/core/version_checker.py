@@ -1,27 +1,126 @@
-import urllib.request
+import json
+import os
+import re
 import threading
+import time
+import urllib.request
+from typing import Callable, List, Optional
+
+from planetoids.core.logger import logger
+from planetoids.core.persistence import write_json_atomic
+from planetoids.core.settings import Settings
 
 GITHUB_VERSION_URL = "https://raw.githubusercontent.com/chris-greening/planetoids/refs/heads/main/planetoids/core/version.txt"
 
-def check_for_update(current_version, callback):
-    """Checks GitHub for latest version and triggers callback if newer version exists."""
-    def _check():
+def fetch_url(url, timeout):
+    """Downloads the latest version number."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read().decode("utf-8").strip()
+
+class VersionCheckService:
+    """Looks up the latest released version at most once per TTL.
+
+    The result and when it was fetched are saved in the config dir, so
+    later runs and restarts answer from the cache without a thread or a
+    request. When the cache is stale a single worker fetches the version;
+    checks made while it is running just wait for its answer.
+    """
+
+    TTL = 24 * 60 * 60  # Seconds
+    CACHE_NAME = "version_check.json"
+
+    def __init__(
+            self, fetch: Callable[[str, float], str] = fetch_url, url: str = GITHUB_VERSION_URL,
+            ttl: float = TTL, cache_path: Optional[str] = None, timeout: float = 2
+        ) -> None:
+        self.fetch = fetch
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self._cache_path = cache_path
+        self._cache: Optional[dict] = None
+        self._lock = threading.Lock()
+        self._waiting: List[tuple] = []
+        self._worker: Optional[threading.Thread] = None
+        self._last_worker: Optional[threading.Thread] = None
+
+    @property
+    def cache_path(self) -> str:
+        return self._cache_path or os.path.join(Settings.CONFIG_DIR, self.CACHE_NAME)
+
+    def check(self, current_version: str, callback: Callable[[str], None]) -> None:
+        """Calls callback(latest) if a newer version than current_version is out.
+
+        Answers straight away from a fresh cache, otherwise once the worker
+        has fetched the version, on the worker's thread.
+        """
+        with self._lock:
+            cache = self._load_cache()
+            if time.time() - cache.get("checked_at", 0) < self.ttl:
+                _notify_if_newer(cache.get("latest"), current_version, callback)
+                return
+
+            self._waiting.append((current_version, callback))
+            if self._worker is None:
+                self._worker = self._last_worker = threading.Thread(
+                    target=self._run, name="version-check", daemon=True
+                )
+                self._worker.start()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Blocks until the last check has finished and called back."""
+        worker = self._last_worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            latest = self.fetch(self.url, self.timeout)
+            logger.info(f"Latest version: {latest}")
+        except Exception as e:  # Offline or GitHub unreachable; try again after the TTL
+            logger.info(f"Version check failed: {e}")
+            latest = None
+
+        with self._lock:
+            cache = {"latest": latest or self._load_cache().get("latest"), "checked_at": time.time()}
+            self._save_cache(cache)
+            waiting, self._waiting = self._waiting, []
+            self._worker = None
+
+        for current_version, callback in waiting:
+            _notify_if_newer(cache["latest"], current_version, callback)
+
+    def _load_cache(self) -> dict:
+        if self._cache is None:
+            try:
+                with open(self.cache_path, "r") as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self, cache: dict) -> None:
+        self._cache = cache
         try:
-            with urllib.request.urlopen(GITHUB_VERSION_URL, timeout=2) as response:
-                latest = response.read().decode("utf-8").strip()
-                print(f"Latest version: {latest}")
-                if _is_newer_version(latest, current_version):
-                    callback(latest)
-                    print(f"New version available: {latest}")
-        except Exception as e:
-            pass  # Fail silently, especially if offline
-            print(e)
-
-    threading.Thread(target=_check, daemon=True).start()
-
-def _is_newer_version(remote, local):
-    """Compare semantic versions like '0.2.1' and '0.3.0'."""
-    newer_version = False
-    if remote != local:
-        newer_version = True
-    return newer_version
+            write_json_atomic(self.cache_path, cache)
+        except OSError as e:
+            logger.warning(f"Failed to save version check: {e}")
+
+def _notify_if_newer(latest, current_version, callback):
+    if latest and is_newer_version(latest, current_version):
+        logger.info(f"New version available: {latest}")
+        callback(latest)
+
+def is_newer_version(remote, local):
+    """Compare semantic versions like '0.2.1' and '0.10.0' numerically."""
+    return _version_key(remote) > _version_key(local)
+
+def _version_key(version):
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+# Global instance
+version_checks = VersionCheckService()
+
+def check_for_update(current_version, callback):
+    """Checks for a newer version and triggers callback if there is one."""
+    version_checks.check(current_version, callback)
@@ -0,0 +1,122 @@
+"""Prepares fonts and effect caches in small slices of otherwise idle frame time"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+from planetoids.core.config import config
+from planetoids.core.fonts import warm_font
+from planetoids.core.logger import logger
+from planetoids.effects import crt_effect
+from planetoids.effects.effect_cache import AURA_PHASES, GLOW_PHASES, GLOW_VARIANTS, effect_cache
+from planetoids.effects.explosion_sheets import explosion_bank
+from planetoids.entities.powerups import PowerUp, QuadShotPowerUp, RicochetShotPowerUp, TrishotPowerUp
+from planetoids.entities.shape_templates import STANDARD_SIZES, shape_templates
+
+# Every size the game asks get_font() for
+FONT_SIZES = (32, 36, 48, 64, 120, 200, 256)
+
+class WarmupScheduler:
+    """Runs named preparation tasks a few milliseconds at a time.
+
+    Screens that spend most of each frame waiting on the clock call
+    run_slice() once per frame to hand that time over. A task is a
+    callable; if it returns an iterator, the iterator is stepped across
+    slices so long jobs don't stall a frame. finish() runs whatever is
+    left before gameplay starts.
+    """
+
+    def __init__(self, budget_ms: float = 8.0) -> None:
+        self.budget_ms = budget_ms
+        self.prepared: List[Tuple[str, float]] = []
+        self._tasks = deque()
+        self._spent: Dict[str, float] = {}
+
+    @property
+    def done(self) -> bool:
+        return not self._tasks
+
+    @property
+    def pending(self) -> List[str]:
+        """Names of the tasks that haven't finished yet."""
+        return [name for name, _ in self._tasks]
+
+    def add(self, name: str, task: Callable) -> None:
+        """Queues a task to run in a later slice."""
+        self._tasks.append([name, task])
+        self._spent[name] = 0.0
+
+    def run_slice(self, budget_ms: float = None) -> bool:
+        """Runs tasks until the budget is spent; returns True once everything is prepared."""
+        budget = self.budget_ms if budget_ms is None else budget_ms
+        deadline = time.perf_counter() + budget / 1000
+        while self._tasks:
+            self._step()
+            if time.perf_counter() >= deadline:
+                break
+        return self.done
+
+    def finish(self) -> None:
+        """Runs every remaining task and logs the report."""
+        while self._tasks:
+            self._step()
+        logger.info(self.report())
+
+    def report(self) -> str:
+        """Lists what was prepared, how long each item took and what is still missing."""
+        total_ms = sum(seconds for _, seconds in self.prepared) * 1000
+        lines = [f"Warm-up prepared {len(self.prepared)} items in {total_ms:.1f} ms"]
+        lines += [f"  {name}: {seconds * 1000:.1f} ms" for name, seconds in self.prepared]
+        pending = self.pending
+        lines.append(f"  still missing: {', '.join(pending) if pending else 'nothing'}")
+        return "\n".join(lines)
+
+    def _step(self) -> None:
+        entry = self._tasks[0]
+        name, work = entry
+        start = time.perf_counter()
+        if hasattr(work, "__next__"):
+            try:
+                next(work)
+                finished = False
+            except StopIteration:
+                finished = True
+        else:
+            result = work()
+            finished = not hasattr(result, "__next__")
+            entry[1] = result  # Step the iterator from the next call on
+        self._spent[name] += time.perf_counter() - start
+
+        if finished:
+            self._tasks.popleft()
+            self.prepared.append((name, self._spent[name]))
+
+def game_warmup(size: Tuple[int, int]) -> WarmupScheduler:
+    """Builds a scheduler that prepares everything the first game frames would otherwise build."""
+    warmup = WarmupScheduler()
+    for font_size in FONT_SIZES:
+        warmup.add(f"font {font_size}", lambda font_size=font_size: warm_font(font_size))
+    warmup.add("crt overlays", lambda: crt_effect.prepare(size))
+    for shape_size in STANDARD_SIZES:
+        warmup.add(f"shapes {shape_size}", lambda shape_size=shape_size: shape_templates.prepare((shape_size,)))
+    warmup.add("explosions", explosion_bank.prepare_steps)
+    for powerup in PowerUp.get_powerups():
+        warmup.add(f"glow {powerup.__name__}", lambda color=powerup.color: _warm_glow(color))
+    for powerup in (RicochetShotPowerUp, QuadShotPowerUp, TrishotPowerUp):
+        warmup.add(f"aura {powerup.__name__}", lambda color=powerup.color: _warm_aura(color))
+    warmup.add("shield rings", _warm_rings)
+    return warmup
+
+def _warm_glow(color, radius=20):
+    for pulse_step in range(GLOW_PHASES):
+        for variant in range(GLOW_VARIANTS):
+            effect_cache.get("glow", color, radius, (pulse_step, variant))
+
+def _warm_aura(color, radius=50):
+    for phase in range(AURA_PHASES):
+        effect_cache.get("aura", color, radius, phase)
+
+def _warm_rings():
+    for size in STANDARD_SIZES:
+        for alpha in (200, 100):
+            effect_cache.get("ring", config.CYAN, size + 12, alpha)
@@ -0,0 +1,78 @@
+"""Builds upcoming asteroid waves ahead of time"""
+
+import random
+from typing import List, NamedTuple, Type
+
+from planetoids.core.config import config
+from planetoids.core.logger import logger
+
+class AsteroidSpec(NamedTuple):
+    """Everything needed to spawn one asteroid of a wave."""
+    asteroid_class: Type
+    x: int
+    y: int
+
+class WaveGenerator:
+    """Prepares the next level's wave a few asteroids per frame.
+
+    asteroid_type_picker is called with the wave's level and returns the
+    class of each asteroid.
+
+    step() is called on ordinary frames of the current level, so by the
+    time the map is cleared the whole wave is usually waiting and take()
+    just hands the list over.
+    """
+
+    def __init__(self, asteroid_type_picker, specs_per_frame: int = 2) -> None:
+        self.asteroid_type_picker = asteroid_type_picker
+        self.specs_per_frame = specs_per_frame
+        self.level = None
+        self.generated_on_take = 0  # Specs take() had to build itself
+        self._wave: List[AsteroidSpec] = []
+        self._target = 0
+
+    @staticmethod
+    def wave_size(level: int) -> int:
+        """Returns how many asteroids spawn when a level starts."""
+        return 5 + level * 2
+
+    def begin(self, level: int) -> None:
+        """Starts building the wave for the given level."""
+        self.level = level
+        self._wave = []
+        self._target = self.wave_size(level)
+        logger.info(f"Preparing wave of {self._target} asteroids for level {level}")
+
+    def is_ready(self) -> bool:
+        """Returns True once every asteroid of the wave has been prepared."""
+        return self.level is not None and len(self._wave) >= self._target
+
+    def step(self) -> None:
+        """Prepares up to specs_per_frame more asteroids of the wave."""
+        if self.level is None:
+            return
+        for _ in range(min(self.specs_per_frame, self._target - len(self._wave))):
+            self._wave.append(self._make_spec())
+
+    def take(self, level: int) -> List[AsteroidSpec]:
+        """Hands over the finished wave for the given level.
+
+        If the wave isn't finished (or was built for another level) the
+        rest is built on the spot, which is the slow path step() avoids.
+        """
+        if self.level != level:
+            self.begin(level)
+        self.generated_on_take = max(0, self._target - len(self._wave))
+        for _ in range(self.generated_on_take):
+            self._wave.append(self._make_spec())
+
+        wave, self._wave = self._wave, []
+        self.level = None
+        return wave
+
+    def _make_spec(self) -> AsteroidSpec:
+        return AsteroidSpec(
+            self.asteroid_type_picker(self.level),
+            random.randint(0, config.WIDTH),
+            random.randint(0, config.HEIGHT),
+        )
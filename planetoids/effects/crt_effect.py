@@ -2,6 +2,17 @@ import random
 
 import pygame
 
+# Full-screen overlays that never change for a given screen size
+_scanline_masks = {}
+_flicker_masks = {}
+_static_surfaces = {}
+
+def prepare(size):
+    """Builds the full-screen overlays for a screen size ahead of time."""
+    _scanline_mask(size)
+    _flicker_mask(size)
+    _static_surface(size)
+
 def apply_crt_effect(screen, intensity="medium", pixelation="minimum"):
     """Apply CRT effect to the screen."""
     _apply_scanlines(screen)
@@ -12,13 +23,38 @@ def apply_crt_effect(screen, intensity="medium", pixelation="minimum"):
 
 def _apply_scanlines(screen):
     """Draws horizontal scanlines to simulate an old CRT screen."""
-    width, height = screen.get_size()
-    scanline_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-
-    for y in range(0, height, 4):  # Every 4 pixels (adjust for intensity)
-        pygame.draw.line(scanline_surface, (0, 0, 0, 60), (0, y), (width, y))  # Semi-transparent black
-
-    screen.blit(scanline_surface, (0, 0))
+    screen.blit(_scanline_mask(screen.get_size()), (0, 0))
+
+def _scanline_mask(size):
+    mask = _scanline_masks.get(size)
+    if mask is None:
+        width, height = size
+        mask = pygame.Surface((width, height), pygame.SRCALPHA)
+        for y in range(0, height, 4):  # Every 4 pixels (adjust for intensity)
+            pygame.draw.line(mask, (0, 0, 0, 60), (0, y), (width, y))  # Semi-transparent black
+        mask = _scanline_masks[size] = _convert(mask)
+    return mask
+
+def _flicker_mask(size):
+    mask = _flicker_masks.get(size)
+    if mask is None:
+        mask = pygame.Surface(size, pygame.SRCALPHA)
+        mask.fill((255, 255, 255, 5))  # Slight white overlay
+        mask = _flicker_masks[size] = _convert(mask)
+    return mask
+
+def _static_surface(size):
+    """Returns the reusable rolling-static overlay, cleared for drawing."""
+    surface = _static_surfaces.get(size)
+    if surface is None:
+        surface = _static_surfaces[size] = _convert(pygame.Surface(size, pygame.SRCALPHA))
+    surface.fill((0, 0, 0, 0))
+    return surface
+
+def _convert(surface):
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
 
 def _apply_pixelation(screen, pixelation):
     """Reduces resolution slightly to create a pixelated effect."""
@@ -30,9 +66,7 @@ def _apply_pixelation(screen, pixelation):
 def _apply_flicker(screen):
     """Adds a subtle flicker to simulate an old CRT glow effect."""
     if random.randint(0, 20) == 0:  # 10% chance per frame
-        flicker_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        flicker_surface.fill((255, 255, 255, 5))  # Slight white overlay
-        screen.blit(flicker_surface, (0, 0))
+        screen.blit(_flicker_mask(screen.get_size()), (0, 0))
 
 def _apply_glow(screen):
     """Creates a soft glow effect by blurring bright pixels."""
@@ -88,7 +122,7 @@ def _add_color_separation(screen, glitch_surface, intensity):
 def _add_rolling_static(screen, height, width, intensity):
     static_chance = {"minimum": 0.1, "medium": 0.3, "maximum": 0.8}.get(intensity, 0.2)
 
-    static_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    static_surface = _static_surface((width, height))
     for y in range(0, height, 8):
         if random.random() < static_chance:
             pygame.draw.line(static_surface, (255, 255, 255, random.randint(30, 80)), (0, y), (width, y))
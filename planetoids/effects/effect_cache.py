@@ -0,0 +1,113 @@
+"""Pre-rendered frames for pulsing glow, ring and aura effects"""
+
+import math
+import random
+
+import pygame
+
+from planetoids.core.logger import logger
+
+GLOW_PHASES = 8  # Steps in the power-up glow's pulse
+GLOW_VARIANTS = 3  # Tendril patterns flickered between each frame
+AURA_PHASES = 16  # Steps in the player aura's pulse
+
+def phase_bucket(ticks, rate, buckets):
+    """Quantises a sin(ticks * rate) animation into one of `buckets` steps."""
+    cycle = (ticks * rate / math.tau) % 1.0
+    return int(cycle * buckets) % buckets
+
+class EffectCache:
+    """Holds effect surfaces keyed by (effect, colour, radius, phase bucket).
+
+    Each frame is rendered the first time it is asked for and reused
+    afterwards, so drawing an effect during play is a lookup and a blit.
+    The full-screen tint is one opaque surface per size and colour whose
+    surface alpha is changed instead of being refilled.
+    """
+
+    def __init__(self):
+        self._frames = {}
+        self._tints = {}
+        self.renders = 0
+
+    def __len__(self):
+        return len(self._frames)
+
+    def get(self, effect, color, radius, phase):
+        """Returns the surface for one frame of an effect."""
+        key = (effect, color, radius, phase)
+        surface = self._frames.get(key)
+        if surface is None:
+            surface = self._frames[key] = _convert(_RENDERERS[effect](color, radius, phase))
+            self.renders += 1
+        return surface
+
+    def tint(self, size, color, alpha):
+        """Returns a full-screen tint surface with its alpha set."""
+        key = (size, color)
+        surface = self._tints.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            surface.fill(color)
+            self._tints[key] = surface
+        surface.set_alpha(alpha)
+        return surface
+
+    def clear(self):
+        """Drops every cached frame."""
+        logger.info(f"Clearing {len(self._frames)} effect frames")
+        self._frames.clear()
+        self._tints.clear()
+
+def _convert(surface):
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+def _render_glow(color, radius, phase):
+    """Power-up glow: flickering tendrils over a pulsing halo."""
+    pulse_step, variant = phase
+    pulse = 2 + (math.sin(math.tau * pulse_step / GLOW_PHASES) * 2)  # Subtle pulsing
+    rng = random.Random(variant)  # Same pattern for every colour and pulse step
+    glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+    center = (radius * 2, radius * 2)
+
+    for _ in range(5):
+        if rng.random() < 0.7:
+            angle = rng.uniform(0, math.tau)
+            length = rng.uniform(radius, radius * 2.5)
+            end_x = center[0] + math.cos(angle) * length
+            end_y = center[1] + math.sin(angle) * length
+
+            line_color = (*color, rng.randint(50, 180))
+            pygame.draw.line(glow_surface, line_color, center, (end_x, end_y), rng.randint(1, 3))
+            for i in range(4):
+                alpha = max(0, 150 - (i * 40))
+                pygame.draw.circle(glow_surface, (*color, alpha), center, int(radius + pulse + (i * 2)))
+    return glow_surface
+
+def _render_ring(color, radius, alpha):
+    """Shield ring: a translucent circle outline."""
+    ring_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(ring_surface, (*color[:3], alpha), (radius, radius), radius, 4)
+    return ring_surface
+
+def _render_aura(color, radius, phase):
+    """Player aura: a soft disc that swells and brightens with the pulse."""
+    pulse_factor = 1 + 0.1 * math.sin(math.tau * phase / AURA_PHASES)
+    aura_radius = int(radius * pulse_factor)
+    alpha = int(100 + 40 * pulse_factor)  # Opacity range: 100 - 140
+    aura_surface = pygame.Surface((aura_radius * 2, aura_radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(aura_surface, (*color[:3], alpha), (aura_radius, aura_radius), aura_radius)
+    return aura_surface
+
+_RENDERERS = {
+    "glow": _render_glow,
+    "ring": _render_ring,
+    "aura": _render_aura,
+}
+
+# Global instance
+effect_cache = EffectCache()
@@ -0,0 +1,126 @@
+"""Particle clouds for explosions, baked into frame sequences ahead of time"""
+
+import math
+import random
+from types import SimpleNamespace
+
+import pygame
+
+from planetoids.core.logger import logger
+from planetoids.entities.particle import Particle
+
+# Particles read dt from the game state; bakes always step one 60 FPS frame
+_FIXED_STEP = SimpleNamespace(dt=1 / 60)
+
+class ExplosionSheet:
+    """One baked particle-cloud animation.
+
+    Each frame is cropped to the pixels it uses and stored with its offset
+    from the explosion's centre, so playing it back is a single blit.
+    """
+
+    __slots__ = ("frames",)
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame_rect(self, x, y, frame):
+        """Returns the screen rect covered by a frame, or None once the cloud is gone."""
+        if not 0 <= frame < len(self.frames):
+            return None
+        surface, (offset_x, offset_y) = self.frames[frame]
+        return surface.get_rect(topleft=(int(x + offset_x), int(y + offset_y)))
+
+    def draw(self, screen, x, y, frame):
+        """Blits one frame of the animation centred on (x, y)."""
+        if 0 <= frame < len(self.frames):
+            surface, (offset_x, offset_y) = self.frames[frame]
+            screen.blit(surface, (x + offset_x, y + offset_y))
+
+class ExplosionBank:
+    """Bakes a few random particle clouds per kind of explosion and hands them out.
+
+    The clouds only depend on the explosion's kind and clipping radius, not
+    on the size of what exploded, so a handful of variants covers every
+    explosion in the game.
+    """
+
+    # Particle count and speed range match the live effects they replace
+    KINDS = {
+        "asteroid": (40, (2, 5)),
+        "player": (15, (1, 3)),
+    }
+
+    def __init__(self, variants=3):
+        self.variants = variants
+        self._sheets = {}
+
+    def get(self, kind, clip_radius=None):
+        """Returns a random baked cloud for the kind, baking it on first use."""
+        sheets = self._sheets.get((kind, clip_radius))
+        if sheets is None:
+            sheets = self._bake(kind, clip_radius)
+        return random.choice(sheets)
+
+    def prepare(self, clip_radius=200):
+        """Bakes the asteroid and player clouds ahead of time."""
+        for _ in self.prepare_steps(clip_radius):
+            pass
+
+    def prepare_steps(self, clip_radius=200):
+        """Bakes like prepare(), yielding after each sheet so the work can be spread over frames."""
+        for kind, radius in (("asteroid", clip_radius), ("player", None)):
+            if (kind, radius) in self._sheets:
+                continue
+            sheets = []
+            for _ in range(self.variants):
+                sheets.append(self._bake_sheet(kind, radius))
+                yield
+            self._store(kind, radius, sheets)
+
+    def _bake(self, kind, clip_radius):
+        sheets = [self._bake_sheet(kind, clip_radius) for _ in range(self.variants)]
+        return self._store(kind, clip_radius, sheets)
+
+    def _bake_sheet(self, kind, clip_radius):
+        count, speed_range = self.KINDS[kind]
+        return ExplosionSheet(_bake_frames(count, speed_range, clip_radius))
+
+    def _store(self, kind, clip_radius, sheets):
+        self._sheets[(kind, clip_radius)] = sheets
+        logger.info(f"Baked {len(sheets)} {kind} explosion sheets")
+        return sheets
+
+def _bake_frames(count, speed_range, clip_radius):
+    """Simulates one cloud frame by frame and crops each frame to its pixels."""
+    # Furthest a particle can get, plus its blit size, sets the canvas size
+    reach = int(speed_range[1] * 0.5 * 40 + 10)
+    particles = [
+        Particle(reach, reach, random.uniform(0, 360), random.uniform(*speed_range), _FIXED_STEP)
+        for _ in range(count)
+    ]
+    convert = pygame.display.get_surface() is not None
+
+    frames = []
+    while any(particle.lifetime > 0 and particle.alpha > 0 for particle in particles):
+        canvas = pygame.Surface((reach * 2, reach * 2), pygame.SRCALPHA)
+        for particle in particles:
+            distance = math.hypot(particle.x - reach, particle.y - reach)
+            if clip_radius is None or distance <= clip_radius:
+                particle.draw(canvas)
+
+        rect = canvas.get_bounding_rect()
+        frame = canvas.subsurface(rect).copy()
+        if convert:
+            frame = frame.convert_alpha()
+        frames.append((frame, (rect.x - reach, rect.y - reach)))
+
+        for particle in particles:
+            particle.update()
+    return frames
+
+# Global instance
+explosion_bank = ExplosionBank()
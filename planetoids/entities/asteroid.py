@@ -4,16 +4,29 @@ import math
 import pygame
 
 from planetoids.core.config import config
+from planetoids.core.spawn_table import SpawnTable
 from planetoids.entities.particle import Particle
 from planetoids.core.logger import logger
 from planetoids.entities.debris import Debris
+from planetoids.entities.shape_templates import ShapeBuffer, shape_templates
+from planetoids.effects.effect_cache import effect_cache
+from planetoids.effects.explosion_sheets import explosion_bank
 
 class Asteroid:
     asteroid_types = []
     spawn_chance = 1.0
+    color = config.WHITE
+    rotation_frames = 1
 
     def __init__(self, game_state, x=None, y=None, size=120, stage=3):
         """Initialize an asteroid with position, size, and split stage."""
+        self._shape_buffer = ShapeBuffer()
+        self.sprite_key = None
+        self.reset(game_state, x, y, size, stage)
+
+    def reset(self, game_state, x=None, y=None, size=120, stage=3):
+        """Reinitialises the asteroid in place so pooled instances can be reused."""
+        self.release_sprite()
         self.game_state = game_state
         self.x = x if x is not None else random.randint(0, config.WIDTH)
         self.y = y if y is not None else random.randint(0, config.HEIGHT)
@@ -24,11 +37,21 @@ class Asteroid:
         self.base_speed = random.uniform(2, 4)  # Normal speed
         self.speed = self.base_speed  # Current speed (adjusted by slowdown)
 
-        # Generate shape *once* and store relative offsets
-        self.shape_offsets = self._generate_jagged_shape()
-        self.update_shape()
+        # Shapes come from a shared bank of read-only outlines
+        self.template = shape_templates.get(size, self.sides)
+        self.shape_offsets = self.template.offsets
+        self.collision_shape = self.template.collision_shape
+        self.sprite_key = game_state.asteroid_sprites.acquire(
+            self.template, self.color, self.rotation_frames
+        )
 
-        logger.info(f"Spawned {repr(self)}")
+        logger.debug(f"Spawned {repr(self)}")
+
+    def release_sprite(self):
+        """Lets go of the cached outline so it can be evicted once unused."""
+        if self.sprite_key is not None:
+            self.game_state.asteroid_sprites.release(self.sprite_key)
+            self.sprite_key = None
 
     def __new__(cls, *args, **kwargs):
         """Ensures the base class registers itself on first reference"""
@@ -51,12 +74,14 @@ class Asteroid:
             new_size = self.size // 2
             new_stage = self.stage - 1
 
-            asteroid_class_1 = self.get_asteroid_type()
-            asteroid_class_2 = self.get_asteroid_type()
+            level = self.game_state.level.get_level()
+            asteroid_class_1 = self.get_asteroid_type(level)
+            asteroid_class_2 = self.get_asteroid_type(level)
 
-            asteroid1 = asteroid_class_1(self.game_state, self.x + random.randint(-5, 5), self.y + random.randint(-5, 5), size=new_size, stage=new_stage)
-            asteroid2 = asteroid_class_2(self.game_state, self.x + random.randint(-5, 5), self.y + random.randint(-5, 5), size=new_size, stage=new_stage)
-            logger.info(f"Asteroid {self} split into {asteroid1} and {asteroid2}")
+            pool = self.game_state.asteroid_pool
+            asteroid1 = pool.acquire(asteroid_class_1, self.game_state, self.x + random.randint(-5, 5), self.y + random.randint(-5, 5), size=new_size, stage=new_stage)
+            asteroid2 = pool.acquire(asteroid_class_2, self.game_state, self.x + random.randint(-5, 5), self.y + random.randint(-5, 5), size=new_size, stage=new_stage)
+            logger.debug(f"Asteroid {self} split into {asteroid1} and {asteroid2}")
             # self.game_state.spawn_asteroid_fragments(self)  # Keep normal splitting behavior
 
             asteroids = [asteroid1, asteroid2]
@@ -70,28 +95,18 @@ class Asteroid:
         return asteroids
 
     @classmethod
-    def get_asteroid_type(cls):
-        """Selects an asteroid type based on weighted probabilities"""
-        asteroid_classes = cls.asteroid_types
-        weights = [subclass.spawn_chance for subclass in asteroid_classes]
-        return random.choices(asteroid_classes, weights=weights, k=1)[0]
-
-    def _generate_jagged_shape(self):
-        """Creates a jagged asteroid shape with fixed offsets."""
-        jitter_amount = self.size // 3  # Edge variation
-        offsets = []
-        for i in range(self.sides):
-            angle = (i / self.sides) * 2 * math.pi
-            jitter = random.randint(-jitter_amount, jitter_amount)
-            radius = self.size + jitter
-            x_offset = math.cos(angle) * radius
-            y_offset = math.sin(angle) * radius
-            offsets.append((x_offset, y_offset))
-        return offsets  # Store relative offsets so shape remains constant
-
-    def update_shape(self):
-        """Update shape based on current position while keeping offsets constant."""
-        self.shape = [(self.x + ox, self.y + oy) for ox, oy in self.shape_offsets]
+    def get_asteroid_type(cls, level=1):
+        """Selects an asteroid type based on weighted probabilities for the level"""
+        return asteroid_spawn_table.sample(cls.asteroid_types, level)
+
+    @property
+    def shape(self):
+        """World-space outline, only recomputed when the asteroid has moved since the last read."""
+        return self._shape_buffer.get(self.template, self.x, self.y)
+
+    def to_local(self, dx, dy):
+        """Maps an offset from the asteroid's centre into its collision shape's space."""
+        return dx, dy
 
     def update(self):
         """Moves the asteroid across the screen with delta time scaling, applying slowdown if active."""
@@ -117,12 +132,10 @@ class Asteroid:
         elif self.y > config.HEIGHT + self.size:
             self.y = -self.size
 
-        # Update shape based on new position without changing offsets
-        self.update_shape()
-
     def draw(self, screen):
-        """Draw the asteroid with an outline (wireframe)."""
-        pygame.draw.polygon(screen, config.WHITE, self.shape, 4)
+        """Draw the asteroid's pre-rasterised outline."""
+        sprite, half = self.game_state.asteroid_sprites.get(self.sprite_key)
+        screen.blit(sprite, (self.x - half, self.y - half))
 
     def __repr__(self):
         return f"{self.__class__.__name__}(x={round(self.x)}, y={round(self.y)}, size={self.size}, stage={self.stage})"
@@ -134,6 +147,9 @@ class FastAsteroid(Asteroid):
 
     def __init__(self, game_state, x=None, y=None, size=80, stage=3):
         super().__init__(game_state, x, y, size, stage)
+
+    def reset(self, game_state, x=None, y=None, size=80, stage=3):
+        super().reset(game_state, x, y, size, stage)
         self.base_speed *= self.speed_multiplier  # Increase speed
         self.trail = []  # Stores previous positions for motion blur
 
@@ -145,10 +161,6 @@ class FastAsteroid(Asteroid):
 
         super().update()
 
-    def draw(self, screen):
-        """Draws the asteroid with a motion blur effect."""
-        pygame.draw.polygon(screen, FastAsteroid.color, self.shape, 4)
-
     def __init_subclass__(cls, **kwargs):
         """Ensures all children of FastAsteroid inherit speed boost."""
         super().__init_subclass__(**kwargs)
@@ -157,23 +169,45 @@ class FastAsteroid(Asteroid):
 class ExplodingAsteroid(Asteroid):
     """Asteroid that explodes, destroying nearby asteroids and playing an explosion animation."""
     spawn_chance = 0.08
+    color = config.ORANGE
+    explosion_duration = 40  # Frames
+    # Simulate the particle cloud instead of playing a baked one
+    live_particles = False
 
     def __init__(self, game_state, x=None, y=None, size=80, stage=3, explosion_radius=200):  # Bigger explosion
-        super().__init__(game_state, x, y, size, stage)
         self.explosion_radius = explosion_radius
+        self._explosion = None
+        super().__init__(game_state, x, y, size, stage)
+
+    def reset(self, game_state, x=None, y=None, size=80, stage=3):
+        super().reset(game_state, x, y, size, stage)
+        if self._explosion is not None:
+            self._explosion.cancel()  # Pooled mid-explosion
         self.exploding = False
         self.explosion_particles = []
+        self.explosion_sheet = None
         self.fragments = []
-        self.explosion_timer = 40  # Longer explosion duration
+        self._explosion = None
 
-    def explode(self, asteroids):
-        """Triggers explosion effect and destroys nearby asteroids."""
+    @property
+    def explosion_timer(self):
+        """Frames left of the explosion; the full duration until it starts."""
+        if self._explosion is None:
+            return self.explosion_duration
+        return self._explosion.remaining * 60
+
+    def explode(self, asteroid_index):
+        """Triggers explosion effect and returns asteroids caught in the blast.
+
+        asteroid_index is a SpatialIndex over the live asteroids, so only the
+        grid cells around the blast are searched.
+        """
         if not self.exploding:
             self.exploding = True
+            self._explosion = self.game_state.timers.schedule(self.explosion_duration / 60, self._finish_explosion)
             self._generate_explosion()
 
-        destroyed_asteroids = [a for a in asteroids if self._is_within_explosion_radius(a)]
-        return destroyed_asteroids
+        return asteroid_index.query_radius(self.x, self.y, self.explosion_radius)
 
     def _generate_explosion(self):
         """Generates explosion fragments and particles."""
@@ -190,19 +224,22 @@ class ExplodingAsteroid(Asteroid):
             {"pos": right, "vel": (random.uniform(-4, 4), random.uniform(-4, 4))}
         ]
 
-        # Generate explosion particles (increased amount)
-        self.explosion_particles = [
-            Particle(self.x, self.y, random.uniform(0, 360), random.uniform(2, 5), self.game_state)  # Bigger explosion
-            for _ in range(40)
-        ]
+        if self.live_particles:
+            # Generate explosion particles (increased amount)
+            self.explosion_particles = [
+                Particle(self.x, self.y, random.uniform(0, 360), random.uniform(2, 5), self.game_state)  # Bigger explosion
+                for _ in range(40)
+            ]
+        else:
+            self.explosion_sheet = explosion_bank.get("asteroid", self.explosion_radius)
 
-    def _is_within_explosion_radius(self, asteroid):
-        """Checks if another asteroid is within explosion range."""
-        distance = math.sqrt((asteroid.x - self.x) ** 2 + (asteroid.y - self.y) ** 2)
-        return distance <= self.explosion_radius
+    @property
+    def explosion_frame(self):
+        """Frames elapsed since the explosion started."""
+        return int(self.explosion_duration - self.explosion_timer)
 
     def update_explosion(self):
-        """Updates explosion animation each frame using delta time."""
+        """Moves the explosion fragments and particles using delta time."""
         if self.exploding:
             for fragment in self.fragments:
                 fragment["pos"] = (
@@ -213,16 +250,13 @@ class ExplodingAsteroid(Asteroid):
             for particle in self.explosion_particles:
                 particle.update()
 
-            self.explosion_timer -= self.game_state.dt * 60
-
-            if self.explosion_timer <= 0:
-                self.exploding = False  # Mark explosion as done
+    def _finish_explosion(self):
+        self.exploding = False  # Mark explosion as done
 
     def draw(self, screen):
         """Draw the asteroid as an orange polygon, or explosion if exploding."""
         if not self.exploding:
-            # pygame.draw.polygon(screen, ORANGE, self.shape)  # Filled polygon
-            pygame.draw.polygon(screen, config.ORANGE, self.shape, 4)  # Outline
+            super().draw(screen)
         else:
             self.draw_explosion(screen)  # Draw explosion animation
 
@@ -239,16 +273,20 @@ class ExplodingAsteroid(Asteroid):
             if math.sqrt((fx - self.x) ** 2 + (fy - self.y) ** 2) <= self.explosion_radius:
                 pygame.draw.circle(screen, ORANGE, (int(fx), int(fy)), 4)
 
-        # **Only Draw Particles Inside Explosion Radius**
-        for particle in self.explosion_particles:
-            px, py = particle.x, particle.y
-            if math.sqrt((px - self.x) ** 2 + (py - self.y) ** 2) <= self.explosion_radius:
-                particle.draw(screen)
+        if self.explosion_sheet is not None:
+            # Baked clouds are already clipped to the explosion radius
+            self.explosion_sheet.draw(screen, self.x, self.y, self.explosion_frame)
+        else:
+            # **Only Draw Particles Inside Explosion Radius**
+            for particle in self.explosion_particles:
+                px, py = particle.x, particle.y
+                if math.sqrt((px - self.x) ** 2 + (py - self.y) ** 2) <= self.explosion_radius:
+                    particle.draw(screen)
 
         # **Controlled Shockwave Expansion**
         max_radius = self.explosion_radius * 0.6  # Max shockwave size = 60% of explosion radius
-        growth_per_frame = max_radius / 40  # Grows evenly over explosion duration
-        shockwave_radius = min((40 - self.explosion_timer) * growth_per_frame, max_radius)
+        growth_per_frame = max_radius / self.explosion_duration  # Grows evenly over explosion duration
+        shockwave_radius = min(self.explosion_frame * growth_per_frame, max_radius)
 
         if shockwave_radius > 0:
             pygame.draw.circle(screen, RED_ORANGE, (int(self.x), int(self.y)), int(shockwave_radius), 2)
@@ -262,6 +300,10 @@ class ShieldAsteroid(Asteroid):
     def __init__(self, game_state, x=None, y=None, size=80, stage=3):
         """Initialize ShieldAsteroid with a shield."""
         super().__init__(game_state, x, y, size, stage)
+
+    def reset(self, game_state, x=None, y=None, size=80, stage=3):
+        """Reinitialise the asteroid with a fresh shield."""
+        super().reset(game_state, x, y, size, stage)
         self.current_shield = self.shield_strength  # Track shield hits
 
     def draw(self, screen):
@@ -269,14 +311,7 @@ class ShieldAsteroid(Asteroid):
         if self.current_shield > 0:
             shield_radius = self.size + 12  # Slightly larger than the asteroid
             alpha = 200 if self.current_shield == 2 else 100
-            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                shield_surface,
-                (config.CYAN[0], config.CYAN[1], config.CYAN[2], alpha),
-                (shield_radius, shield_radius),
-                shield_radius,
-                4
-            )
+            shield_surface = effect_cache.get("ring", config.CYAN, shield_radius, alpha)
             screen.blit(shield_surface, (self.x - shield_radius, self.y - shield_radius))
         super().draw(screen)
 
@@ -287,6 +322,49 @@ class ShieldAsteroid(Asteroid):
         else:
             super().on_hit(bullet)  # Call normal asteroid hit behavior
 
+class SpinningAsteroid(Asteroid):
+    """Asteroid that tumbles as it drifts, drawn from pre-rasterised rotation frames."""
+
+    spawn_chance = 0.05
+    color = (170, 170, 255)
+    rotation_frames = 32
+
+    def reset(self, game_state, x=None, y=None, size=120, stage=3):
+        super().reset(game_state, x, y, size, stage)
+        self.rotation = random.uniform(0, 360)
+        self.spin = random.choice((-1, 1)) * random.uniform(1, 3)  # Degrees per frame
+
+    @property
+    def frame(self):
+        """Index of the rotation frame closest to the current rotation."""
+        return round(self.rotation / 360 * self.rotation_frames) % self.rotation_frames
+
+    @property
+    def frame_angle(self):
+        """Rotation in radians of the frame that is actually drawn."""
+        return 2 * math.pi * self.frame / self.rotation_frames
+
+    @property
+    def shape(self):
+        return self._shape_buffer.get(self.template, self.x, self.y, self.frame_angle)
+
+    def to_local(self, dx, dy):
+        """Rotates the offset back by the drawn frame's angle so hits match the sprite."""
+        angle = self.frame_angle
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        return dx * cos_a + dy * sin_a, -dx * sin_a + dy * cos_a
+
+    def update(self):
+        """Spin and drift."""
+        self.rotation = (self.rotation + self.spin * self.game_state.dt * 60) % 360
+        super().update()
+
+    def draw(self, screen):
+        """Draw the rotation frame matching the current rotation."""
+        sprite, half = self.game_state.asteroid_sprites.get(self.sprite_key, self.frame)
+        screen.blit(sprite, (self.x - half, self.y - half))
+
 # class IceAsteroid(Asteroid):
 #     """Asteroid that leaves a visible ice trail and slows the player when touched."""
 
@@ -374,28 +452,17 @@ class BackgroundAsteroid:
         self.base_speed = random.uniform(2, 4)  # Normal speed
         self.speed = self.base_speed  # Current speed (adjusted by slowdown)
 
-        # Generate shape *once* and store relative offsets
-        self.shape_offsets = self._generate_jagged_shape()
-        self.update_shape()
+        # Shapes come from a shared bank of read-only outlines
+        self.template = shape_templates.get(size, self.sides)
+        self.shape_offsets = self.template.offsets
+        self._shape_buffer = ShapeBuffer()
 
         logger.info(f"Spawned {repr(self)}")
 
-    def _generate_jagged_shape(self):
-        """Creates a jagged asteroid shape with fixed offsets."""
-        jitter_amount = self.size // 3  # Edge variation
-        offsets = []
-        for i in range(self.sides):
-            angle = (i / self.sides) * 2 * math.pi
-            jitter = random.randint(-jitter_amount, jitter_amount)
-            radius = self.size + jitter
-            x_offset = math.cos(angle) * radius
-            y_offset = math.sin(angle) * radius
-            offsets.append((x_offset, y_offset))
-        return offsets  # Store relative offsets so shape remains constant
-
-    def update_shape(self):
-        """Update shape based on current position while keeping offsets constant."""
-        self.shape = [(self.x + ox, self.y + oy) for ox, oy in self.shape_offsets]
+    @property
+    def shape(self):
+        """World-space outline, only recomputed when the asteroid has moved since the last read."""
+        return self._shape_buffer.get(self.template, self.x, self.y)
 
     def update(self, dt):
         """Moves the asteroid using delta time (dt)."""
@@ -421,9 +488,6 @@ class BackgroundAsteroid:
         elif self.y > config.HEIGHT + self.size:
             self.y = -self.size
 
-        # Update shape based on new position without changing offsets
-        self.update_shape()
-
     def draw(self, screen):
         """Draw the asteroid with an outline (wireframe)."""
         pygame.draw.polygon(screen, config.WHITE, self.shape, 4)
@@ -433,4 +497,6 @@ class BackgroundAsteroid:
 
 if Asteroid not in Asteroid.asteroid_types:
     Asteroid.asteroid_types.append(Asteroid)
-    logger.info("Base class Asteroid manually registered in asteroid_types")
\ No newline at end of file
+    logger.info("Base class Asteroid manually registered in asteroid_types")
+
+asteroid_spawn_table = SpawnTable("asteroids")
@@ -0,0 +1,49 @@
+"""Free lists of destroyed asteroids kept for reuse"""
+
+from planetoids.core.logger import logger
+
+class AsteroidPool:
+    """Recycles destroyed asteroids so spawning and splitting don't allocate.
+
+    Released asteroids are kept per class and brought back to life with
+    reset() the next time that class is requested.
+    """
+
+    def __init__(self, max_free_per_class=256):
+        self.max_free_per_class = max_free_per_class
+        self._free = {}
+
+    #pylint: disable=too-many-arguments
+    def acquire(self, asteroid_class, game_state, x=None, y=None, size=None, stage=3):
+        """Returns an asteroid of the given class, reusing a released one if possible."""
+        kwargs = {"stage": stage}
+        if size is not None:
+            kwargs["size"] = size  # Otherwise keep the class's default size
+
+        free = self._free.get(asteroid_class)
+        if free:
+            asteroid = free.pop()
+            asteroid.reset(game_state, x, y, **kwargs)
+            return asteroid
+        return asteroid_class(game_state, x, y, **kwargs)
+
+    def release(self, asteroid):
+        """Returns a destroyed asteroid to the pool."""
+        asteroid.release_sprite()
+        free = self._free.setdefault(type(asteroid), [])
+        if len(free) < self.max_free_per_class:
+            free.append(asteroid)
+
+    def release_all(self, asteroids):
+        """Returns several destroyed asteroids to the pool."""
+        for asteroid in asteroids:
+            self.release(asteroid)
+
+    def free_count(self):
+        """Returns the number of asteroids waiting to be reused."""
+        return sum(len(free) for free in self._free.values())
+
+    def clear(self):
+        """Drops every pooled asteroid."""
+        logger.info(f"Clearing asteroid pool of {self.free_count()} asteroids")
+        self._free.clear()
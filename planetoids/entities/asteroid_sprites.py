@@ -0,0 +1,72 @@
+"""Pre-rasterised asteroid outlines, shared between asteroids and blitted each frame"""
+
+import math
+
+import pygame
+
+from planetoids.core.logger import logger
+from planetoids.entities.shape_templates import rotate_offsets
+
+OUTLINE_WIDTH = 4
+
+class AsteroidSpriteCache:
+    """Draws each (template, colour) outline once and reuses the surface.
+
+    Asteroids acquire a key when they take a template and release it when
+    they die; once nothing references a key its surfaces are dropped.
+    Spinning asteroids ask for one of a fixed number of rotation frames,
+    which are rasterised the first time they are needed.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def acquire(self, template, color, frames=1):
+        """Registers a user of the outline and returns its key."""
+        key = (template.template_id, color, frames)
+        entry = self._entries.get(key)
+        if entry is None:
+            half = math.ceil(template.collision_shape.bounding_radius) + OUTLINE_WIDTH
+            entry = self._entries[key] = [0, template, half, [None] * frames]
+        entry[0] += 1
+        return key
+
+    def release(self, key):
+        """Drops one user of the outline, evicting its surfaces when none are left."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry[0] -= 1
+        if entry[0] <= 0:
+            del self._entries[key]
+
+    def refcount(self, key):
+        """Returns how many asteroids are using the outline."""
+        entry = self._entries.get(key)
+        return 0 if entry is None else entry[0]
+
+    def get(self, key, frame=0):
+        """Returns the surface for a rotation frame and the offset from centre to its corner."""
+        _, template, half, surfaces = self._entries[key]
+        surface = surfaces[frame]
+        if surface is None:
+            surface = surfaces[frame] = self._rasterise(template, key[1], half, frame, len(surfaces))
+        return surface, half
+
+    def clear(self):
+        """Drops every cached outline."""
+        logger.info(f"Clearing {len(self._entries)} asteroid sprites")
+        self._entries.clear()
+
+    @staticmethod
+    def _rasterise(template, color, half, frame, frames):
+        angle = 2 * math.pi * frame / frames
+        points = [(half + x, half + y) for x, y in rotate_offsets(template.offsets, angle)]
+        surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        pygame.draw.polygon(surface, color, points, OUTLINE_WIDTH)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
@@ -20,10 +20,14 @@ class Bullet:
         self.radius = radius
 
         self.trail = collections.deque(maxlen=7)  # Number of previous frames to track
+        self.prev_x = x  # Position at the start of the last step, for swept collisions
+        self.prev_y = y
 
     def update(self):
         """Moves the bullet forward using delta time scaling and handles lifetime."""
         angle_rad = math.radians(self.angle)
+        self.prev_x = self.x
+        self.prev_y = self.y
 
         self.x += math.cos(angle_rad) * self.speed * self.game_state.dt * 60
         self.y -= math.sin(angle_rad) * self.speed * self.game_state.dt * 60
@@ -37,6 +41,18 @@ class Bullet:
         self.x %= config.WIDTH
         self.y %= config.HEIGHT
 
+    def get_sweep(self):
+        """Returns the (x0, y0, x1, y1) segment covered by the last step.
+
+        The trail holds the end point before screen wraparound, so the
+        segment stays continuous even when the bullet wraps.
+        """
+        if self.trail:
+            end_x, end_y = self.trail[-1]
+        else:
+            end_x, end_y = self.x, self.y
+        return self.prev_x, self.prev_y, end_x, end_y
+
     def draw(self, screen):
         """Draw the bullet with a glowing trail effect."""
         color = self.color
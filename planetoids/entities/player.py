@@ -9,12 +9,23 @@ from planetoids.entities.particle import Particle  # Import the new particle cla
 from planetoids.entities.bullet import Bullet
 from planetoids.core.logger import logger
 from planetoids.entities.powerups import RicochetShotPowerUp, TrishotPowerUp, QuadShotPowerUp
+from planetoids.effects.effect_cache import AURA_PHASES, effect_cache, phase_bucket
+from planetoids.effects.explosion_sheets import explosion_bank
 
 class Player:
+    SHIELD_BAR_WIDTH = 120
+    EXPLOSION_DURATION = 30  # Frames
+    POWERUP_DURATION = 300  # Frames
+    # Simulate the explosion's particle cloud instead of playing a baked one
+    live_particles = False
+
     def __init__(self, settings, game_state):
         """Initialize player with movement settings."""
         self.settings = settings
         self.game_state = game_state
+        self._invincibility = None
+        self._powerup = None
+        self._explosion = None
         self.reset_position()
         self.acceleration = 0.1
         self.max_speed = 5
@@ -26,11 +37,11 @@ class Player:
         self.quadshot_active = False
         self.ricochet_active = False
         self.ricochet_piercing = False
-        self.powerup_timer = 0
         self.active_powerup_color = None  # Store the color of the active power-up
         self.explosion_particles = []  # Temporary explosion effect
+        self.explosion_sheet = None
+        self.explosion_x, self.explosion_y = self.x, self.y
         self.fragments = []  # Pieces of the ship
-        self.explosion_timer = 30
 
         # Shield system
         self.activate_shield()
@@ -70,6 +81,31 @@ class Player:
 
         return bullets
 
+    @property
+    def invincible(self):
+        return self._invincibility is not None and self._invincibility.pending
+
+    @property
+    def invincibility_timer(self):
+        """Frames of invincibility left."""
+        return self._invincibility.remaining * 60 if self._invincibility else 0
+
+    @property
+    def powerup_timer(self):
+        """Frames left on the active power-up."""
+        return self._powerup.remaining * 60 if self._powerup else 0
+
+    @property
+    def explosion_timer(self):
+        """Frames left of the death explosion."""
+        return self._explosion.remaining * 60 if self._explosion else 0
+
+    def _start_powerup(self, duration=POWERUP_DURATION):
+        """Turns the shot power-ups off again after duration frames."""
+        if self._powerup is not None:
+            self._powerup.cancel()
+        self._powerup = self.game_state.timers.schedule(duration / 60, self._disable_previous_shots)
+
     def _disable_previous_shots(self):
         self.trishot_active = False
         self.quadshot_active = False
@@ -80,8 +116,8 @@ class Player:
     def enable_invincibility(self):
         """Activates invincibility for a limited time."""
         # self._disable_previous_shots()
-        self.set_invincibility(timer=300)
-        self.powerup_timer = 300
+        self.set_invincibility(timer=self.POWERUP_DURATION)
+        self._start_powerup()
         logger.info(f"Invincibility enabled")
 
     def enable_ricochet(self):
@@ -89,7 +125,7 @@ class Player:
         self._disable_previous_shots()
         self.ricochet_active = True
         self.ricochet_piercing = True
-        self.powerup_timer = 300
+        self._start_powerup()
         self.active_powerup_color = RicochetShotPowerUp.color  # Ricochet Shot Aura
         self.powerup_aura_timer = 300
         logger.info("Ricochet enabled")
@@ -98,7 +134,7 @@ class Player:
         """Activates quadshot mode for a limited time."""
         self._disable_previous_shots()
         self.quadshot_active = True
-        self.powerup_timer = 300
+        self._start_powerup()
         self.active_powerup_color = QuadShotPowerUp.color  # Quadshot Aura
         self.powerup_aura_timer = 300
         logger.info("Quadshot enabled")
@@ -107,7 +143,7 @@ class Player:
         """Activates trishot mode for a limited time."""
         self._disable_previous_shots()
         self.trishot_active = True
-        self.powerup_timer = 300
+        self._start_powerup()
         self.active_powerup_color = TrishotPowerUp.color  # Trishot Aura
         self.powerup_aura_timer = 300
         logger.info("Trishot enabled")
@@ -130,23 +166,26 @@ class Player:
 
     def set_invincibility(self, timer=120):
         """Set the player as invincible"""
-        self.invincible = True
-        self.invincibility_timer = timer  # 2 seconds of invincibility
+        if self._invincibility is not None:
+            self._invincibility.cancel()
+        self._invincibility = self.game_state.timers.schedule(timer / 60)  # Timer is in frames, 2 seconds by default
         logger.info(f"Set invincibility")
 
-    def _draw_shield_bar(self, screen):
+    def shield_progress(self):
+        """Returns the shield's recharge progress from 0 to 1."""
+        if self.shield_active:
+            return 1.0  # Full shield
+        time_since_break = time.time() - self.last_shield_recharge
+        return min(time_since_break / 30, 1.0)  # Fill over 30 seconds
+
+    def draw_shield_bar(self, screen):
         """Draws a shield recharge bar in the top-left corner."""
-        bar_width = 120
+        bar_width = self.SHIELD_BAR_WIDTH
         bar_height = 12
         bar_x = 10
         bar_y = {"minimum": 40, "medium": 60, "maximum": 80}.get(self.settings.get("pixelation"), 40)  # Position on screen
 
-        # Calculate recharge progress (0 to 1)
-        if self.shield_active:
-            progress = 1.0  # Full shield
-        else:
-            time_since_break = time.time() - self.last_shield_recharge
-            progress = min(time_since_break / 30, 1.0)  # Fill over 30 seconds
+        progress = self.shield_progress()
 
         # Bar colors
         border_color = (200, 200, 200)  # Light grey border
@@ -154,29 +193,20 @@ class Player:
         fill_color = (0, 255, 255) if self.shield_active else (100, 100, 255)  # Cyan when full, blue when recharging
 
         # Draw border
-        pygame.draw.rect(screen, border_color, (bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4), 2)
+        border_rect = pygame.draw.rect(screen, border_color, (bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4), 2)
 
         # Draw empty bar
         pygame.draw.rect(screen, empty_color, (bar_x, bar_y, bar_width, bar_height))
 
         # Draw progress fill
         pygame.draw.rect(screen, fill_color, (bar_x, bar_y, bar_width * progress, bar_height))
+        return [border_rect]
 
     def update(self, keys):
         """Handles movement, rotation, and particle effects in a momentum-based system using delta time."""
 
         self._handle_shield_regeneration()
 
-        if self.powerup_timer > 0:
-            self.powerup_timer -= self.game_state.dt * 60
-            if self.powerup_timer <= 0:
-                self._disable_previous_shots()
-
-        if self.invincibility_timer > 0:
-            self.invincibility_timer -= self.game_state.dt * 60
-            if self.invincibility_timer <= 0:
-                self.invincible = False
-
         self.thrusting = False  # Reset thrust effect
 
         rotation_speed = 250  # Degrees per second
@@ -216,18 +246,11 @@ class Player:
 
     def draw_aura(self, screen):
         """Draws a soft, pulsating aura around the player when a power-up is active."""
-        if self.powerup_aura_timer > 0:
-            pulse_factor = 1 + 0.1 * math.sin(pygame.time.get_ticks() * 0.01)  # Smooth pulsation
-            aura_radius = int(50 * pulse_factor)  # Adjust size dynamically
-            alpha = int(100 + 40 * pulse_factor)  # Opacity range: 100 - 140
-
-            aura_surface = pygame.Surface((aura_radius * 2, aura_radius * 2), pygame.SRCALPHA)
-            aura_surface.fill((0, 0, 0, 0))  # Transparent background
-
-            if self.active_powerup_color:
-                aura_color = (*self.active_powerup_color[:3], alpha)  # Apply pulsating transparency
-                pygame.draw.circle(aura_surface, aura_color, (aura_radius, aura_radius), aura_radius)
-
+        if self.powerup_aura_timer > 0 and self.active_powerup_color:
+            # Pre-rendered frames of the pulse, picked by the clock
+            phase = phase_bucket(pygame.time.get_ticks(), 0.01, AURA_PHASES)
+            aura_surface = effect_cache.get("aura", self.active_powerup_color[:3], 50, phase)
+            aura_radius = aura_surface.get_width() // 2
             screen.blit(aura_surface, (self.x - aura_radius, self.y - aura_radius))
 
     def _handle_shield_regeneration(self):
@@ -255,10 +278,7 @@ class Player:
             # Aura effect: Expanding and fading glow
                 self.draw_aura(screen)
 
-        # Triangle points relative to the center
-        front = (self.x + math.cos(angle_rad) * self.size, self.y - math.sin(angle_rad) * self.size)
-        left = (self.x + math.cos(angle_rad + 2.5) * self.size * 0.6, self.y - math.sin(angle_rad + 2.5) * self.size * 0.6)
-        right = (self.x + math.cos(angle_rad - 2.5) * self.size * 0.6, self.y - math.sin(angle_rad - 2.5) * self.size * 0.6)
+        front, left, right = self.get_triangle()
 
         # Draw particles first (so they appear behind the ship)
         for particle in self.particles:
@@ -273,7 +293,14 @@ class Player:
             self._draw_thruster(screen, angle_rad, left, right)
         if self.shield_active:
             self._draw_shield(screen)
-        self._draw_shield_bar(screen)
+
+    def get_triangle(self):
+        """Returns the front, left and right points of the ship's hull."""
+        angle_rad = math.radians(self.angle)
+        front = (self.x + math.cos(angle_rad) * self.size, self.y - math.sin(angle_rad) * self.size)
+        left = (self.x + math.cos(angle_rad + 2.5) * self.size * 0.6, self.y - math.sin(angle_rad + 2.5) * self.size * 0.6)
+        right = (self.x + math.cos(angle_rad - 2.5) * self.size * 0.6, self.y - math.sin(angle_rad - 2.5) * self.size * 0.6)
+        return front, left, right
 
     def _draw_shield(self, screen):
         """Draws a glowing shield around the player with a pulsing effect."""
@@ -308,21 +335,27 @@ class Player:
     def generate_explosion(self):
         """Initializes the explosion effect when the player dies."""
         self.explosion_particles = []  # Temporary explosion effect
+        self.explosion_sheet = None
+        self.explosion_x, self.explosion_y = self.x, self.y
         self.fragments = []  # Pieces of the ship
-        self.explosion_timer = 30  # Lasts for 30 frames (half a second)
-
-        angle_rad = math.radians(self.angle)
+        if self._explosion is not None:
+            self._explosion.cancel()
+        # Lasts for 30 frames (half a second)
+        self._explosion = self.game_state.timers.schedule(self.EXPLOSION_DURATION / 60, self._clear_explosion)
 
         # Define original ship triangle points
-        front = (self.x + math.cos(angle_rad) * self.size, self.y - math.sin(angle_rad) * self.size)
-        left = (self.x + math.cos(angle_rad + 2.5) * self.size * 0.6, self.y - math.sin(angle_rad + 2.5) * self.size * 0.6)
-        right = (self.x + math.cos(angle_rad - 2.5) * self.size * 0.6, self.y - math.sin(angle_rad - 2.5) * self.size * 0.6)
+        front, left, right = self.get_triangle()
 
         # Create moving fragments
         self.fragments.append({"pos": front, "vel": (random.uniform(-2, 2), random.uniform(-2, 2))})
         self.fragments.append({"pos": left, "vel": (random.uniform(-2, 2), random.uniform(-2, 2))})
         self.fragments.append({"pos": right, "vel": (random.uniform(-2, 2), random.uniform(-2, 2))})
 
+        if not self.live_particles:
+            self.explosion_sheet = explosion_bank.get("player")
+            logger.info("Player explosion generated")
+            return
+
         # Generate explosion particles
         for _ in range(15):
             self.explosion_particles.append(
@@ -337,23 +370,21 @@ class Player:
 
         logger.info("Player explosion generated")
 
-    def update_explosion(self):
-        """Updates explosion animation frame by frame using delta time."""
-        if self.explosion_timer > 0:
-            self.explosion_timer -= self.game_state.dt * 60
-
-            self._update_fragments(self.fragments)
-            self._update_particles(self.explosion_particles)
+    @property
+    def explosion_frame(self):
+        """Frames elapsed since the explosion started."""
+        return int(self.EXPLOSION_DURATION - self.explosion_timer)
 
-            if self.explosion_timer <= 0:
-                self._clear_explosion()
-        else:
-            self._clear_explosion()
+    def update_explosion(self):
+        """Moves the explosion fragments and particles; the timer clears them."""
+        self._update_fragments(self.fragments)
+        self._update_particles(self.explosion_particles)
 
     def _clear_explosion(self):
         """Clear explosion effects"""
         # Animation is done, clear effects
         self.explosion_particles = []
+        self.explosion_sheet = None
         self.fragments = []
         logger.info(f"Clear player explosion animation")
 
@@ -377,3 +408,5 @@ class Player:
                 pygame.draw.polygon(screen, config.WHITE, [fragment["pos"], fragment["pos"], fragment["pos"]], 4)
             for particle in self.explosion_particles:
                 particle.draw(screen)
+            if self.explosion_sheet is not None:
+                self.explosion_sheet.draw(screen, self.explosion_x, self.explosion_y, self.explosion_frame)
@@ -1,12 +1,13 @@
 import random
 import time
-import math
 
 import pygame
 
 from planetoids.core.config import config
 from planetoids.core.logger import logger
-from planetoids.core.settings import get_font_path
+from planetoids.core.spawn_table import SpawnTable
+from planetoids.core.fonts import get_font
+from planetoids.effects.effect_cache import GLOW_PHASES, GLOW_VARIANTS, effect_cache, phase_bucket
 
 class PowerUp:
     """Base class for all power-ups."""
@@ -32,13 +33,9 @@ class PowerUp:
         PowerUp.subclasses.append(cls)  # Register each subclass
 
     @classmethod
-    def get_powerup_type(cls):
-        """Selects an asteroid type based on weighted probabilities"""
-        powerup_classes = cls.subclasses
-        weights = [subclass.spawn_chance for subclass in powerup_classes]
-        powerup_type = random.choices(powerup_classes, weights=weights, k=1)[0]
-        logger.info(f"Randomly selected powerup type {powerup_type}")
-        return powerup_type
+    def get_powerup_type(cls, level=1):
+        """Selects a power-up type based on weighted probabilities for the level"""
+        return powerup_spawn_table.sample(cls.subclasses, level)
 
     @classmethod
     def get_powerups(cls):
@@ -82,24 +79,14 @@ class PowerUp:
 
     def _draw_glow(self, screen):
         """Draws animated tendrils of energy around the power-up."""
-        glow_surface = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)
-        
-        pulse = 2 + (math.sin(pygame.time.get_ticks() * 0.005) * 2)  # Subtle pulsing
-        center = (self.radius * 2, self.radius * 2)
-        
-        for _ in range(5):  
-            if random.random() < 0.7: 
-                angle = random.uniform(0, math.tau)
-                length = random.uniform(self.radius, self.radius * 2.5)
-                end_x = center[0] + math.cos(angle) * length
-                end_y = center[1] + math.sin(angle) * length
-                
-                color = (*getattr(self, "color", config.CYAN), random.randint(50, 180))
-                pygame.draw.line(glow_surface, color, center, (end_x, end_y), random.randint(1, 3)) 
-                for i in range(4):
-                    alpha = max(0, 150 - (i * 40))
-                    pygame.draw.circle(glow_surface, (*getattr(self, "color", config.CYAN), alpha), center, int(self.radius + pulse + (i * 2)))
-
+        # Pulse follows the clock; the tendrils flicker between a few patterns
+        phase = (
+            phase_bucket(pygame.time.get_ticks(), 0.005, GLOW_PHASES),
+            random.randrange(GLOW_VARIANTS)
+        )
+        glow_surface = effect_cache.get(
+            "glow", getattr(self, "color", config.CYAN), self.radius, phase
+        )
         screen.blit(glow_surface, (self.x - self.radius * 2, self.y - self.radius * 2), special_flags=pygame.BLEND_ADD)
 
     def _draw_main_powerup(self, screen):
@@ -108,8 +95,7 @@ class PowerUp:
 
     def _draw_powerup_symbol(self, screen):
         """Draws the symbol or letter representing the power-up."""
-        font = pygame.font.Font(get_font_path(), 32)
-        text = font.render(self.get_symbol(), True, (0, 0, 0))
+        text = get_font(32).render(self.get_symbol(), True, (0, 0, 0))
         screen.blit(text, (self.x-6, self.y-14))
 
     def is_expired(self):
@@ -196,8 +182,9 @@ class TemporalSlowdownPowerUp(PowerUp):
 
     def apply(self, game_state):
         """Activates slow-motion effect on all asteroids."""
-        game_state.asteroid_slowdown_active = True
-        pygame.time.set_timer(pygame.USEREVENT + 5, 5000)  # Slowdown lasts 5 seconds
+        game_state.start_slowdown()
 
     def get_symbol(self):
         return "Δ"
+
+powerup_spawn_table = SpawnTable("powerups")
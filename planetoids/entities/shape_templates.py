@@ -0,0 +1,130 @@
+"""Shared bank of pre-generated jagged asteroid outlines"""
+
+import math
+import random
+
+from planetoids.core.collision_shape import CollisionShape
+
+class ShapeTemplate:
+    """A read-only jagged outline and its collision data, shared between asteroids."""
+
+    __slots__ = ("template_id", "size", "sides", "offsets", "collision_shape")
+
+    def __init__(self, template_id, size, sides, offsets):
+        self.template_id = template_id
+        self.size = size
+        self.sides = sides
+        self.offsets = offsets
+        self.collision_shape = CollisionShape(offsets)
+
+    def __repr__(self):
+        return f"ShapeTemplate(id={self.template_id}, size={self.size}, sides={self.sides})"
+
+class ShapeTemplateBank:
+    """Generates a handful of outline variants per (size, sides) and hands them out.
+
+    Each variant runs the trig loop once; afterwards spawning an asteroid
+    is just a random pick from the bank.
+    """
+
+    SIDES = range(7, 13)
+
+    def __init__(self, variants=8):
+        self.variants = variants
+        self._bank = {}
+        self._templates = []
+
+    def get(self, size, sides):
+        """Returns a random template for the given size and number of sides."""
+        templates = self._bank.get((size, sides))
+        if templates is None:
+            templates = self._fill(size, sides)
+        return random.choice(templates)
+
+    def by_id(self, template_id):
+        """Returns the template with the given id."""
+        return self._templates[template_id]
+
+    def prepare(self, sizes):
+        """Generates every variant for the given sizes ahead of time."""
+        for size in sizes:
+            for sides in self.SIDES:
+                if (size, sides) not in self._bank:
+                    self._fill(size, sides)
+
+    def __len__(self):
+        return len(self._templates)
+
+    def _fill(self, size, sides):
+        templates = []
+        for _ in range(self.variants):
+            template = ShapeTemplate(
+                len(self._templates), size, sides, _generate_jagged_shape(size, sides)
+            )
+            self._templates.append(template)
+            templates.append(template)
+        self._bank[(size, sides)] = templates
+        return templates
+
+class ShapeBuffer:
+    """Reusable world-space outline for one asteroid.
+
+    The points are only recomputed when the position or template differs
+    from the last read, and they are written into the same lists each
+    time, so callers must not keep the returned points across frames.
+    """
+
+    __slots__ = ("points", "_x", "_y", "_angle", "_template")
+
+    def __init__(self):
+        self.points = []
+        self._x = None
+        self._y = None
+        self._angle = None
+        self._template = None
+
+    def get(self, template, x, y, angle=0.0):
+        """Returns the template's outline rotated by angle radians and translated to (x, y)."""
+        if x == self._x and y == self._y and angle == self._angle and template is self._template:
+            return self.points
+
+        offsets = rotate_offsets(template.offsets, angle)
+        points = self.points
+        if len(points) != len(offsets):
+            points[:] = [[0.0, 0.0] for _ in offsets]
+        for point, (ox, oy) in zip(points, offsets):
+            point[0] = x + ox
+            point[1] = y + oy
+
+        self._x = x
+        self._y = y
+        self._angle = angle
+        self._template = template
+        return points
+
+def rotate_offsets(offsets, angle):
+    """Returns outline offsets rotated by angle radians."""
+    if not angle:
+        return offsets
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return tuple((x * cos_a - y * sin_a, x * sin_a + y * cos_a) for x, y in offsets)
+
+def _generate_jagged_shape(size, sides):
+    """Creates a jagged asteroid shape with fixed offsets."""
+    jitter_amount = size // 3  # Edge variation
+    offsets = []
+    for i in range(sides):
+        angle = (i / sides) * 2 * math.pi
+        jitter = random.randint(-jitter_amount, jitter_amount)
+        radius = size + jitter
+        x_offset = math.cos(angle) * radius
+        y_offset = math.sin(angle) * radius
+        offsets.append((x_offset, y_offset))
+    return tuple(offsets)  # Immutable so templates can be shared safely
+
+# Sizes spawned by the base game: 120 and 80 pixel asteroids and their splits
+STANDARD_SIZES = (120, 60, 30, 80, 40, 20)
+
+# Global instance
+shape_templates = ShapeTemplateBank()
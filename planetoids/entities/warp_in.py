@@ -0,0 +1,23 @@
+import pygame
+
+from planetoids.core.config import config
+
+class WarpIn:
+    """Collapsing ring drawn where a new asteroid materialises."""
+    def __init__(self, x, y, size, lifetime=20):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.duration = lifetime
+        self.lifetime = lifetime
+
+    def update(self, dt):
+        """Shrink the ring towards the asteroid's outline over time."""
+        self.lifetime -= dt * 60
+
+    def draw(self, screen):
+        """Draw the ring, closing in on the asteroid as it fades."""
+        if self.lifetime > 0:
+            progress = self.lifetime / self.duration
+            radius = int(self.size * (1 + progress))
+            pygame.draw.circle(screen, config.CYAN, (int(self.x), int(self.y)), radius, 2)
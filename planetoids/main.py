@@ -1,17 +1,16 @@
 """Main entry point for the game"""
 
 import os
-from typing import Tuple
-
 import pygame
 import dotenv
 
 from planetoids.effects import crt_effect
 from planetoids.core.config import config
 from planetoids.core.game_state import GameState
-from planetoids.core.settings import Settings, get_font_path
+from planetoids.core.settings import Settings
 from planetoids.core.logger import logger
-from planetoids.ui import IntroAnimation, GameOver, StartMenu
+from planetoids.core.session import Session
+from planetoids.ui import IntroAnimation, GameOver
 
 dotenv.load_dotenv()
 DEBUG_MODE = os.getenv("DEBUG", "False").lower() in ("true", "1")
@@ -20,40 +19,26 @@ def main() -> None:
     """Main entry point for the game"""
     logger.info("Game start")
     pygame.init()
+    config.probe_display()  # The one place the display is queried before the window opens
 
-    settings = Settings()
-
-    game_start = True
-    while True:  # Main game loop that allows restarting
-        pygame.mouse.set_visible(False)
-
-        screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT), pygame.FULLSCREEN)
-        print(type(screen))
-
-        pygame.display.set_caption("Planetoids")
-        clock = pygame.time.Clock()
+    session = Session(Settings())
+    screen = session.open_display()
 
-        # Intro animation if not debugging
-        if not DEBUG_MODE and game_start:
-            intro = IntroAnimation(screen, clock)
-            intro.play()
-            game_start = False
+    # Intro animation if not debugging
+    if not DEBUG_MODE:
+        intro = IntroAnimation(screen, session.clock, session.warmup)
+        intro.play()
 
+    while True:  # Main game loop that allows restarting
         # Show the start menu
-        start_menu = StartMenu(screen, clock, settings)
-        start_menu.show()
+        session.start_menu.show()
+        session.finish_warmup()
 
-        # Create GameState instance
-        game_state = GameState(screen, settings, clock)
-        game_state.spawn_asteroids(10)
-
-        # Display controls overlay for first few seconds
-        show_controls_timer = 5  # Show for 3 seconds
+        game_state = session.new_game()
 
         running = True
         while running:
-            screen.fill(config.BLACK)
-            dt = clock.tick(60) / 1000.0
+            dt = game_state.pacer.tick(busy=True) / 1000.0
             game_state.update_dt(dt)
             _event_handler(game_state)
 
@@ -66,21 +51,15 @@ def main() -> None:
             game_state.check_for_clear_map()
             game_state.check_for_collisions()
 
-            # Draw everything
+            # Draw everything, including the controls hint for the first few seconds
             game_state.draw_all(screen)
 
-            show_controls_timer =_show_controls(
-                show_controls_timer,
-                settings,
-                screen,
-                dt
-            )
-
-            _draw_crt_effects(settings, screen)
-            pygame.display.flip()
+            _draw_crt_effects(session.settings, screen)
+            game_state.present()
+            session.frame_presented()
 
             running = _check_for_game_over(
-                game_state, settings, screen, dt, running
+                game_state, session.settings, screen, dt, running
             )
 
 def _check_for_game_over(
@@ -90,8 +69,8 @@ def _check_for_game_over(
     ) -> bool:
     """Return Boolean check for game running"""
     if game_state.life.lives <= 0:
-        game_state.score.maybe_save_high_score()
-        game_over_screen = GameOver(game_state, settings)
+        run = game_state.record_run()
+        game_over_screen = GameOver(game_state, settings, run)
         restart_game = game_over_screen.game_over(screen, dt)
 
         if restart_game:
@@ -107,36 +86,13 @@ def _draw_crt_effects(settings: Settings, screen: pygame.Surface) -> None:
             pixelation=settings.get("pixelation")
         )
 
-def _show_controls(
-        show_controls_timer: float, settings: Settings,
-        screen: pygame.Surface, dt: float
-    ) -> float:
-    """Return show_controls_timer and draws controls to the screen"""
-    if show_controls_timer > 0:
-        controls = (
-            ("CONTROLS:", -80, 180, config.YELLOW),
-            ("Arrow keys - Movement", -50, 220, config.GREEN),
-            ("SPACE - Shoot", -50, 260, config.GREEN),
-            ("P - Pause", -50, 300, config.GREEN)
-        )
-        half_width = config.WIDTH // 2
-        third_height = config.HEIGHT // 3
-        for control in controls:
-            coords = (half_width - control[1], third_height + control[2])
-            _draw_text(
-                screen,
-                control[0],
-                coords,
-                settings,
-                control[3]
-            )
-        show_controls_timer -= dt  # Decrease timer
-    return show_controls_timer
-
 def _event_handler(game_state: GameState) -> None:
     """Handle key input events"""
     for event in pygame.event.get():
-        if event.type == pygame.KEYDOWN:
+        if game_state.pacer.handle_event(event) and not game_state.pacer.focused:
+            # Losing focus or being minimised pauses the game; the pause menu then idles
+            game_state.toggle_pause()
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_p:
                 game_state.toggle_pause()
             elif event.key == pygame.K_SPACE and not game_state.paused:
@@ -145,21 +101,6 @@ def _event_handler(game_state: GameState) -> None:
             new_width, new_height = event.w, event.h
             config.update_dimensions(new_width, new_height)  # 🔹 Update game dimensions
             pygame.display.set_mode((config.WIDTH, config.HEIGHT), pygame.RESIZABLE)
-        game_state.handle_powerup_expiration(event)
-
-def _draw_text(
-        screen: pygame.Surface, text: str, coords: Tuple[int, int],
-        settings: Settings, color: Tuple[int, int, int]=config.WHITE
-    ) -> None:
-    """Helper function to render sharp, readable text."""
-    font_size = {
-            "minimum":36,
-            "medium": 48,
-            "maximum": 64
-        }.get(settings.get("pixelation"), 36)
-    font = pygame.font.Font(get_font_path(), font_size)
-    rendered_text = font.render(text, True, color)
-    screen.blit(rendered_text, coords)
 
 if __name__ == "__main__":
     main()
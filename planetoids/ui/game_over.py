@@ -2,13 +2,17 @@ import os
 
 import pygame
 
+from planetoids.core.compositor import Layer
 from planetoids.core.config import config
+from planetoids.core.fonts import get_font
 from planetoids.effects import crt_effect
 
 class GameOver:
-    def __init__(self, game_state, settings):
+    def __init__(self, game_state, settings, run=None):
         self.game_state = game_state
         self.settings = settings
+        # The run as recorded on the leaderboard
+        self.run = run if run is not None else game_state.record_run()
 
     def game_over(self, screen, dt):
         """Ends the game and shows the Game Over screen. Returns True to restart or False to quit."""
@@ -17,9 +21,10 @@ class GameOver:
 
     def _display_game_over(self, screen, dt):
         """Displays 'GAME OVER' while keeping asteroids moving in the background."""
-        game_over_font = pygame.font.Font(self.settings.FONT_PATH, 256)
+        game_over_font = get_font(256)
         font_size = {"minimum":36, "medium": 48, "maximum": 64}.get(self.settings.get("pixelation"), 36)
-        prompt_font = pygame.font.Font(self.settings.FONT_PATH, font_size)
+        prompt_font = get_font(font_size)
+        stat_font = get_font(font_size)
 
         text = game_over_font.render("GAME OVER", True, config.YELLOW)
         text_rect = text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2))
@@ -30,18 +35,40 @@ class GameOver:
         start_time = pygame.time.get_ticks()
         game_over = True
 
-        accuracy = (
-            (self.game_state.shots_hit / self.game_state.shots_fired) * 100
-            if self.game_state.shots_fired > 0 else 0
-        )
-
         # Time survived calculation
-        elapsed_ms = pygame.time.get_ticks() - self.game_state.start_time
-        seconds = elapsed_ms // 1000
+        seconds = int(self.run.time_survived)
         minutes = seconds // 60
         hours = minutes // 60
         formatted_time = f"{hours:02}:{minutes % 60:02}:{seconds % 60:02}"
 
+        # Additional stats display
+        stats = [
+            f"Time Survived: {formatted_time}",
+            f"Shots Fired: {self.run.shots_fired}",
+            f"Asteroids Destroyed: {self.run.asteroids_destroyed}",
+            f"Accuracy: {self.run.accuracy:.1f}%"
+        ]
+
+        def prompt_visible():
+            # Show prompt only after 3 seconds (3000 milliseconds)
+            return pygame.time.get_ticks() - start_time > 3000
+
+        def draw_panel(surface):
+            """Renders the text, score and stats, which only change when the prompt appears."""
+            rects = self.game_state.score.draw(surface, show_multiplier=False)
+            rects += self.game_state.level.draw(surface)
+            rects.append(surface.blit(text, text_rect))
+            if prompt_visible():
+                rects.append(surface.blit(prompt_text, prompt_rect))
+
+            for i, line in enumerate(stats):
+                stat_text = stat_font.render(line, True, config.WHITE)
+                stat_rect = stat_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2 + 200 + i * 40))
+                rects.append(surface.blit(stat_text, stat_rect))
+            return rects
+
+        panel = Layer("game_over", draw_panel, key=prompt_visible, retained=True)
+
         while game_over:
             screen.fill(config.BLACK)
 
@@ -49,14 +76,8 @@ class GameOver:
                 asteroid.update()
                 asteroid.draw(screen)
 
-            self.game_state.score.draw(screen, show_multiplier=False)
-            self.game_state.level.draw(screen)
-
-            screen.blit(text, text_rect)
-
-            # Show prompt only after 3 seconds (3000 milliseconds)
-            if pygame.time.get_ticks() - start_time > 3000:
-                screen.blit(prompt_text, prompt_rect)
+            panel.refresh(screen.get_size())
+            panel.blit_to(screen)
 
             if self.settings.get("crt_enabled"):
                 crt_effect.apply_crt_effect(
@@ -65,24 +86,12 @@ class GameOver:
                     pixelation=self.settings.get("pixelation")
                 )
 
-            # Additional stats display
-            stat_font = pygame.font.Font(self.settings.FONT_PATH, font_size)
-            stats = [
-                f"Time Survived: {formatted_time}",
-                f"Shots Fired: {self.game_state.shots_fired}",
-                f"Asteroids Destroyed: {self.game_state.asteroids_destroyed}",
-                f"Accuracy: {accuracy:.1f}%"
-            ]
-
-            for i, line in enumerate(stats):
-                stat_text = stat_font.render(line, True, config.WHITE)
-                stat_rect = stat_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2 + 200 + i * 40))
-                screen.blit(stat_text, stat_rect)
-
             pygame.display.flip()
-            self.game_state.clock.tick(config.FPS)
+            # Full rate until the prompt appears, then idle while waiting for a key
+            self.game_state.pacer.tick(busy=not prompt_visible())
 
             for event in pygame.event.get():
+                self.game_state.pacer.handle_event(event)
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -6,15 +6,16 @@ import pygame
 from planetoids.core.config import config
 from planetoids.effects.crt_effect import apply_crt_effect
 from planetoids.core.logger import logger
-from planetoids.core.settings import get_font_path
+from planetoids.core.fonts import get_font
 
 class IntroAnimation:
     """Handles the Greening Games intro animation with glitch, terminal typing, and CRT effects."""
 
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, warmup=None):
         self.screen = screen
         self.clock = clock
-        self.font = pygame.font.Font(get_font_path(), 120)  # Retro pixel-style font
+        self.warmup = warmup  # Prepares game assets in the time each frame waits
+        self.font = get_font(120)  # Retro pixel-style font
         self.text = "GREENING STUDIO"  # Full text
         self.typed_text = ""  # What has been typed so far
         self.cursor_visible = True  # Blinking cursor state
@@ -54,7 +55,7 @@ class IntroAnimation:
             apply_crt_effect(self.screen)
 
             pygame.display.flip()
-            self.clock.tick(40)  # Faster frame rate for smoother effect
+            self._tick(40)  # Faster frame rate for smoother effect
 
         self._sequential_glitch_out()
 
@@ -107,7 +108,7 @@ class IntroAnimation:
                 apply_crt_effect(self.screen)
 
                 pygame.display.flip()
-                self.clock.tick(50)
+                self._tick(50)
 
         # **Extra 0.5s of continuous glitching before fade-out**
         end_time = time.time() + .75
@@ -125,7 +126,7 @@ class IntroAnimation:
             apply_crt_effect(self.screen)
 
             pygame.display.flip()
-            self.clock.tick(50)  # Keep the chaotic effect running
+            self._tick(50)  # Keep the chaotic effect running
 
         self._fade_out()
 
@@ -139,4 +140,10 @@ class IntroAnimation:
             fade_surface.set_alpha(alpha)
             self.screen.blit(fade_surface, (0, 0))
             pygame.display.flip()
-            self.clock.tick(30)  
+            self._tick(30)
+
+    def _tick(self, fps):
+        """Hands spare frame time to the warm-up before waiting out the frame."""
+        if self.warmup is not None and not self.warmup.done:
+            self.warmup.run_slice()
+        self.clock.tick(fps)
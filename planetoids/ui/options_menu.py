@@ -1,17 +1,21 @@
 import time
 import pygame
+from planetoids.core.compositor import Layer
 from planetoids.core.config import config
+from planetoids.core.frame_pacer import FramePacer
 from planetoids.effects.crt_effect import apply_crt_effect
 
 class OptionsMenu:
     """Handles the options menu logic for modifying and saving game settings."""
 
-    def __init__(self, screen, settings, font, menu_font, small_font):
+    def __init__(self, screen, settings, font, menu_font, small_font, pacer=None):
         self.screen = screen
         self.settings = settings
         self.font = font
         self.menu_font = menu_font
         self.small_font = small_font
+        # Shared with the menu that opened this one so focus and idle state carry over
+        self.pacer = pacer if pacer is not None else FramePacer(pygame.time.Clock())
 
         self.selected_index = 0
         self.options_items = [
@@ -26,9 +30,13 @@ class OptionsMenu:
         self.unsaved_changes = False
         self.save_time = 0
 
+        # Only re-rendered when the selection, a setting or the "Saved!" notice changes
+        self.view = Layer("options", self._draw_options_view, key=self._view_key, retained=True)
+
     def show(self):
         """Displays the options menu and waits for user input."""
         running = True
+        self.pacer.wake()
         while running:
             self.screen.fill(config.BLACK)
             self._draw_options_menu()
@@ -42,9 +50,24 @@ class OptionsMenu:
 
             pygame.display.flip()
             running = self._handle_events()
+            self.pacer.tick()
 
     def _draw_options_menu(self):
         """Draws the options menu, ensuring updated values are displayed."""
+        self.view.refresh(self.screen.get_size())
+        self.view.blit_to(self.screen)
+
+    def _view_key(self):
+        return (
+            self.selected_index,
+            self.settings.get("crt_enabled"),
+            self.settings.get("glitch_intensity"),
+            self.settings.get("pixelation"),
+            bool(self.save_time and time.time() - self.save_time < 3),
+        )
+
+    def _draw_options_view(self, surface):
+        """Renders the title, items and save notice."""
         crt_enabled = self.settings.get("crt_enabled")
 
         self.options_items = [
@@ -56,7 +79,7 @@ class OptionsMenu:
             "Back"
         ]
 
-        self._draw_text("OPTIONS", config.WIDTH // 2 - 120, config.HEIGHT // 4, config.YELLOW, self.font)
+        rects = [self._draw_text(surface, "OPTIONS", config.WIDTH // 2 - 120, config.HEIGHT // 4, config.YELLOW, self.font)]
 
         for i, item in enumerate(self.options_items):
             # ✅ Correct: Skip only Glitch Level & Pixelation if CRT is disabled
@@ -65,14 +88,16 @@ class OptionsMenu:
             else:
                 color = config.WHITE if i != self.selected_index else config.ORANGE  # Highlight selection
 
-            self._draw_text(item, config.WIDTH // 2 - 120, config.HEIGHT // 2 + i * 50, color, self.menu_font)
+            rects.append(self._draw_text(surface, item, config.WIDTH // 2 - 120, config.HEIGHT // 2 + i * 50, color, self.menu_font))
 
         if self.save_time and time.time() - self.save_time < 3:
-            self._draw_text("Saved!", config.WIDTH // 2, config.HEIGHT - 80, config.GREEN, self.small_font)
+            rects.append(self._draw_text(surface, "Saved!", config.WIDTH // 2, config.HEIGHT - 80, config.GREEN, self.small_font))
+        return rects
 
     def _handle_events(self):
         """Handles user input for menu navigation."""
         for event in pygame.event.get():
+            self.pacer.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
@@ -128,12 +153,12 @@ class OptionsMenu:
 
         return True  # Stay in menu
 
-    def _draw_text(self, text, x, y, color=config.WHITE, font=None):
+    def _draw_text(self, surface, text, x, y, color=config.WHITE, font=None):
         """Helper function to render sharp, readable text."""
         if font is None:
             font = self.font  # Default to main font
         rendered_text = font.render(text, True, color)
-        self.screen.blit(rendered_text, (x, y))
+        return surface.blit(rendered_text, (x, y))
 
 def _apply_fullscreen(fullscreen, settings):
     """Reinitialize display mode and update config dynamically."""
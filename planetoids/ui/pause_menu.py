@@ -1,13 +1,17 @@
 import os
 import pygame
 
+from planetoids.core.compositor import Layer
 from planetoids.core.config import config
 from planetoids.effects.crt_effect import apply_crt_effect
 from planetoids.core.logger import logger
 from planetoids.ui import OptionsMenu
-from planetoids.core.settings import get_font_path
+from planetoids.core.fonts import get_font
 
 class PauseMenu:
+    # Alpha of the black shade laid over the paused game
+    SNAPSHOT_SHADE = 160
+
     def __init__(self, screen, game_state):
         """Initialize the pause menu with retro font and settings support."""
         self.screen = screen
@@ -15,12 +19,14 @@ class PauseMenu:
         self.selected_index = 0  # Menu selection index
         self.menu_items = ["Resume", "Options", "Quit"]
         self.game_state = game_state  # Access GameState to modify settings
+        self.pacer = game_state.pacer
+        self.snapshot = None
+        self._stale = True
 
         # Load the same retro pixel font as the Start Menu
-        font_path = get_font_path()
-        self.font = pygame.font.Font(font_path, 64)  # Main menu font
-        self.menu_font = pygame.font.Font(font_path, 64)  # Menu items
-        self.small_font = pygame.font.Font(font_path, 36)  # Smaller for instructions
+        self.font = get_font(64)  # Main menu font
+        self.menu_font = get_font(64)  # Menu items
+        self.small_font = get_font(36)  # Smaller for instructions
 
         # Instantiate OptionsMenu with font settings
         self.options_menu = OptionsMenu(
@@ -28,52 +34,82 @@ class PauseMenu:
             self.game_state.settings,
             self.font,
             self.menu_font,
-            self.small_font
+            self.small_font,
+            pacer=self.pacer
         )
 
+        # Rendered once and only redrawn when the selection moves
+        self.view = Layer("pause", self._draw_pause_view, key=lambda: self.selected_index, retained=True)
+
         logger.info("PauseMenu instantiated")
 
     def show(self):
-        """Displays the pause menu and waits for player input."""
+        """Displays the pause menu over a frozen snapshot of the game and waits for player input."""
         logger.info("Pause menu triggered")
         self.running = True
+        self.pacer.wake()
+        self._take_snapshot()
         while self.running:
-            self.screen.fill(config.BLACK)
-            # Draw the pause menu
-            self._draw_pause_menu()
-
-            # Apply CRT effect if enabled
-            if self.game_state.settings.get("crt_enabled"):
-                apply_crt_effect(
-                    self.screen,
-                    intensity=self.game_state.settings.get("glitch_intensity"),
-                    pixelation=self.game_state.settings.get("pixelation")
-                )
-
-            pygame.display.flip()
+            # Nothing moves behind the menu, so the frame is only rebuilt when it changes
+            if self._draw_pause_menu():
+                pygame.display.flip()
             self._handle_events()
+            self.pacer.tick()
+        self.snapshot = None
         self.game_state.paused = False
         self.game_state.clock.tick()
 
+    def _take_snapshot(self):
+        """Keeps a dimmed copy of the last game frame to draw the menu over."""
+        self.snapshot = self.screen.copy()
+        shade = pygame.Surface(self.snapshot.get_size())
+        shade.fill(config.BLACK)
+        shade.set_alpha(self.SNAPSHOT_SHADE)
+        self.snapshot.blit(shade, (0, 0))
+        self._stale = True
+
     def _draw_pause_menu(self):
-        """Draws the pause menu."""
-        self._draw_text("PAUSED", config.WIDTH // 2 - 100, config.HEIGHT // 4, config.YELLOW, self.font)
+        """Redraws the menu over the snapshot if anything changed; returns True if it did."""
+        if not self.view.refresh(self.screen.get_size()) and not self._stale:
+            return False
+        self._stale = False
+
+        if self.snapshot is None:
+            self.screen.fill(config.BLACK)
+        else:
+            self.screen.blit(self.snapshot, (0, 0))
+        self.view.blit_to(self.screen)
+
+        if self.game_state.settings.get("crt_enabled"):
+            apply_crt_effect(
+                self.screen,
+                intensity=self.game_state.settings.get("glitch_intensity"),
+                pixelation=self.game_state.settings.get("pixelation")
+            )
+        return True
+
+    def _draw_pause_view(self, surface):
+        """Renders the title and menu items."""
+        rects = [self._draw_text(surface, "PAUSED", config.WIDTH // 2 - 100, config.HEIGHT // 4, config.YELLOW, self.font)]
 
         for i, item in enumerate(self.menu_items):
             color = config.WHITE if i != self.selected_index else config.ORANGE  # Highlight selected option
-            self._draw_text(item, config.WIDTH // 2 - 100, config.HEIGHT // 2 + i * 50, color)
+            rects.append(self._draw_text(surface, item, config.WIDTH // 2 - 100, config.HEIGHT // 2 + i * 50, color))
+        return rects
 
-    def _draw_text(self, text, x, y, color=config.WHITE, font=None):
+    def _draw_text(self, surface, text, x, y, color=config.WHITE, font=None):
         """Helper function to render text on the screen."""
         if font is None:
             font = self.font  # Default to the main font
 
         rendered_text = font.render(text, True, color)
-        self.screen.blit(rendered_text, (x, y))
+        return surface.blit(rendered_text, (x, y))
 
     def _handle_events(self):
         """Handles user input for menu navigation."""
         for event in pygame.event.get():
+            if self.pacer.handle_event(event):
+                self._stale = True  # The window may have lost its contents
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
@@ -93,6 +129,7 @@ class PauseMenu:
             self.running = False
         elif self.selected_index == 1:  # Open Options
             self.options_menu.show()
+            self._stale = True
         elif self.selected_index == 2:  # Quit
             pygame.quit()
             exit()
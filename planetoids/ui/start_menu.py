@@ -3,7 +3,10 @@ import math
 
 import pygame
 
+from planetoids.core.compositor import Layer
 from planetoids.core.config import config
+from planetoids.core.fonts import get_font
+from planetoids.core.frame_pacer import FramePacer
 from planetoids.entities.asteroid import BackgroundAsteroid
 from planetoids.effects.crt_effect import apply_crt_effect  # Import CRT effect function
 from planetoids.core.logger import logger
@@ -11,7 +14,7 @@ from planetoids.ui.options_menu import OptionsMenu
 from planetoids.core.version_checker import check_for_update
 
 class StartMenu:
-    def __init__(self, screen, clock, settings):
+    def __init__(self, screen, clock, settings, warmup=None):
         """Initialize the start menu with a moving asteroid background and refined retro font."""
         self.screen = screen
         self.clock = clock
@@ -19,14 +22,18 @@ class StartMenu:
         self.selected_index = 0
         self.menu_items = ["Start Game", "Options", "Quit"]
         self.settings = settings
+        self.warmup = warmup  # Finishes preparing game assets while the menu idles
+        # The drifting asteroids still want a watchable rate when nobody is playing
+        self.pacer = FramePacer(clock, idle_fps=30)
 
         # Load a refined vintage arcade font (Sleek but retro)
-        self.menu_font = pygame.font.Font(self.settings.FONT_PATH, 64)
-        self.small_font = pygame.font.Font(self.settings.FONT_PATH, 36)
+        self.menu_font = get_font(64)
+        self.small_font = get_font(36)
 
         # Initialize Options Menu
         self.options_menu = OptionsMenu(
-            self.screen, self.settings, self.font, self.menu_font, self.small_font
+            self.screen, self.settings, self.font, self.menu_font, self.small_font,
+            pacer=self.pacer
         )
 
         # Generate background asteroids
@@ -39,6 +46,16 @@ class StartMenu:
                 stage=3)
             for _ in range(5)
         ]
+        # Static text and the menu items are rendered once and redrawn on change
+        self.title_layer = Layer(
+            "title", self._draw_title,
+            key=lambda: (self.settings.get("pixelation"), self.latest_version),
+            retained=True
+        )
+        self.items_layer = Layer(
+            "items", self._draw_menu_items, key=lambda: self.selected_index, retained=True
+        )
+
         logger.info("StartMenu instantiated")
 
         self.latest_version = None
@@ -46,8 +63,7 @@ class StartMenu:
 
     @property
     def font(self):
-        return pygame.font.Font(
-            self.settings.FONT_PATH,
+        return get_font(
             {"minimum": 36, "medium": 48, "maximum": 64}.get(self.settings.get("pixelation"), 36)
         )
 
@@ -57,9 +73,11 @@ class StartMenu:
     def show(self):
         """Displays the start menu with moving asteroid background using delta time."""
         logger.info("Show start menu")
+        self.running = True  # The menu is shown again after every game
+        self.pacer.wake()
 
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            dt = self.pacer.tick() / 1000.0
 
             self.screen.fill(config.BLACK)
             for asteroid in self.background_asteroids:
@@ -77,60 +95,72 @@ class StartMenu:
                 )
 
             pygame.display.flip()
+            if self.warmup is not None and not self.warmup.done:
+                self.warmup.run_slice()
             self._handle_events()
 
         self._fade_out()
 
     def _draw_main_menu(self):
         """Draws the main start menu with a refined arcade look."""
-        title_font = pygame.font.Font(
-            self.settings.FONT_PATH,
-            200
-        )
+        for layer in (self.title_layer, self.items_layer):
+            layer.refresh(self.screen.get_size())
+            layer.blit_to(self.screen)
+
+    def _draw_title(self, surface):
+        """Renders the title, hints, branding and version, which rarely change."""
+        font = self.font
+        title_font = get_font(200)
         title_surface = title_font.render("PLANETOIDS", True, config.YELLOW)
         title_rect = title_surface.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 3))
-        self.screen.blit(title_surface, title_rect)
+        rects = [surface.blit(title_surface, title_rect)]
 
         if self.latest_version:
             update_msg = f"New version available: v{self.latest_version}!"
-            update_text = self.font.render(update_msg, True, config.YELLOW)
+            update_text = font.render(update_msg, True, config.YELLOW)
             update_rect = title_surface.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 3 + 175))
-            self.screen.blit(update_text, update_rect)
-
-        for i, item in enumerate(self.menu_items):
-            color = config.WHITE if i != self.selected_index else config.ORANGE  # Highlight selected option
-            self._draw_text(item, config.WIDTH // 2 - 120, config.HEIGHT // 2 + i * 50, color, self.menu_font)
+            rects.append(surface.blit(update_text, update_rect))
 
         x_offset = {"minimum": 0, "medium": 30, "maximum": 60}.get(self.settings.get("pixelation"), 40)
         y_offset = {"minimum": 45, "medium": 60, "maximum": 75}.get(self.settings.get("pixelation"), 40)
-        text_surface = self.font.render("Press ENTER to select", True, config.DIM_GRAY)
+        text_surface = font.render("Press ENTER to select", True, config.DIM_GRAY)
         text_width = text_surface.get_width()
-        self._draw_text("Press ENTER to select", (config.WIDTH - text_width) // 2 + x_offset, config.HEIGHT - y_offset, config.DIM_GRAY, self.font)
-        self._draw_studio_branding()
-        self._draw_version()
+        rects.append(surface.blit(text_surface, ((config.WIDTH - text_width) // 2 + x_offset, config.HEIGHT - y_offset)))
+        rects.append(self._draw_studio_branding(surface, font))
+        rects.append(self._draw_version(surface, font))
+        return rects
+
+    def _draw_menu_items(self, surface):
+        """Renders the menu items with the selected one highlighted."""
+        rects = []
+        for i, item in enumerate(self.menu_items):
+            color = config.WHITE if i != self.selected_index else config.ORANGE  # Highlight selected option
+            rects.append(self._draw_text(surface, item, config.WIDTH // 2 - 120, config.HEIGHT // 2 + i * 50, color, self.menu_font))
+        return rects
 
-    def _draw_version(self):
+    def _draw_version(self, surface, font):
         """Displays the game version in the bottom right corner."""
-        version_text = self.font.render(config.VERSION, True, config.DIM_GRAY)
+        version_text = font.render(config.VERSION, True, config.DIM_GRAY)
         version_rect = version_text.get_rect(bottomright=(config.WIDTH - 10, config.HEIGHT - 10))
-        self.screen.blit(version_text, version_rect)
+        return surface.blit(version_text, version_rect)
 
-    def _draw_studio_branding(self):
+    def _draw_studio_branding(self, surface, font):
         """Displays 'Greening Studio' in the bottom left corner."""
-        studio_text = self.font.render("GREENING STUDIO", True, config.GREEN)
+        studio_text = font.render("GREENING STUDIO", True, config.GREEN)
         studio_rect = studio_text.get_rect(bottomleft=(10, config.HEIGHT - 10))
-        self.screen.blit(studio_text, studio_rect)
+        return surface.blit(studio_text, studio_rect)
 
-    def _draw_text(self, text, x, y, color=config.WHITE, font=None):
+    def _draw_text(self, surface, text, x, y, color=config.WHITE, font=None):
         """Helper function to render sharp, readable text."""
         if font is None:
             font = self.font  # Default to main font
         rendered_text = font.render(text, True, color)
-        self.screen.blit(rendered_text, (x, y))
+        return surface.blit(rendered_text, (x, y))
 
     def _handle_events(self):
         """Handles user input for menu navigation."""
         for event in pygame.event.get():
+            self.pacer.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
@@ -15,7 +15,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     package_data={
-        "planetoids.core": ["version.txt"],  # 👈 Make sure version.txt is here
+        "planetoids.core": ["version.txt", "spawn_weights.json"],  # 👈 Make sure version.txt is here
     },
     install_requires=[
         "pygame",
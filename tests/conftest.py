@@ -0,0 +1,30 @@
+import os
+
+# Run pygame headlessly so the suite works without a display or sound card
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+import pygame
+
+from planetoids.core.config import config
+from planetoids.core.game_state import GameState
+from planetoids.core.settings import Settings
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    """Fixture to keep tests away from the player's real settings and leaderboard."""
+    monkeypatch.setattr(Settings, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(Settings, "CONFIG_PATH", str(tmp_path / "settings.json"))
+    return tmp_path
+
+@pytest.fixture
+def screen():
+    """Fixture to open a headless display the size of the game."""
+    pygame.init()
+    return pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+
+@pytest.fixture
+def game_state(screen):
+    """Fixture to create a fresh GameState on a headless display."""
+    return GameState(screen, Settings(), pygame.time.Clock())
@@ -0,0 +1,81 @@
+import itertools
+import math
+import random
+import time
+
+import pytest
+
+from planetoids.core.config import config
+from planetoids.core.sweep_and_prune import SweepAndPrune
+from planetoids.entities.asteroid import Asteroid
+
+class _Box:
+    def __init__(self, x, y, size):
+        self.x, self.y, self.size = x, y, size
+
+def _boxes_overlap(a, b):
+    return abs(a.x - b.x) <= a.size + b.size and abs(a.y - b.y) <= a.size + b.size
+
+def _dense_field(game_state, count, seed=0):
+    """Stage 1 and 2 asteroids packed onto one screen."""
+    rng = random.Random(seed)
+    return [
+        Asteroid(
+            game_state, rng.uniform(0, config.WIDTH), rng.uniform(0, config.HEIGHT),
+            size=rng.choice([15, 30]), stage=1
+        )
+        for _ in range(count)
+    ]
+
+def test_sweep_and_prune_matches_brute_force():
+    """The sweep should report exactly the overlapping pairs, frame after frame."""
+    rng = random.Random(1)
+    entities = [
+        _Box(rng.uniform(0, 800), rng.uniform(0, 600), rng.uniform(5, 40))
+        for _ in range(150)
+    ]
+    broadphase = SweepAndPrune()
+    for _ in range(5):
+        for entity in entities:
+            entity.x += rng.uniform(-5, 5)
+            entity.y += rng.uniform(-5, 5)
+        broadphase.update(entities)
+        found = {frozenset((id(a), id(b))) for a, b in broadphase.pairs()}
+        expected = {
+            frozenset((id(a), id(b)))
+            for a, b in itertools.combinations(entities, 2) if _boxes_overlap(a, b)
+        }
+        assert found == expected
+
+def test_bounce_conserves_momentum(game_state):
+    """Elastic response should conserve momentum with mass proportional to size."""
+    heavy = Asteroid(game_state, 300, 300, size=60, stage=1)
+    light = Asteroid(game_state, 380, 300, size=30, stage=1)
+    heavy.angle, heavy.base_speed = 0, 3
+    light.angle, light.base_speed = 180, 2
+
+    def total(axis):
+        trig = math.cos if axis == "x" else math.sin
+        return sum(a.size * a.base_speed * trig(math.radians(a.angle)) for a in (heavy, light))
+
+    before = (total("x"), total("y"))
+    game_state._bounce_asteroids(heavy, light)
+    assert (total("x"), total("y")) == pytest.approx(before)
+    assert light.base_speed > 2  # The light asteroid is knocked back
+    assert (light.x - heavy.x) >= heavy.size + light.size - 1e-6
+
+def test_dense_field_holds_60_fps(game_state):
+    """500 colliding asteroids should update well within a 60 FPS frame budget."""
+    game_state.settings.set("asteroid_collisions", True)
+    game_state.asteroids = _dense_field(game_state, 500)
+    game_state.update_dt(1 / 60)
+
+    frames = 60
+    start = time.perf_counter()
+    for _ in range(frames):
+        for asteroid in game_state.asteroids:
+            asteroid.update()
+        game_state._handle_asteroid_asteroid_collision()
+    frame_time = (time.perf_counter() - start) / frames
+
+    assert frame_time < 1 / 60
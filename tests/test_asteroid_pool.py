@@ -0,0 +1,75 @@
+from planetoids.entities.asteroid import Asteroid, ExplodingAsteroid, ShieldAsteroid
+from planetoids.entities.asteroid_pool import AsteroidPool
+from planetoids.entities.shape_templates import ShapeTemplateBank
+
+def test_released_asteroids_are_reused(game_state):
+    """Acquiring after a release should hand back the same object, reset."""
+    pool = AsteroidPool()
+    shielded = pool.acquire(ShieldAsteroid, game_state, 100, 100, size=40, stage=2)
+    shielded.current_shield = 0
+    pool.release(shielded)
+
+    reused = pool.acquire(ShieldAsteroid, game_state, 300, 200, size=20, stage=1)
+    assert reused is shielded
+    assert (reused.x, reused.y, reused.size, reused.stage) == (300, 200, 20, 1)
+    assert reused.current_shield == ShieldAsteroid.shield_strength
+    assert pool.free_count() == 0
+
+def test_reset_clears_explosion_state(game_state):
+    """A pooled exploding asteroid must come back ready to explode again."""
+    pool = AsteroidPool()
+    asteroid = pool.acquire(ExplodingAsteroid, game_state, 100, 100)
+    asteroid.explode(game_state.asteroid_index)
+    game_state.timers.advance(1)  # Let the explosion run out
+    assert asteroid.explosion_timer == 0
+    pool.release(asteroid)
+
+    reused = pool.acquire(ExplodingAsteroid, game_state)
+    assert reused is asteroid
+    assert not reused.exploding
+    assert reused.explosion_timer == 40
+    assert reused.size == 80  # Class default size when none is given
+
+def test_split_draws_from_the_game_pool(game_state, monkeypatch):
+    """Splitting should recycle destroyed asteroids instead of constructing new ones."""
+    spare = [Asteroid(game_state, size=60, stage=2) for _ in range(2)]
+    monkeypatch.setattr(Asteroid, "asteroid_types", [Asteroid])  # Keep the types predictable
+    game_state.asteroid_pool.release_all(spare)
+
+    parent = Asteroid(game_state, 400, 300, size=120, stage=3)
+    children = parent.split()
+
+    assert {id(child) for child in children} == {id(a) for a in spare}
+    assert all(child.size == 60 and child.stage == 2 for child in children)
+
+def test_templates_are_shared_and_read_only():
+    """Templates should be generated once per variant and shared between asteroids."""
+    bank = ShapeTemplateBank(variants=2)
+    bank.prepare([40])
+    assert len(bank) == 2 * len(ShapeTemplateBank.SIDES)
+
+    template = bank.get(40, 9)
+    assert bank.by_id(template.template_id) is template
+    assert isinstance(template.offsets, tuple)
+    assert len(template.offsets) == 9
+    assert len(bank) == 2 * len(ShapeTemplateBank.SIDES)  # No new generation
+
+def test_shape_is_built_lazily_in_a_reused_buffer(game_state):
+    """Moving an asteroid must not touch its outline until something reads it."""
+    asteroid = Asteroid(game_state, 100, 100, size=40)
+    first = asteroid.shape
+    buffer = asteroid._shape_buffer
+    assert asteroid.shape is first
+    assert [tuple(point) for point in first] == [
+        (100 + ox, 100 + oy) for ox, oy in asteroid.template.offsets
+    ]
+
+    asteroid.update()
+    assert buffer._x == 100 and buffer._y == 100  # Not rebuilt by update()
+
+    moved = asteroid.shape
+    assert moved is first  # Same lists, refilled in place
+    assert tuple(moved[0]) == (
+        asteroid.x + asteroid.template.offsets[0][0],
+        asteroid.y + asteroid.template.offsets[0][1],
+    )
@@ -0,0 +1,63 @@
+import math
+
+from planetoids.entities.asteroid import Asteroid, FastAsteroid, SpinningAsteroid
+from planetoids.entities.asteroid_pool import AsteroidPool
+
+def test_outline_is_rasterised_once_and_shared(game_state):
+    """Asteroids with the same template and colour share one surface."""
+    first = Asteroid(game_state, 100, 100, size=40)
+    second = Asteroid(game_state, 300, 300, size=40)
+    second.release_sprite()
+    second.template = first.template
+    second.sprite_key = game_state.asteroid_sprites.acquire(first.template, Asteroid.color)
+
+    assert second.sprite_key == first.sprite_key
+    assert game_state.asteroid_sprites.get(first.sprite_key)[0] is \
+        game_state.asteroid_sprites.get(second.sprite_key)[0]
+
+def test_colour_is_part_of_the_key(game_state):
+    white = Asteroid(game_state, 100, 100, size=40)
+    green = FastAsteroid(game_state, 100, 100, size=40)
+    assert white.sprite_key[1] != green.sprite_key[1]
+
+def test_sprites_are_evicted_when_asteroids_die(game_state):
+    """Releasing the last asteroid using an outline drops its surfaces."""
+    sprites = game_state.asteroid_sprites
+    pool = AsteroidPool()
+    asteroid = pool.acquire(Asteroid, game_state, 100, 100, size=40)
+    key = asteroid.sprite_key
+    sprites.get(key)
+    assert sprites.refcount(key) == 1
+
+    pool.release(asteroid)
+    assert sprites.refcount(key) == 0
+    assert asteroid.sprite_key is None
+
+    reused = pool.acquire(Asteroid, game_state, 200, 200, size=40)
+    assert sprites.refcount(reused.sprite_key) == 1
+
+def test_sprite_covers_the_outline(game_state):
+    """Every outline vertex should land on drawn pixels of the sprite."""
+    asteroid = Asteroid(game_state, 100, 100, size=40)
+    sprite, half = game_state.asteroid_sprites.get(asteroid.sprite_key)
+    for ox, oy in asteroid.template.offsets:
+        assert sprite.get_at((int(half + ox), int(half + oy))).a > 0
+
+def test_spinning_collision_follows_the_drawn_frame(game_state):
+    """A point on the rotated outline's inside must hit, whichever frame is shown."""
+    asteroid = SpinningAsteroid(game_state, 400, 300, size=120)
+    for rotation in (0, 45, 133, 270):
+        asteroid.rotation = rotation
+        angle = asteroid.frame_angle
+        # Nudge a vertex inwards, then rotate it into world space
+        ox, oy = asteroid.template.offsets[0]
+        ox, oy = ox * 0.9, oy * 0.9
+        world_x = ox * math.cos(angle) - oy * math.sin(angle)
+        world_y = ox * math.sin(angle) + oy * math.cos(angle)
+        assert asteroid.collision_shape.contains_point(*asteroid.to_local(world_x, world_y))
+        assert tuple(asteroid.shape[0]) == (
+            asteroid.x + asteroid.template.offsets[0][0] * math.cos(angle)
+            - asteroid.template.offsets[0][1] * math.sin(angle),
+            asteroid.y + asteroid.template.offsets[0][0] * math.sin(angle)
+            + asteroid.template.offsets[0][1] * math.cos(angle),
+        )
@@ -0,0 +1,99 @@
+import math
+import random
+
+import pytest
+
+from planetoids.core.collision_shape import CollisionShape
+from planetoids.core.config import config
+from planetoids.entities.asteroid import Asteroid
+from planetoids.entities.bullet import Bullet
+
+def _overlapping_field(game_state):
+    """One bullet sitting inside two overlapping asteroids."""
+    near = Asteroid(game_state, 400, 300, size=60, stage=1)
+    far = Asteroid(game_state, 440, 300, size=60, stage=1)
+    bullet = Bullet(game_state, 410, 300, 0)
+    return bullet, near, far
+
+def test_bullet_only_hits_one_asteroid_per_frame(game_state):
+    """A non-piercing bullet overlapping two asteroids should destroy only the closer one."""
+    bullet, near, far = _overlapping_field(game_state)
+    game_state.asteroids = [far, near]
+    game_state.bullets = [bullet]
+
+    game_state.check_for_collisions()
+
+    assert game_state.asteroids == [far]
+    assert game_state.bullets == []
+    assert game_state.asteroids_destroyed == 1
+    assert len(game_state.score_popups) == 1
+
+def test_collision_outcome_is_independent_of_list_order(game_state):
+    """Shuffling the entity lists should not change which asteroids survive."""
+    outcomes = set()
+    for seed in range(4):
+        bullet, near, far = _overlapping_field(game_state)
+        asteroids = [near, far]
+        random.Random(seed).shuffle(asteroids)
+        game_state.asteroids = asteroids
+        game_state.bullets = [bullet]
+        game_state.check_for_collisions()
+        outcomes.add(tuple((a.x, a.y) for a in game_state.asteroids))
+    assert outcomes == {((440, 300),)}
+
+def test_collision_shape_circle_tests():
+    """Circle tests should follow the outline, not the bounding circle."""
+    # A square with a deep notch cut into its right-hand side
+    notched = CollisionShape([(-50, -50), (50, -50), (50, -10), (0, 0), (50, 10), (50, 50), (-50, 50)])
+
+    assert notched.bounding_radius == pytest.approx(math.hypot(50, 50))
+    assert notched.intersects_circle(-40, 0, 2)  # Inside the solid part
+    assert not notched.intersects_circle(40, 0, 2)  # Inside the notch: a visible miss
+    assert notched.intersects_circle(40, 0, 10)  # Big enough to touch the notch edges
+    assert not notched.intersects_circle(70, 70, 5)  # Inside the bounding circle only
+
+def test_collision_shape_polygon_tests():
+    """Polygon tests should detect overlap, containment and separation."""
+    square = CollisionShape([(-20, -20), (20, -20), (20, 20), (-20, 20)])
+
+    assert square.intersects_polygon([(15, 0), (40, 10), (40, -10)])  # Tip pokes in
+    assert square.intersects_polygon([(-5, -5), (5, -5), (0, 5)])  # Fully inside
+    assert square.intersects_polygon([(-40, -40), (40, -40), (0, 60)])  # Fully surrounds
+    assert not square.intersects_polygon([(25, 0), (40, 10), (40, -10)])
+
+def test_player_hull_uses_exact_outline(game_state):
+    """The ship should survive flying past an asteroid's bounding circle."""
+    asteroid = Asteroid(game_state, 400, 300, size=40, stage=1)
+    asteroid.collision_shape = CollisionShape([(-40, -5), (40, -5), (40, 5), (-40, 5)])
+    game_state.player.x, game_state.player.y, game_state.player.angle = 400, 335, 0
+
+    assert not game_state._is_player_asteroid_collision(asteroid)
+
+    game_state.player.y = 310
+    assert game_state._is_player_asteroid_collision(asteroid)
+
+def test_fast_bullet_does_not_tunnel_through_small_asteroid(game_state):
+    """A frame-time spike should not carry a bullet straight through an asteroid."""
+    asteroid = Asteroid(game_state, 500, 300, size=15, stage=1)
+    bullet = Bullet(game_state, 450, 300, 0)
+    game_state.asteroids = [asteroid]
+    game_state.bullets = [bullet]
+
+    game_state.update_dt(0.1)  # 90px step, well past the asteroid
+    bullet.update()
+    assert bullet.x > 500 + 30
+
+    game_state.check_for_collisions()
+    assert game_state.asteroids == []
+
+def test_swept_bullet_collision_wraps_around_screen(game_state):
+    """A bullet crossing the right edge should hit an asteroid just past the left edge."""
+    asteroid = Asteroid(game_state, 20, 300, size=15, stage=1)
+    bullet = Bullet(game_state, config.WIDTH - 30, 300, 0)
+    game_state.asteroids = [asteroid]
+    game_state.bullets = [bullet]
+
+    game_state.update_dt(0.1)
+    bullet.update()
+    game_state.check_for_collisions()
+    assert game_state.asteroids == []
@@ -0,0 +1,50 @@
+import pygame
+
+from planetoids.core.compositor import Compositor
+
+def test_hud_only_redraws_when_its_inputs_change(game_state):
+    screen = pygame.display.get_surface()
+    hud = game_state.compositor.layers["hud"]
+    background = game_state.compositor.layers["background"]
+
+    for _ in range(5):
+        game_state.draw_all(screen)
+    assert hud.redraws == 1
+    assert background.redraws == 1
+
+    game_state.score.score += 100
+    game_state.draw_all(screen)
+    assert hud.redraws == 2
+
+    game_state.life.decrement()
+    game_state.draw_all(screen)
+    game_state.draw_all(screen)
+    assert hud.redraws == 3
+
+def test_hud_is_visible_over_the_world(game_state):
+    """Retained layers are keyed on black, so only their drawn pixels cover the world."""
+    screen = pygame.display.get_surface()
+    game_state.draw_all(screen)
+    # The shield bar border sits in the top-left corner
+    assert screen.get_at((9, 39))[:3] == (200, 200, 200)
+    # Far from any HUD element the frame stays black
+    assert screen.get_at((5, screen.get_height() // 2))[:3] == (0, 0, 0)
+
+def test_overlay_hides_once_the_controls_timer_runs_out(game_state):
+    screen = pygame.display.get_surface()
+    overlay = game_state.compositor.layers["overlay"]
+    game_state.draw_all(screen)
+    assert overlay.redraws == 1
+
+    game_state.timers.advance(game_state.CONTROLS_DURATION)
+    game_state.draw_all(screen)
+    game_state.draw_all(screen)
+    assert overlay.redraws == 1
+
+def test_layers_compose_in_fixed_order():
+    calls = []
+    compositor = Compositor()
+    for name in reversed(Compositor.LAYER_ORDER):
+        compositor.set_layer(name, lambda screen, name=name: calls.append(name))
+    compositor.compose(pygame.Surface((10, 10)))
+    assert tuple(calls) == Compositor.LAYER_ORDER
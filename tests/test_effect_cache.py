@@ -0,0 +1,38 @@
+import pygame
+
+from planetoids.effects.effect_cache import EffectCache, GLOW_PHASES, GLOW_VARIANTS
+from planetoids.entities.asteroid import ShieldAsteroid
+from planetoids.entities.powerups import TrishotPowerUp
+
+def test_frames_are_rendered_once_per_key(screen):
+    cache = EffectCache()
+    first = cache.get("ring", (0, 255, 220), 92, 200)
+    assert cache.get("ring", (0, 255, 220), 92, 200) is first
+    assert cache.get("ring", (0, 255, 220), 92, 100) is not first
+    assert cache.renders == 2
+
+def test_glow_frames_are_bounded(screen, game_state, monkeypatch):
+    """However long a power-up is on screen, its glow needs a fixed set of frames."""
+    cache = EffectCache()
+    monkeypatch.setattr("planetoids.entities.powerups.effect_cache", cache)
+    powerup = TrishotPowerUp(game_state, 200, 200)
+    for tick in range(0, 20000, 7):
+        monkeypatch.setattr(pygame.time, "get_ticks", lambda tick=tick: tick)
+        powerup._draw_glow(screen)
+    assert cache.renders <= GLOW_PHASES * GLOW_VARIANTS
+
+def test_shield_ring_does_not_allocate_during_play(screen, game_state, monkeypatch):
+    asteroid = ShieldAsteroid(game_state, 300, 300, size=80)
+    asteroid.draw(screen)  # Warm the cache
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Surface allocated while drawing")
+    monkeypatch.setattr(pygame, "Surface", fail)
+    asteroid.draw(screen)
+
+def test_tint_surface_is_reused_with_new_alpha(screen):
+    cache = EffectCache()
+    tint = cache.tint(screen.get_size(), (0, 150, 255), 70)
+    again = cache.tint(screen.get_size(), (0, 150, 255), 20)
+    assert again is tint
+    assert again.get_alpha() == 20
@@ -0,0 +1,58 @@
+from planetoids.effects.explosion_sheets import ExplosionBank
+from planetoids.entities.asteroid import ExplodingAsteroid
+
+def test_sheets_are_baked_once_and_cropped(screen):
+    bank = ExplosionBank(variants=2)
+    sheet = bank.get("asteroid", 200)
+    assert bank.get("asteroid", 200) in bank._sheets[("asteroid", 200)]
+    assert len(bank._sheets[("asteroid", 200)]) == 2
+
+    # Particles live 15 to 30 frames, so the cloud is gone well before 40
+    assert 0 < len(sheet) <= 31
+    first, _ = sheet.frames[0]
+    last, _ = sheet.frames[-1]
+    assert first.get_width() < 40 and last.get_width() < 200
+
+def test_clip_radius_bounds_every_frame(screen):
+    sheet = ExplosionBank(variants=1).get("asteroid", 20)
+    for frame in range(len(sheet)):
+        rect = sheet.frame_rect(0, 0, frame)
+        if rect.width == 0:
+            continue  # Nothing left inside the radius
+        assert rect.left >= -20 - 8 and rect.right <= 20 + 8
+    assert sheet.frame_rect(0, 0, len(sheet)) is None
+
+def test_exploding_asteroid_plays_a_baked_cloud(screen, game_state):
+    asteroid = ExplodingAsteroid(game_state, 400, 300, size=40)
+    asteroid.explode(game_state.asteroid_index)
+    assert asteroid.explosion_sheet is not None
+    assert asteroid.explosion_particles == []
+
+    game_state.dt = 1 / 60
+    while asteroid.exploding:
+        asteroid.update_explosion()
+        asteroid.draw(screen)
+    assert asteroid.explosion_frame == asteroid.explosion_duration
+
+def test_live_particles_are_still_available(screen, game_state, monkeypatch):
+    monkeypatch.setattr(ExplodingAsteroid, "live_particles", True)
+    asteroid = ExplodingAsteroid(game_state, 400, 300, size=40)
+    asteroid.explode(game_state.asteroid_index)
+    assert asteroid.explosion_sheet is None
+    assert len(asteroid.explosion_particles) == 40
+    asteroid.draw(screen)
+
+def test_player_explosion_uses_a_sheet(screen, game_state):
+    player = game_state.player
+    player.generate_explosion()
+    assert player.explosion_sheet is not None and player.explosion_particles == []
+
+    game_state.dt = 1 / 60
+    screen.fill((0, 0, 0))
+    player.draw_explosion(screen)
+    assert screen.get_at((int(player.x) + 2, int(player.y) + 2))[:3] != (0, 0, 0)
+    while player.explosion_timer > 0:
+        game_state.timers.advance(game_state.dt)
+        player.update_explosion()
+        player.draw_explosion(screen)
+    assert player.explosion_sheet is None
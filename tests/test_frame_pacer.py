@@ -0,0 +1,64 @@
+import pygame
+
+from planetoids.core.frame_pacer import FramePacer
+
+class FakeClock:
+    """Records the requested rates and pretends each frame took its full slot."""
+
+    def __init__(self):
+        self.rates = []
+
+    def tick(self, fps=0):
+        self.rates.append(fps)
+        return 1000 // fps if fps else 0
+
+def test_drops_to_idle_rate_and_wakes_on_input():
+    clock = FakeClock()
+    pacer = FramePacer(clock, active_fps=60, idle_fps=15, idle_after_ms=1000)
+    for _ in range(70):
+        pacer.tick()
+    assert clock.rates[0] == 60
+    assert clock.rates[-1] == 15
+    assert pacer.idle
+
+    pacer.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+    pacer.tick()
+    assert clock.rates[-1] == 60
+
+def test_busy_frames_never_idle():
+    clock = FakeClock()
+    pacer = FramePacer(clock, idle_after_ms=100)
+    for _ in range(50):
+        pacer.tick(busy=True)
+    assert set(clock.rates) == {pacer.active_fps}
+
+def test_losing_focus_throttles_until_it_returns():
+    clock = FakeClock()
+    pacer = FramePacer(clock, background_fps=2)
+
+    assert pacer.handle_event(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    assert not pacer.handle_event(pygame.event.Event(pygame.WINDOWMINIMIZED))  # Already unfocused
+    pacer.tick(busy=True)
+    assert clock.rates[-1] == 2
+
+    assert pacer.handle_event(pygame.event.Event(pygame.ACTIVEEVENT, gain=1, state=pygame.APPINPUTFOCUS))
+    pacer.tick()
+    assert clock.rates[-1] == pacer.active_fps
+
+def test_mouse_leaving_the_window_is_not_a_focus_change():
+    pacer = FramePacer(FakeClock())
+    assert not pacer.handle_event(pygame.event.Event(pygame.ACTIVEEVENT, gain=0, state=pygame.APPMOUSEFOCUS))
+    assert pacer.focused
+
+def test_pause_menu_draws_over_a_frozen_snapshot(game_state, screen):
+    screen.fill((200, 0, 0))
+    pause_menu = game_state.pause_menu
+    pause_menu._take_snapshot()
+
+    assert pause_menu._draw_pause_menu()
+    assert not pause_menu._draw_pause_menu()  # Nothing changed, nothing redrawn
+    red = screen.get_at((5, 5))[0]
+    assert 0 < red < 200  # The paused game shows through, dimmed
+
+    pause_menu.selected_index = 2
+    assert pause_menu._draw_pause_menu()
@@ -0,0 +1,73 @@
+import datetime
+import json
+import time
+
+import pytest
+
+from planetoids.core.leaderboard import Leaderboard, Run
+
+@pytest.fixture
+def leaderboard(config_dir):
+    leaderboard = Leaderboard()
+    yield leaderboard
+    leaderboard.close()
+
+def test_top_scores_come_back_best_first(leaderboard):
+    for score in (300, 1200, 50, 800):
+        leaderboard.record(Run(score, shots_fired=10, shots_hit=4))
+    leaderboard.flush()
+
+    assert [run.score for run in leaderboard.top(3)] == [1200, 800, 300]
+    assert leaderboard.top(1)[0].accuracy == pytest.approx(40.0)
+    assert [run.score for run in leaderboard.history(2)] == [800, 50]
+    assert leaderboard.rank(1000) == 2
+
+def test_top_for_day_only_includes_that_day(leaderboard):
+    leaderboard.record(Run(500, played_at="2024-01-01T10:00:00"))
+    leaderboard.record(Run(900, played_at="2024-01-02T10:00:00"))
+    leaderboard.record(Run(700, played_at="2024-01-02T11:00:00"))
+    leaderboard.flush()
+
+    day = leaderboard.top_for_day(datetime.date(2024, 1, 2))
+    assert [run.score for run in day] == [900, 700]
+
+def test_recording_does_not_wait_for_the_disk(leaderboard):
+    start = time.perf_counter()
+    for score in range(200):
+        leaderboard.record(Run(score))
+    assert time.perf_counter() - start < 0.05
+    assert leaderboard.best_score() == 199  # Known before the writer catches up
+
+    leaderboard.flush()
+    assert len(leaderboard.history(500)) == 200
+
+def test_queries_use_the_indexes(leaderboard):
+    plan = " ".join(
+        row[-1] for row in leaderboard._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT score FROM runs WHERE day = ? ORDER BY score DESC", ("2024-01-01",)
+        )
+    )
+    assert "runs_by_day" in plan
+
+def test_old_high_score_is_migrated_once(config_dir):
+    (config_dir / "high_score.json").write_text(json.dumps({"high_score": 4200}))
+    leaderboard = Leaderboard()
+    assert leaderboard.best_score() == 4200
+    assert [run.score for run in leaderboard.top()] == [4200]
+    leaderboard.close()
+
+    leaderboard = Leaderboard()
+    assert len(leaderboard.top()) == 1  # Not migrated again
+    leaderboard.close()
+
+def test_finished_game_is_recorded(game_state):
+    game_state.score.score = 2500
+    game_state.shots_fired = 20
+    game_state.shots_hit = 5
+    run = game_state.record_run()
+    game_state.leaderboard.flush()
+
+    assert run.accuracy == pytest.approx(25.0)
+    assert game_state.leaderboard.top(1)[0].score == 2500
+    game_state.reset()
+    assert game_state.score.high_score == 2500
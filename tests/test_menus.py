@@ -0,0 +1,62 @@
+import pygame
+import pytest
+
+from planetoids.core.settings import Settings
+from planetoids.ui import start_menu
+from planetoids.ui.options_menu import OptionsMenu
+from planetoids.ui.pause_menu import PauseMenu
+
+@pytest.fixture
+def menu(screen, monkeypatch):
+    monkeypatch.setattr(start_menu, "check_for_update", lambda version, callback: None)
+    return start_menu.StartMenu(screen, pygame.time.Clock(), Settings())
+
+def test_start_menu_renders_static_text_once(menu):
+    for _ in range(10):
+        menu._draw_main_menu()
+    assert menu.title_layer.redraws == 1
+    assert menu.items_layer.redraws == 1
+
+    menu.selected_index = 1
+    menu._draw_main_menu()
+    assert menu.title_layer.redraws == 1
+    assert menu.items_layer.redraws == 2
+
+    menu.latest_version = "9.9.9"
+    menu._draw_main_menu()
+    assert menu.title_layer.redraws == 2
+
+def test_selection_highlight_reaches_the_screen(menu, screen):
+    screen.fill((0, 0, 0))
+    menu.selected_index = 2
+    menu._draw_main_menu()
+    quit_rect = menu.items_layer.rects[2]
+    colours = {
+        tuple(screen.get_at((x, y)))[:3]
+        for x in range(quit_rect.left, quit_rect.right, 2)
+        for y in range(quit_rect.top, quit_rect.bottom, 2)
+    }
+    assert (255, 100, 0) in colours  # Orange highlight
+
+def test_options_menu_redraws_when_a_setting_changes(screen):
+    settings = Settings()
+    font = pygame.font.Font(settings.FONT_PATH, 36)
+    options = OptionsMenu(screen, settings, font, font, font)
+    options._draw_options_menu()
+    options._draw_options_menu()
+    assert options.view.redraws == 1
+
+    settings.toggle("crt_enabled")
+    try:
+        options._draw_options_menu()
+    finally:
+        settings.toggle("crt_enabled")
+    assert options.view.redraws == 2
+
+def test_pause_menu_only_redraws_on_navigation(game_state):
+    pause_menu = PauseMenu(game_state.screen, game_state)
+    for _ in range(5):
+        pause_menu._draw_pause_menu()
+    pause_menu.selected_index = 1
+    pause_menu._draw_pause_menu()
+    assert pause_menu.view.redraws == 2
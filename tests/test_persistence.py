@@ -0,0 +1,59 @@
+import json
+import os
+import time
+
+import pytest
+
+from planetoids.core import persistence
+from planetoids.core.persistence import WriteBehindStore, write_json_atomic
+from planetoids.core.settings import Settings
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+def test_changes_are_coalesced_into_one_write(tmp_path):
+    store = WriteBehindStore(str(tmp_path / "data.json"), debounce=0.05)
+    for i in range(20):
+        store.schedule({"value": i})
+
+    _wait_for(lambda: store.flush_times)
+    time.sleep(0.1)
+    assert not store.pending
+    assert len(store.flush_times) == 1
+    assert json.loads((tmp_path / "data.json").read_text()) == {"value": 19}
+
+def test_flush_writes_immediately(tmp_path):
+    store = WriteBehindStore(str(tmp_path / "data.json"), debounce=60)
+    store.schedule({"value": 1})
+    assert store.flush()
+    assert not store.flush()  # Nothing left to write
+    assert json.loads((tmp_path / "data.json").read_text()) == {"value": 1}
+
+def test_failed_write_leaves_the_old_file_intact(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    write_json_atomic(str(path), {"value": "old"})
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("power cut")
+    monkeypatch.setattr(persistence.json, "dump", crash)
+
+    with pytest.raises(RuntimeError):
+        write_json_atomic(str(path), {"value": "new"})
+    assert json.loads(path.read_text()) == {"value": "old"}
+    assert os.listdir(tmp_path) == ["data.json"]  # No temporary files left behind
+
+def test_settings_toggles_do_not_wait_on_the_disk(config_dir):
+    settings = Settings()
+    start = time.perf_counter()
+    for _ in range(100):
+        settings.toggle("crt_enabled")
+    assert time.perf_counter() - start < 0.05
+    assert not (config_dir / "settings.json").exists()  # Still debouncing
+
+    settings.toggle("crt_enabled")
+    settings.flush()
+    assert json.loads((config_dir / "settings.json").read_text())["crt_enabled"] is True
+    assert Settings().get("crt_enabled") is True
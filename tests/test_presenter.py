@@ -0,0 +1,63 @@
+import pygame
+
+from planetoids.core.presenter import DirtyRectPresenter
+
+def test_partial_updates_cover_last_and_current_rects(screen, monkeypatch):
+    updates = []
+    monkeypatch.setattr(pygame.display, "update", lambda rects: updates.append(list(rects)))
+    presenter = DirtyRectPresenter()
+
+    presenter.present([pygame.Rect(10, 10, 20, 20)])
+    assert presenter.full_flips == 1  # First frame is always whole
+
+    presenter.present([pygame.Rect(40, 10, 20, 20)])
+    assert presenter.partial_updates == 1
+    assert updates[-1] == [pygame.Rect(10, 10, 20, 20), pygame.Rect(40, 10, 20, 20)]
+
+def test_falls_back_to_flip_when_too_much_changes(screen, monkeypatch):
+    monkeypatch.setattr(pygame.display, "update", lambda rects: None)
+    presenter = DirtyRectPresenter(max_coverage=0.35)
+    width, height = screen.get_size()
+    presenter.present([])
+
+    presenter.present([pygame.Rect(0, 0, width, height // 2)])
+    assert presenter.full_flips == 2
+
+    presenter.present(None)  # Unknown changes
+    presenter.present([pygame.Rect(0, 0, 10, 10)])  # Must erase the unknown frame too
+    assert presenter.full_flips == 4
+
+    presenter.present([pygame.Rect(0, 0, 10, 10)], full=True)
+    assert presenter.full_flips == 5
+    assert presenter.partial_updates == 0
+
+def test_reported_rects_cover_every_changed_pixel(screen, game_state):
+    """Pixels that differ between two frames must lie inside the rects presented."""
+    game_state.spawn_asteroids(8)
+    game_state.bullets.extend(game_state.player.shoot())
+    game_state.timers.advance(game_state.CONTROLS_DURATION)
+    keys = pygame.key.get_pressed()
+
+    for _ in range(3):
+        game_state.update_all(keys, 1 / 60)
+        game_state.draw_all(screen)
+    previous_frame = screen.copy()
+    previous_rects = game_state._frame_rects
+
+    game_state.score.score += 500  # Force a HUD change as well
+    game_state.update_all(keys, 1 / 60)
+    game_state.draw_all(screen)
+
+    diff = screen.copy()
+    diff.blit(previous_frame, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    reverse = previous_frame.copy()
+    reverse.blit(screen, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    diff.blit(reverse, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    diff.set_colorkey((0, 0, 0))
+    changed = pygame.mask.from_surface(diff)
+    assert changed.count() > 0
+
+    uncovered = pygame.mask.Mask(screen.get_size(), fill=True)
+    for rect in previous_rects + game_state._frame_rects:
+        uncovered.erase(pygame.mask.Mask(rect.size, fill=True), rect.topleft)
+    assert changed.overlap_area(uncovered, (0, 0)) == 0
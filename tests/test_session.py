@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from planetoids.core.session import Session
+from planetoids.core.settings import Settings
+from planetoids.ui import start_menu
+
+@pytest.fixture
+def session(screen, monkeypatch):
+    monkeypatch.setattr(start_menu, "check_for_update", lambda version, callback: None)
+    session = Session(Settings())
+    session.screen = screen  # Already opened by the fixture
+    return session
+
+def test_games_share_one_game_state(session):
+    first = session.new_game()
+    pause_menu = first.pause_menu
+    first.life.lives = 0
+    first.score.score = 1234
+    first.shots_fired = 50
+
+    second = session.new_game()
+    assert second is first
+    assert second.pause_menu is pause_menu
+    assert second.life.lives == 3
+    assert second.score.score == 0
+    assert second.shots_fired == 0
+    assert len(second.asteroids) == 10
+
+def test_reset_returns_asteroids_to_the_pool(session):
+    game_state = session.new_game()
+    asteroids = list(game_state.asteroids)
+    game_state.reset()
+    assert game_state.asteroids == []
+    assert game_state.asteroid_pool.free_count() == len(asteroids)
+
+def test_start_menu_is_built_once(session):
+    assert session.start_menu is session.start_menu
+
+def test_restart_to_first_frame_is_recorded_and_quick(session):
+    session.new_game()
+    session.frame_presented()
+    session.frame_presented()  # Only the first frame of a game is timed
+    assert len(session.restart_times) == 1
+
+    start = time.perf_counter()
+    session.new_game()
+    restart = time.perf_counter() - start
+    session.frame_presented()
+
+    assert len(session.restart_times) == 2
+    assert restart < 0.05
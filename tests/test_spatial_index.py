@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from planetoids.core.spatial_index import SpatialIndex, wrapped_delta
+from planetoids.entities.asteroid import Asteroid, ExplodingAsteroid
+
+def _point(x, y):
+    return SimpleNamespace(x=x, y=y)
+
+def test_wrapped_delta_takes_shortest_path():
+    """Offsets across a screen edge should wrap to the short way round."""
+    assert wrapped_delta(10, 100) == 10
+    assert wrapped_delta(90, 100) == -10
+    assert wrapped_delta(-90, 100) == 10
+
+def test_query_radius_matches_brute_force():
+    """Grid queries should return exactly the entities a full scan would."""
+    index = SpatialIndex(cell_size=100, width=1000, height=600)
+    points = [_point(x, y) for x in range(0, 1000, 37) for y in range(0, 600, 41)]
+    index.rebuild(points)
+
+    for cx, cy, radius in [(500, 300, 120), (5, 5, 60), (990, 590, 200), (300, 10, 700)]:
+        expected = {
+            id(p) for p in points
+            if wrapped_delta(p.x - cx, 1000) ** 2 + wrapped_delta(p.y - cy, 600) ** 2 <= radius ** 2
+        }
+        assert {id(p) for p in index.query_radius(cx, cy, radius)} == expected
+
+def test_query_radius_finds_entities_across_edges():
+    """An entity just past the right edge is close to one at the left edge."""
+    index = SpatialIndex(cell_size=100, width=1000, height=600)
+    far_right = _point(995, 300)
+    off_screen = _point(1010, 300)  # Asteroids drift slightly off-screen before wrapping
+    index.rebuild([far_right, off_screen])
+
+    assert set(map(id, index.query_radius(5, 300, 20))) == {id(far_right), id(off_screen)}
+
+def test_chained_explosions_destroy_each_asteroid_once(game_state):
+    """A blast that catches another exploding asteroid should resolve in one pass."""
+    first = ExplodingAsteroid(game_state, 200, 200, size=20, stage=1)
+    second = ExplodingAsteroid(game_state, 350, 200, size=20, stage=1)
+    bystander = Asteroid(game_state, 500, 200, size=20, stage=1)
+    out_of_range = Asteroid(game_state, 900, 600, size=20, stage=1)
+    game_state.asteroids = [first, second, bystander, out_of_range]
+    game_state.asteroid_index.rebuild(game_state.asteroids)
+
+    destroyed = set()
+    game_state._handle_asteroid_destruction(first, destroyed, [])
+
+    assert destroyed == {first, second, bystander}
+    assert first.exploding and second.exploding
+    assert game_state.asteroids_destroyed == 3  # split() counts each destruction
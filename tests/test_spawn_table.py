@@ -0,0 +1,49 @@
+from collections import Counter
+
+from planetoids.core.spawn_table import AliasTable, SpawnTable, load_spawn_curves
+from planetoids.entities.asteroid import Asteroid
+from planetoids.entities.powerups import PowerUp
+
+class _Common:
+    spawn_chance = 0.7
+
+class _Rare:
+    spawn_chance = 0.2
+
+class _Ramping:
+    spawn_chance = 0.1
+
+def test_alias_table_matches_weights():
+    table = AliasTable(["a", "b", "c"], [0.6, 0.3, 0.1])
+    counts = Counter(table.sample() for _ in range(60000))
+    assert abs(counts["a"] / 60000 - 0.6) < 0.02
+    assert abs(counts["b"] / 60000 - 0.3) < 0.02
+    assert abs(counts["c"] / 60000 - 0.1) < 0.02
+
+def test_curves_interpolate_and_clamp():
+    table = SpawnTable("test", curves={"_Ramping": [(1, 0.1), (11, 0.6)]})
+    assert table.weight_for(_Ramping, 0) == 0.1
+    assert abs(table.weight_for(_Ramping, 6) - 0.35) < 1e-9
+    assert table.weight_for(_Ramping, 40) == 0.6
+    assert table.weight_for(_Common, 6) == 0.7
+
+def test_tables_recompile_only_on_level_or_registry_change():
+    table = SpawnTable("test", curves={})
+    registry = [_Common, _Rare]
+    for _ in range(100):
+        table.sample(registry, 1)
+    assert table.compile_count == 1
+
+    table.sample(registry, 2)
+    table.sample(registry, 1)
+    assert table.compile_count == 2
+
+    registry.append(_Ramping)
+    table.sample(registry, 1)
+    assert table.compile_count == 3
+
+def test_shipped_curves_cover_registered_classes():
+    asteroid_names = {cls.__name__ for cls in Asteroid.asteroid_types}
+    assert set(load_spawn_curves("asteroids")) <= asteroid_names
+    assert Asteroid.get_asteroid_type(5) in Asteroid.asteroid_types
+    assert PowerUp.get_powerup_type(5) in PowerUp.subclasses
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+def _run(code, cwd, *flags):
+    env = dict(
+        os.environ, PYTHONPATH=str(PACKAGE_ROOT), SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+        XDG_CONFIG_HOME=str(cwd)  # Keep settings and the leaderboard out of the real config dir
+    )
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+
+def _own_import_time(stderr):
+    """Sums the self time, in seconds, of every planetoids module in -X importtime output."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if name.strip().startswith("planetoids"):
+            total += int(self_us)
+    return total / 1e6
+
+def test_importing_the_game_has_no_side_effects(tmp_path):
+    """Importing should not open a display or create files in the working directory."""
+    result = _run(
+        "import pygame, planetoids.main; print(pygame.display.get_init())",
+        tmp_path, "-X", "importtime"
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
+    assert not (tmp_path / "logs").exists()
+    assert _own_import_time(result.stderr) < 0.5
+
+def test_time_to_first_frame(tmp_path):
+    """From a cold interpreter to the first presented game frame."""
+    code = """
+import time
+start = time.perf_counter()
+import pygame
+from planetoids.core.config import config
+from planetoids.core.game_state import GameState
+from planetoids.core.settings import Settings
+pygame.init()
+config.probe_display()
+screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+game_state = GameState(screen, Settings(), pygame.time.Clock())
+game_state.spawn_asteroids(10)
+game_state.draw_all(screen)
+game_state.present()
+print(time.perf_counter() - start)
+"""
+    elapsed = float(_run(code, tmp_path).stdout.strip().splitlines()[-1])
+    assert elapsed < 3.0
@@ -0,0 +1,81 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from planetoids.core.version_checker import VersionCheckService, fetch_url, is_newer_version
+
+@pytest.fixture
+def version_server():
+    """Serves a version number locally and counts the requests made for it."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(0.05)  # Long enough for concurrent checks to overlap
+            server.requests += 1
+            body = server.version.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.version = "0.10.0\n"
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/version.txt"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_versions_compare_numerically():
+    assert is_newer_version("0.10.0", "0.9.9")
+    assert is_newer_version("1.0", "0.99.1")
+    assert not is_newer_version("0.2.1", "0.2.1")
+    assert not is_newer_version("0.2.0", "0.2.1")
+
+def test_checks_share_one_request_and_then_use_the_cache(version_server, config_dir):
+    service = VersionCheckService(url=version_server.url)
+    found = []
+    for _ in range(5):
+        service.check("0.9.0", found.append)
+    service.wait(2)
+
+    assert version_server.requests == 1
+    assert found == ["0.10.0"] * 5
+
+    # A restart within the TTL answers from the saved result, without a thread
+    restarted = VersionCheckService(url=version_server.url)
+    threads = threading.active_count()
+    restarted.check("0.9.0", found.append)
+    assert threading.active_count() == threads
+    assert version_server.requests == 1
+    assert found[-1] == "0.10.0"
+
+def test_stale_result_is_fetched_again(version_server, config_dir):
+    service = VersionCheckService(url=version_server.url, ttl=0)
+    service.check("0.10.0", lambda latest: pytest.fail("not newer"))
+    service.wait(2)
+    service.check("0.10.0", lambda latest: pytest.fail("not newer"))
+    service.wait(2)
+    assert version_server.requests == 2
+
+def test_failed_fetch_keeps_the_last_known_version(config_dir):
+    def offline(url, timeout):
+        raise OSError("no network")
+
+    service = VersionCheckService(fetch=lambda url, timeout: "1.0.0", ttl=0)
+    service.check("1.0.0", lambda latest: None)
+    service.wait(2)
+
+    found = []
+    service = VersionCheckService(fetch=offline, ttl=0)
+    service.check("0.9.0", found.append)
+    service.wait(2)
+    assert found == ["1.0.0"]
+
+def test_fetch_url_reads_the_version(version_server):
+    assert fetch_url(version_server.url, timeout=2) == "0.10.0"
@@ -0,0 +1,62 @@
+import time
+
+from planetoids.core import fonts
+from planetoids.core.config import config
+from planetoids.core.warmup import FONT_SIZES, WarmupScheduler, game_warmup
+from planetoids.effects import crt_effect
+from planetoids.effects.effect_cache import effect_cache
+
+def test_slices_stop_once_the_budget_is_spent():
+    warmup = WarmupScheduler(budget_ms=5)
+    for i in range(10):
+        warmup.add(f"sleep {i}", lambda: time.sleep(0.003))
+
+    assert not warmup.run_slice()
+    ran = len(warmup.prepared)
+    assert 1 <= ran <= 2
+    assert warmup.pending == [f"sleep {i}" for i in range(ran, 10)]
+
+def test_iterator_tasks_are_spread_over_slices():
+    steps = []
+
+    def task():
+        for i in range(3):
+            steps.append(i)
+            yield
+
+    warmup = WarmupScheduler()
+    warmup.add("steps", task)
+    warmup.add("after", lambda: steps.append("after"))
+    while not warmup.run_slice(budget_ms=0):
+        pass
+
+    assert steps == [0, 1, 2, "after"]
+    assert [name for name, _ in warmup.prepared] == ["steps", "after"]
+
+def test_report_lists_prepared_and_missing_items():
+    warmup = WarmupScheduler()
+    warmup.add("quick", lambda: None)
+    warmup.add("later", lambda: None)
+    warmup.run_slice(budget_ms=0)
+
+    report = warmup.report()
+    assert "prepared 1 items" in report
+    assert "  quick: " in report
+    assert "still missing: later" in report
+
+def test_game_warmup_fills_the_caches(screen):
+    size = (config.WIDTH, config.HEIGHT)
+    warmup = game_warmup(size)
+    warmup.finish()
+
+    assert warmup.done
+    assert "still missing: nothing" in warmup.report()
+    assert all(font_size in fonts._fonts for font_size in FONT_SIZES)
+    assert size in crt_effect._scanline_masks
+    crt_effect.apply_crt_effect(screen)  # Uses the prepared overlays
+
+    # Drawing with warmed caches renders nothing new
+    renders = effect_cache.renders
+    warmup = game_warmup(size)
+    warmup.finish()
+    assert effect_cache.renders == renders
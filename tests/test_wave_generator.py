@@ -0,0 +1,57 @@
+import pygame
+
+from planetoids.core.wave_generator import WaveGenerator
+from planetoids.entities.asteroid import Asteroid
+
+NO_KEYS = pygame.key.ScancodeWrapper([0] * 512)
+
+def test_wave_is_built_incrementally():
+    """Each step should only prepare a couple of asteroids."""
+    generator = WaveGenerator(lambda level: Asteroid, specs_per_frame=2)
+    generator.begin(3)
+
+    generator.step()
+    assert not generator.is_ready()
+
+    for _ in range(10):
+        generator.step()
+    assert generator.is_ready()
+
+    wave = generator.take(3)
+    assert len(wave) == WaveGenerator.wave_size(3)
+    assert generator.generated_on_take == 0
+
+def test_unfinished_wave_is_completed_on_take():
+    """Taking an unfinished wave still returns the full wave."""
+    generator = WaveGenerator(lambda level: Asteroid)
+    generator.begin(4)
+    generator.step()
+
+    assert len(generator.take(4)) == WaveGenerator.wave_size(4)
+    assert generator.generated_on_take == WaveGenerator.wave_size(4) - 2
+
+def test_level_transition_spawn_cost_is_bounded(game_state):
+    """Clearing the map must never spawn more than a few asteroids in one frame."""
+    game_state.level.level = 29
+    game_state.wave_generator.begin(30)
+    while not game_state.wave_generator.is_ready():
+        game_state.update_all(NO_KEYS, 1 / 60)
+
+    spawned_per_frame = []
+    acquire = game_state.asteroid_pool.acquire
+    calls = []
+    game_state.asteroid_pool.acquire = lambda *args, **kwargs: calls.append(1) or acquire(*args, **kwargs)
+
+    game_state.asteroids = []
+    game_state.check_for_clear_map()
+    assert calls == []  # The handover itself spawns nothing
+    assert game_state.wave_generator.generated_on_take == 0
+
+    while game_state.incoming_wave:
+        calls.clear()
+        game_state.update_all(NO_KEYS, 1 / 60)
+        spawned_per_frame.append(len(calls))
+
+    assert max(spawned_per_frame) <= game_state.WAVE_SPAWNS_PER_FRAME
+    assert len(game_state.asteroids) == WaveGenerator.wave_size(30)
+    assert game_state.level.get_level() == 30